@@ -19,8 +19,11 @@ from staircase.core.arrays import (
     sum,
 )
 from staircase.core.arrays.extension import StairsArray
+from staircase.core.arrays.frame import StairsFrame
+from staircase.core.layering import StairsBuilder
 from staircase.core.slicing import StairsSlicer
 from staircase.core.stats.distribution import Dist
+from staircase.core.streaming import StreamingStairs
 from staircase.test_data import make_test_data
 
 
@@ -30,15 +33,10 @@ def get_version():
 
         return version(__name__)
 
-    def get_version_pre_py38():
-        from pkg_resources import get_distribution
-
-        return get_distribution(__name__).version
-
     def default_version():
         return "unknown"
 
-    for func in (get_version_post_py38, get_version_pre_py38, default_version):
+    for func in (get_version_post_py38, default_version):
         try:
             return func()
         except Exception:
@@ -49,13 +49,13 @@ def logical_and(collection):
 
 
 @Appender(docstrings.make_docstring("toplevel", "corr"), join="\n", indents=1)
-def corr(collection, where=(-inf, inf)):
-    return pd.Series(collection, dtype="Stairs").sc.corr(where)
+def corr(collection, where=(-inf, inf), n_jobs=None, executor=None):
+    return pd.Series(collection, dtype="Stairs").sc.corr(where, n_jobs, executor)
 
 
 @Appender(docstrings.make_docstring("toplevel", "cov"), join="\n", indents=1)
-def cov(collection, where=(-inf, inf)):
-    return pd.Series(collection, dtype="Stairs").sc.cov(where)
+def cov(collection, where=(-inf, inf), n_jobs=None, executor=None):
+    return pd.Series(collection, dtype="Stairs").sc.cov(where, n_jobs, executor)
 
 
 @Appender(docstrings.make_docstring("toplevel", "limit"), join="\n", indents=1)
@@ -17,17 +17,17 @@ class StairsAccessor:
         self._obj = pandas_obj
 
     @Appender(docstrings.make_docstring("accessor", "corr"), join="\n", indents=1)
-    def corr(self, where=(-inf, inf)) -> pd.DataFrame:
+    def corr(self, where=(-inf, inf), n_jobs=None, executor=None) -> pd.DataFrame:
         return pd.DataFrame(
-            self._obj.values.corr(where),
+            self._obj.values.corr(where, n_jobs, executor),
             index=self._obj.index,
             columns=self._obj.index,
         )
 
     @Appender(docstrings.make_docstring("accessor", "cov"), join="\n", indents=1)
-    def cov(self, where=(-inf, inf)) -> pd.DataFrame:
+    def cov(self, where=(-inf, inf), n_jobs=None, executor=None) -> pd.DataFrame:
         return pd.DataFrame(
-            self._obj.values.cov(where),
+            self._obj.values.cov(where, n_jobs, executor),
             index=self._obj.index,
             columns=self._obj.index,
         )
@@ -54,6 +54,60 @@ class StairsAccessor:
         result.index = self._obj.index
         return result
 
+    def _make_series(self, values) -> pd.Series:
+        return pd.Series(values, index=self._obj.index)
+
+    @Appender(
+        docstrings.make_element_stat_docstring("accessor", "integrals"),
+        join="\n",
+        indents=1,
+    )
+    def integrals(self) -> pd.Series:
+        return self._make_series(self._obj.values.integrals())
+
+    @Appender(
+        docstrings.make_element_stat_docstring("accessor", "means"),
+        join="\n",
+        indents=1,
+    )
+    def means(self) -> pd.Series:
+        return self._make_series(self._obj.values.means())
+
+    @Appender(
+        docstrings.make_element_stat_docstring("accessor", "maxes"),
+        join="\n",
+        indents=1,
+    )
+    def maxes(self) -> pd.Series:
+        return self._make_series(self._obj.values.maxes())
+
+    @Appender(
+        docstrings.make_element_stat_docstring("accessor", "mins"),
+        join="\n",
+        indents=1,
+    )
+    def mins(self) -> pd.Series:
+        return self._make_series(self._obj.values.mins())
+
+    @Appender(
+        docstrings.make_element_stat_docstring("accessor", "percentiles"),
+        join="\n",
+        indents=1,
+    )
+    def percentiles(self, q):
+        values = self._obj.values.percentiles(q)
+        if values.ndim == 1:
+            return self._make_series(values)
+        return pd.DataFrame(values, index=self._obj.index, columns=list(q))
+
+    @Appender(
+        docstrings.make_element_stat_docstring("accessor", "step_counts"),
+        join="\n",
+        indents=1,
+    )
+    def step_counts(self) -> pd.Series:
+        return self._make_series(self._obj.values.step_counts())
+
     @Appender(docstrings.make_docstring("accessor", "plot"), join="\n", indents=1)
     def plot(self, ax=None, **kwargs):
         labels = self._obj.index
@@ -0,0 +1,553 @@
+"""
+Aggregations of step functions which avoid evaluating every step function at every step point.
+"""
+
+from __future__ import annotations
+
+import math
+import numbers
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable
+
+import numpy as np
+import pandas as pd
+
+from staircase.constants import inf
+from staircase.core.arrays.packed import PackedStairs
+from staircase.core.data import StairsData
+from staircase.core.stairs import Stairs
+from staircase.util import _is_datetime_like, _replace_none_with_infs
+
+
+def _previous_values(packed: PackedStairs, values: np.ndarray, initial_values):
+    # the value of each step function before each of its step points, in the layout of packed.values
+    previous = np.empty_like(values)
+    previous[1:] = values[:-1]
+    nonempty = np.diff(packed.offsets) > 0
+    previous[packed.offsets[:-1][nonempty]] = initial_values[nonempty]
+    return previous
+
+
+def _segment_deltas(packed: PackedStairs, values: np.ndarray, initial_values):
+    # the step changes of each step function, from its values, in the layout of packed.values
+    return values - _previous_values(packed, values, initial_values)
+
+
+def _sum_errors(a: np.ndarray, b: np.ndarray, sums: np.ndarray) -> np.ndarray:
+    # the rounding errors of sums = a + b, which are exact (Knuth's TwoSum), or 0 where not finite
+    b_virtual = sums - a
+    with np.errstate(invalid="ignore"):
+        errors = (a - (sums - b_virtual)) + (b - b_virtual)
+    errors[~np.isfinite(errors)] = 0
+    return errors
+
+
+def _sort_step_points(packed: PackedStairs):
+    # the order of the step points, and the positions in this order of the first of each distinct step point
+    order = np.argsort(packed.index.values)
+    points = packed.index.values[order]
+    group_starts = np.flatnonzero(np.r_[True, points[1:] != points[:-1]][: len(points)])
+    return order, group_starts
+
+
+def _make_stairs(packed: PackedStairs, initial_value, index, values) -> Stairs:
+    return Stairs._new(
+        initial_value=initial_value,
+        data=StairsData(index, value=values) if len(index) else None,
+        closed="right" if packed.right_closed[0] else "left",
+    )._remove_redundant_step_points()
+
+
+def _union_positions(packed: PackedStairs):
+    # the distinct step points, the position of each step point amongst them, and their order
+    order, group_starts = _sort_step_points(packed)
+    is_start = np.zeros(len(order), dtype="bool")
+    is_start[group_starts] = True
+    positions = np.empty(len(order), dtype="int64")
+    positions[order] = np.cumsum(is_start) - 1
+    return packed.index[order[group_starts]], positions, order
+
+
+def sum_stairs(packed: PackedStairs) -> Stairs:
+    """
+    Returns the sum of the step functions, from their step changes.
+
+    The step changes of all step functions are sorted, and aggregated, together, so that
+    memory use is proportional to the total number of step points, rather than the number of
+    step functions multiplied by the number of distinct step points.  The result is undefined
+    wherever any of the step functions is undefined, and is closed as the first step function is.
+    """
+    values = packed.values.astype("float64")
+    undefined = np.isnan(values)
+    initial_undefined = np.isnan(packed.initial_values)
+    initial_values = np.where(initial_undefined, 0.0, packed.initial_values)
+    initial_value = np.nan if initial_undefined.any() else initial_values.sum()
+    if len(values) == 0:
+        return _make_stairs(packed, initial_value, packed.index, values)
+
+    # undefined intervals are summed as zero, and counted separately
+    defined_values = np.where(undefined, 0.0, values)
+    previous = _previous_values(packed, defined_values, initial_values)
+    deltas = defined_values - previous
+    undefined_deltas = _segment_deltas(
+        packed, undefined.astype("float64"), initial_undefined.astype("float64")
+    )
+    order, group_starts = _sort_step_points(packed)
+    # The initial values, then the step changes in order of step point, are summed cumulatively, with
+    # the rounding errors of the step changes and of the cumulative sum carried separately, so that the
+    # sum at each step point is that of the values there, and does not drift from the step changes before.
+    terms = np.concatenate([initial_values, deltas[order]])
+    sums = np.cumsum(terms)
+    errors = np.concatenate(
+        [
+            np.zeros(len(initial_values)),
+            _sum_errors(defined_values, -previous, deltas)[order],
+        ]
+    )
+    errors += _sum_errors(np.append(0.0, sums[:-1]), terms, sums)
+    ends = len(initial_values) - 1 + np.append(group_starts[1:], len(order))
+    new_values = sums[ends] + np.cumsum(errors)[ends]
+    # sums within the rounding error of the magnitudes of the values summed, such as 0.1 + 0.2 - 0.3,
+    # are zero, as they would be if the values were exactly as written
+    magnitudes = np.cumsum(
+        np.concatenate(
+            [np.abs(initial_values), (np.abs(defined_values) - np.abs(previous))[order]]
+        )
+    )[ends]
+    tolerances = np.finfo("float64").eps * (
+        magnitudes + (ends + 1) * np.cumsum(np.abs(errors))[ends]
+    )
+    new_values[np.abs(new_values) <= tolerances] = 0
+    undefined_counts = np.cumsum(np.add.reduceat(undefined_deltas[order], group_starts))
+    new_values[undefined_counts + initial_undefined.sum() > 0.5] = np.nan
+    return _make_stairs(
+        packed, initial_value, packed.index[order[group_starts]], new_values
+    )
+
+
+def _range_reduce(
+    ufunc: np.ufunc, n: int, starts: np.ndarray, ends: np.ndarray, values, identity
+):
+    # reduces, at each of positions 0 to n - 1, the values of the ranges [start, end) which contain it
+    size = 1 << max(n - 1, 0).bit_length()
+    tree = np.full(2 * size, identity, dtype="float64")
+    # each range is applied to the O(log n) nodes of a segment tree which cover it exactly
+    # ordering the ranges by their starts keeps the updates to the tree local in memory
+    keep = np.flatnonzero(starts < ends)
+    keep = keep[np.argsort(starts[keep], kind="stable")]
+    lower, upper, values = starts[keep] + size, ends[keep] + size, values[keep]
+    while len(lower):
+        odd = (lower & 1).astype("bool")
+        ufunc.at(tree, lower[odd], values[odd])
+        lower += odd
+        odd = (upper & 1).astype("bool")
+        upper -= odd
+        ufunc.at(tree, upper[odd], values[odd])
+        lower >>= 1
+        upper >>= 1
+        keep = lower < upper
+        lower, upper, values = lower[keep], upper[keep], values[keep]
+    # then each node is combined with the nodes below it, down to the leaves
+    level = 1
+    while level < size:
+        nodes = np.arange(level, 2 * level)
+        tree[2 * nodes] = ufunc(tree[2 * nodes], tree[nodes])
+        tree[2 * nodes + 1] = ufunc(tree[2 * nodes + 1], tree[nodes])
+        level *= 2
+    return tree[size : size + n]
+
+
+# the number of values, of all step functions together, evaluated at once by _aggregate_blocks
+_AGG_BLOCK_SIZE = 1 << 18
+
+
+def _evaluate_blocks(packed, values, initial_values, positions, order, start, stop):
+    # yields the values of the step functions, as (k, width) arrays, over consecutive blocks of the
+    # distinct step points from start to stop
+    k = len(packed)
+    event_positions = positions[order]
+    event_members = np.repeat(np.arange(k), np.diff(packed.offsets))[order]
+    event_values = values[order]
+    current_values = initial_values.astype("float64")
+    # the values before the first block are given by the latest step point of each step function
+    first = np.searchsorted(event_positions, start)
+    if first:
+        latest = np.full(k, -1)
+        np.maximum.at(latest, event_members[:first], np.arange(first))
+        current_values = np.where(latest >= 0, event_values[latest], current_values)
+    step = max(1, _AGG_BLOCK_SIZE // k)
+    for block_start in range(start, stop, step):
+        width = min(step, stop - block_start)
+        first, last = np.searchsorted(
+            event_positions, [block_start, block_start + width]
+        )
+        # the latest step point of each step function, at each position in the block
+        latest = np.full((k, width), -1)
+        latest[event_members[first:last], event_positions[first:last] - block_start] = (
+            np.arange(first, last)
+        )
+        np.maximum.accumulate(latest, axis=1, out=latest)
+        matrix = np.where(latest >= 0, event_values[latest], current_values[:, None])
+        current_values = matrix[:, -1]
+        yield matrix
+
+
+def _aggregate_blocks(packed, values, initial_values, func, positions, order, n):
+    # evaluates the step functions, and aggregates them, over blocks of the n distinct step points
+    blocks = [
+        func(matrix, axis=0)
+        for matrix in _evaluate_blocks(
+            packed, values, initial_values, positions, order, 0, n
+        )
+    ]
+    return np.concatenate(blocks) if blocks else np.array([])
+
+
+def extreme_stairs(packed: PackedStairs, ufunc: np.ufunc, logical=False) -> Stairs:
+    """
+    Returns the maximum, or minimum, of the step functions, where *ufunc* is :func:`numpy.maximum`
+    or :func:`numpy.minimum`.
+
+    Unless the step functions are few relative to their step points, the intervals of all step
+    functions are applied to a segment tree over the distinct step points, in time and memory
+    proportional to the total number of step points, rather than the number of step functions
+    multiplied by the number of distinct step points.  If *logical* is True then the step functions
+    are first converted to boolean values, for logical-or and logical-and.  The result is undefined
+    wherever any of the step functions is undefined.
+    """
+    values, initial_values = packed.values.astype("float64"), packed.initial_values
+    if logical:
+        values = np.where(np.isnan(values), np.nan, values != 0)
+        initial_values = np.where(np.isnan(initial_values), np.nan, initial_values != 0)
+    initial_value = (
+        np.nan if np.isnan(initial_values).any() else ufunc.reduce(initial_values)
+    )
+    index, positions, order = _union_positions(packed)
+    n, k = len(index), len(packed)
+    if k * n <= len(positions) * np.log2(max(n, 2)):
+        new_values = _aggregate_blocks(
+            packed, values, initial_values, ufunc.reduce, positions, order, n
+        )
+        return _make_stairs(packed, initial_value, index, new_values)
+
+    # each step function has an interval from each step point, and one before its first step point
+    nonempty = np.diff(packed.offsets) > 0
+    first_positions = np.full(k, n)
+    first_positions[nonempty] = positions[packed.offsets[:-1][nonempty]]
+    ends = np.append(positions[1:], n)
+    ends[packed.offsets[1:][nonempty] - 1] = n
+    starts = np.concatenate([positions, np.zeros(k, dtype="int64")])
+    ends = np.concatenate([ends, first_positions])
+    values = np.concatenate([values, initial_values])
+
+    undefined = np.isnan(values)
+    identity = -np.inf if ufunc is np.maximum else np.inf
+    new_values = _range_reduce(
+        ufunc, n, starts, ends, np.where(undefined, identity, values), identity
+    )
+    if undefined.any():
+        undefined_counts = _range_reduce(
+            np.add, n, starts, ends, undefined.astype("float64"), 0.0
+        )
+        new_values[undefined_counts > 0] = np.nan
+    return _make_stairs(packed, initial_value, index, new_values)
+
+
+def agg_stairs(packed: PackedStairs, func: Callable) -> Stairs:
+    """
+    Returns the aggregate of the step functions, given by *func*.
+
+    The step functions are evaluated, and aggregated, over blocks of the distinct step points,
+    so that memory use is bounded by the number of step functions multiplied by the block size,
+    rather than by the number of distinct step points.
+    """
+    index, positions, order = _union_positions(packed)
+    new_values = _aggregate_blocks(
+        packed,
+        packed.values,
+        packed.initial_values,
+        func,
+        positions,
+        order,
+        len(index),
+    )
+    if new_values.dtype == "bool":
+        new_values = new_values.astype(int)
+    return _make_stairs(packed, func(packed.initial_values), index, new_values)
+
+
+def _to_domain(x):
+    # converts datetime-like points to numpy scalars comparable with index values
+    if _is_datetime_like(x):
+        return pd.Series([x]).values[0]
+    return x
+
+
+def _interval_edges(points: np.ndarray, where):
+    # the position of the last step point not after the lower bound of where, the position of the first
+    # step point not before the upper bound, and the edges of the intervals between the bounds
+    lower, upper = _replace_none_with_infs(where)
+    if len(points) == 0 and (lower == -inf or upper == inf):
+        return None
+    # an infinite bound is replaced by the first, or last, step point
+    lower = points[0] if lower == -inf else _to_domain(lower)
+    upper = points[-1] if upper == inf else _to_domain(upper)
+    if not lower < upper:
+        return None
+    if len(points) == 0:
+        # the dtype of the domain is given by the bounds alone
+        return -1, 0, np.array([lower, upper])
+    first = np.searchsorted(points, lower, side="right") - 1
+    last = np.searchsorted(points, upper, side="left")
+    edges = np.concatenate([[lower], points[first + 1 : last], [upper]])
+    return first, last, edges.astype(points.dtype)
+
+
+def _weighted_moments(blocks: Iterable, centres: np.ndarray):
+    # sums over the intervals where each pair of step functions are both defined, weighted by length, where
+    # blocks holds interval weights, and values as (k, width) arrays, and the values are relative to centres
+    k = len(centres)
+    lengths, sums, products, squares = (np.zeros((k, k)) for _ in range(4))
+    for weights, values in blocks:
+        defined = ~np.isnan(values)
+        values = np.where(defined, values - centres[:, None], 0.0)
+        # a product of a matrix with its own transpose is calculated as a symmetric rank-k update
+        scaled = values * np.sqrt(weights)
+        products += scaled @ scaled.T
+        if defined.all():
+            lengths += weights.sum()
+            sums += (values @ weights)[:, None]
+            squares += (scaled * scaled).sum(axis=1)[:, None]
+            continue
+        counts = defined.astype("float64")
+        weighted_counts = counts * weights
+        lengths += weighted_counts @ counts.T
+        sums += values @ weighted_counts.T
+        squares += (values * values) @ weighted_counts.T
+    return lengths, sums, products, squares
+
+
+def _centres(packed: PackedStairs) -> np.ndarray:
+    # the moments do not depend on the centres, but centres near the values of each step function
+    # limit the rounding error in the differences from which the covariances are calculated
+    k = len(packed)
+    values = packed.values.astype("float64")
+    members = np.repeat(np.arange(k), np.diff(packed.offsets))
+    defined = ~np.isnan(values)
+    initial_defined = ~np.isnan(packed.initial_values)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        centres = (
+            np.bincount(members, np.where(defined, values, 0.0), minlength=k)
+            + np.where(initial_defined, packed.initial_values, 0.0)
+        ) / (np.bincount(members, defined, minlength=k) + initial_defined)
+    return np.nan_to_num(centres)
+
+
+def _to_float(point, dtype) -> float:
+    # converts a point to a float comparable with index values of the given dtype, as integers if date-like
+    point = np.asarray(_to_domain(point))
+    if dtype.kind in "mM":
+        return float(point.astype(dtype).view("int64"))
+    return float(point)
+
+
+def _restrict_to_pairs(packed: PackedStairs, moments, lower, upper, unbounded):
+    # Restricts sums over the domain from lower to upper, where an unbounded side extends to the first, or
+    # last, step point of all step functions, to the domain of each pair, where an unbounded side extends
+    # to the first, or last, step point of either step function.  Beyond these step points both step
+    # functions are constant, so that the sums over the intervals between them are subtracted.
+    lengths, sums, products, squares = (matrix.copy() for matrix in moments)
+    dtype = packed.index.dtype
+    points = packed.index.values
+    points = (points.view("int64") if dtype.kind in "mM" else points).astype("float64")
+    lower, upper = _to_float(lower, dtype), _to_float(upper, dtype)
+    counts = np.diff(packed.offsets)
+    nonempty = counts > 0
+    firsts = np.full(len(packed), np.inf)
+    lasts = np.full(len(packed), -np.inf)
+    firsts[nonempty] = points[packed.offsets[:-1][nonempty]]
+    lasts[nonempty] = points[packed.offsets[1:][nonempty] - 1]
+    pair_lower = np.minimum.outer(firsts, firsts) if unbounded[0] else lower
+    pair_upper = np.maximum.outer(lasts, lasts) if unbounded[1] else upper
+    centres = _centres(packed)
+    final_values = packed.initial_values.copy()
+    final_values[nonempty] = packed.values[packed.offsets[1:][nonempty] - 1]
+    sides = [
+        (unbounded[0], pair_lower - lower, packed.initial_values),
+        (unbounded[1], upper - pair_upper, final_values),
+    ]
+    # the sum of the squares, before subtraction, bounds the rounding error in the variances
+    scales = squares.copy()
+    eps = np.finfo("float64").eps
+    with np.errstate(invalid="ignore", divide="ignore"):
+        for is_unbounded, outside, values in sides:
+            if not is_unbounded:
+                continue
+            weights = np.where(np.isfinite(outside), outside, 0) / (upper - lower)
+            defined = ~np.isnan(values)
+            values = np.where(defined, values - centres, 0.0)
+            weights = weights * np.outer(defined, defined)
+            lengths -= weights
+            sums -= weights * values[:, None]
+            products -= weights * np.outer(values, values)
+            squares -= weights * (values * values)[:, None]
+            scales += weights * (values * values)[:, None]
+        # pairs whose domain is empty, including pairs of constant step functions, are undefined
+        empty = ~(pair_lower < pair_upper) | (lengths <= 16 * eps)
+        # a step function which is constant over the domain of a pair has a variance of exactly zero
+        variances = squares / lengths - (sums / lengths) ** 2
+        constant = ~empty & (variances <= 16 * eps * scales / lengths**2)
+    squares[constant] = sums[constant] ** 2 / lengths[constant]
+    # and so a covariance of exactly zero with the other step function
+    constant |= constant.T
+    products[constant] = (sums * sums.T)[constant] / lengths[constant]
+    for matrix in (lengths, sums, products, squares):
+        matrix[np.broadcast_to(empty, matrix.shape)] = 0
+    return lengths, sums, products, squares
+
+
+def _pairwise_moments(packed: PackedStairs, where):
+    # the step functions are evaluated over blocks of the distinct step points within where, and the
+    # sums are accumulated from matrix products, so that memory use is bounded by the number of step
+    # functions multiplied by the block size
+    k = len(packed)
+    index, positions, order = _union_positions(packed)
+    bounds = _interval_edges(index.values, where)
+    if bounds is None:
+        return (np.zeros((k, k)),) * 4
+    first, last, edges = bounds
+    lengths = np.diff(edges).astype("float64")
+    weights = lengths / lengths.sum()
+    values = packed.values.astype("float64")
+
+    def blocks():
+        offset = 0
+        if first < 0:
+            # the interval from the lower bound precedes all step points
+            yield weights[:1], packed.initial_values[:, None]
+            offset = 1
+        for matrix in _evaluate_blocks(
+            packed,
+            values,
+            packed.initial_values,
+            positions,
+            order,
+            max(first, 0),
+            last,
+        ):
+            yield weights[offset : offset + matrix.shape[1]], matrix
+            offset += matrix.shape[1]
+
+    return _weighted_moments(blocks(), _centres(packed))
+
+
+def _check_n_jobs(n_jobs):
+    if n_jobs is None or n_jobs == -1:
+        return
+    if (
+        isinstance(n_jobs, bool)
+        or not isinstance(n_jobs, numbers.Integral)
+        or n_jobs < 1
+    ):
+        raise ValueError(
+            f"'n_jobs' must be None, -1 or a positive integer, not {n_jobs!r}."
+        )
+
+
+def pairwise_moments(
+    packed: PackedStairs, where, n_jobs: int | None = None, executor=None
+):
+    """
+    Returns, for each pair of step functions, sums over the domain where both are defined of 1, the
+    first step function, their product, and the square of the first step function, weighted by
+    length, where each step function is taken relative to an offset near its values.  If a bound of
+    *where* is infinite then, for each pair, it is replaced by the first, or last, step point of
+    either step function, as for :meth:`Stairs.cov`.
+
+    If *n_jobs* or *executor* is given then the step functions are split into groups, and the
+    sums for each pair of groups are calculated by a separate task, from the step points of those
+    groups only.  Tasks are submitted to *executor*, a :class:`concurrent.futures.Executor`, or
+    else to a :class:`concurrent.futures.ProcessPoolExecutor` with *n_jobs* workers, where -1
+    indicates one worker per CPU.  Each task receives the packed arrays of its step functions.
+    """
+    _check_n_jobs(n_jobs)
+    k = len(packed)
+    lower, upper = _replace_none_with_infs(where)
+    unbounded = (lower == -inf, upper == inf)
+    if len(packed.index) == 0:
+        return _pairwise_moments(packed, (lower, upper))
+    # infinite bounds are replaced by the first, or last, step point of all step functions
+    lower = packed.index.min() if unbounded[0] else lower
+    upper = packed.index.max() if unbounded[1] else upper
+    if (executor is None and n_jobs in (None, 1)) or k < 2:
+        moments = _pairwise_moments(packed, (lower, upper))
+    else:
+        moments = _parallel_moments(packed, lower, upper, n_jobs, executor)
+    if not (unbounded[0] or unbounded[1]) or not lower < upper:
+        return moments
+    return _restrict_to_pairs(packed, moments, lower, upper, unbounded)
+
+
+def _parallel_moments(packed: PackedStairs, lower, upper, n_jobs, executor):
+    # sums over the domain from lower to upper, calculated by tasks for each pair of groups of step functions
+    k = len(packed)
+    workers = os.cpu_count() if n_jobs in (None, -1) else n_jobs
+    # there is at least one task for each worker
+    groups = np.array_split(np.arange(k), min(k, math.ceil(math.sqrt(2 * workers))))
+    tiles = [(a, b) for a in range(len(groups)) for b in range(a, len(groups))]
+
+    def submit(pool):
+        return [
+            pool.submit(
+                _pairwise_moments,
+                packed.take(
+                    np.concatenate([groups[a], groups[b]] if a != b else [groups[a]])
+                ),
+                (lower, upper),
+            )
+            for a, b in tiles
+        ]
+
+    if executor is None:
+        with ProcessPoolExecutor(workers) as pool:
+            results = [future.result() for future in submit(pool)]
+    else:
+        results = [future.result() for future in submit(executor)]
+    moments = [np.empty((k, k)) for _ in range(4)]
+    for (a, b), result in zip(tiles, results):
+        rows, columns = groups[a], groups[b]
+        for matrix, tile in zip(moments, result):
+            if a == b:
+                matrix[np.ix_(rows, rows)] = tile
+            else:
+                matrix[np.ix_(rows, columns)] = tile[: len(rows), len(rows) :]
+                matrix[np.ix_(columns, rows)] = tile[len(rows) :, : len(rows)]
+    return tuple(moments)
+
+
+def cov_matrix(lengths, sums, products, squares) -> np.ndarray:
+    """
+    Returns the covariance matrix from the sums given by :func:`pairwise_moments`.
+    """
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = sums / lengths
+        return products / lengths - means * means.T
+
+
+def corr_matrix(lengths, sums, products, squares) -> np.ndarray:
+    """
+    Returns the correlation matrix from the sums given by :func:`pairwise_moments`.
+    """
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = sums / lengths
+        second_moments = squares / lengths
+        variances = second_moments - means * means
+    # a step function which is constant where the pair is defined may leave a rounding error
+    variances[variances <= 8 * np.finfo("float64").eps * second_moments] = 0.0
+    with np.errstate(invalid="ignore", divide="ignore"):
+        denominator = np.sqrt(variances * variances.T)
+        result = (products / lengths - means * means.T) / denominator
+    result[denominator == 0] = np.nan
+    np.fill_diagonal(result, 1)
+    return result
@@ -377,12 +377,28 @@ def _make_sample_docstring(which):
 _cov_corr_base = """
 Calculates the {calc_name} matrix for a collection of :class:`Stairs` instances
 
+The {calc_name} between each pair of step functions is calculated over the domain where both
+are defined, as :meth:`Stairs.{method}` does.  The step functions are evaluated once over their
+combined step points, and the matrix is calculated from weighted matrix products.  If a bound of
+*where* is infinite then, for each pair, it is replaced by the first, or last, step point of either
+step function.
+
 Parameters
 {collection_param}
-lower : int, float or pandas.Timestamp
-    lower bound of the interval on which to perform the calculation
-upper : int, float or pandas.Timestamp
-    upper bound of the interval on which to perform the calculation
+where : tuple or list of length two, optional
+    Indicates the domain interval over which to perform the calculation.
+    Default is (-sc.inf, sc.inf) or equivalently (None, None).
+n_jobs : int, optional
+    The number of worker processes over which to divide the calculation.  The step functions are
+    split into groups, and the sums for each pair of groups are calculated in a separate process,
+    from the step points of those groups only.  A value of -1 indicates one process per CPU.
+    Default is None, in which case the calculation is performed in the calling process unless
+    *executor* is given.  Ignored if the collection contains missing values, or step points of
+    different types, in which case each pair is calculated in the calling process.
+executor : :class:`concurrent.futures.Executor`, optional
+    If supplied then the pairs of groups are submitted to this executor, for example a
+    :class:`concurrent.futures.ThreadPoolExecutor`, rather than to a new process pool.
+    Ignored in the same cases as *n_jobs*.
 
 Returns
 -------
@@ -414,14 +430,14 @@ _corr_examples = """
 >>> {setup}
 >>> {calc_method}
           0          1          2
-0  1.000000   0.246878   0.700249
-1  0.246878   1.000000   0.792407
-2  0.700249   0.792407   1.000000
+0  1.000000   0.285967   0.811121
+1  0.285967   1.000000   0.792407
+2  0.811121   0.792407   1.000000
 """
 
 _top_level_cov_extra_examples = """
 >>> stairs = {"s1":s1, "s2":s2, "s1+s2":s1+s2}
->>> sc.cov(stairs, [2,3,4]))
+>>> sc.cov(stairs)
               s1         s2      s1+s2
 s1      0.687500   0.140496   0.652893
 s2      0.140496   0.471074   0.611570
@@ -431,11 +447,11 @@ s1+ s2  0.652893   0.611570   1.264463
 
 _top_level_corr_extra_examples = """
 >>> stairs = {"s1":s1, "s2":s2, "s1+s2":s1+s2}
->>> sc.corr(stairs, [2,3,4]))
+>>> sc.corr(stairs)
               s1         s2      s1+s2
-s1      1.000000   0.246878   0.700249
-s2      0.246878   1.000000   0.792407
-s1+ s2  0.700249   0.792407   1.000000
+s1      1.000000   0.285967   0.811121
+s2      0.285967   1.000000   0.792407
+s1+ s2  0.811121   0.792407   1.000000
 """
 
 
@@ -461,6 +477,7 @@ def _make_cov_corr_docstring(which, method):
     doc = _cov_corr_base.format(
         collection_param=collection_param,
         calc_name=calc_name,
+        method=method,
         see_also=see_also,
         examples=examples.format(setup=setup, calc_method=calc_method),
     )
@@ -713,3 +730,108 @@ Examples
     ...     stair_instance.plot(ax=ax, arrows=True)
     ...     ax.set_title(title)
 """
+
+
+_element_stat_base = """
+Calculates the {calc} of each :class:`Stairs` instance{where}.
+
+Equivalent to applying :meth:`staircase.Stairs.{stairs_method}` to each step function, but calculated
+for all step functions together.  Missing entries result in NaN.
+
+{params}Returns
+-------
+{returns}
+
+See Also
+--------
+{see_also}
+
+Examples
+--------
+
+>>> import staircase as sc
+>>> {setup}
+>>> {calc_method}
+{example_result}
+"""
+
+_element_stat_details = {
+    # calc, Stairs method, example results for arrays and for the accessor
+    "integrals": (
+        "integral",
+        "integral",
+        "array([ 1. , -1.5])",
+        "0    1.0\n1   -1.5\ndtype: float64",
+    ),
+    "means": (
+        "mean",
+        "mean",
+        "array([ 0.25      , -0.27272727])",
+        "0    0.250000\n1   -0.272727\ndtype: float64",
+    ),
+    "maxes": (
+        "maximum",
+        "max",
+        "array([1. , 0.5])",
+        "0    1.0\n1    0.5\ndtype: float64",
+    ),
+    "mins": (
+        "minimum",
+        "min",
+        "array([-1., -1.])",
+        "0   -1.0\n1   -1.0\ndtype: float64",
+    ),
+    "step_counts": (
+        "number of step points",
+        "number_of_steps",
+        "array([5, 4])",
+        "0    5\n1    4\ndtype: int64",
+    ),
+    "percentiles": (
+        "percentile, or percentiles,",
+        "percentile",
+        "array([0.5, 0. ])",
+        "0    0.5\n1    0.0\ndtype: float64",
+    ),
+}
+
+_percentiles_params = """Parameters
+----------
+q : float or array-like of floats
+    Percentile or sequence of percentiles to compute.  Must be between 0 and 100.
+
+"""
+
+
+def make_element_stat_docstring(which, method):
+    calc, stairs_method, array_result, series_result = _element_stat_details[method]
+    calc_method = f"{method}(50)" if method == "percentiles" else f"{method}()"
+    if which == "accessor":
+        where = " in the :class:`pandas.Series`"
+        setup = 'stairs = pd.Series([s1, s2], dtype="Stairs")'
+        calc_method = f"stairs.sc.{calc_method}"
+        returns = ":class:`pandas.Series`\n    Indexed by the index of the Series."
+        if method == "percentiles":
+            returns = ":class:`pandas.Series` or :class:`pandas.DataFrame`\n    Indexed by the index of the Series.  If *q* is array-like then a dataframe, with a column\n    for each percentile, is returned."
+        example_result = series_result
+        see_also = f":meth:`staircase.StairsArray.{method}`, :meth:`staircase.Stairs.{stairs_method}`"
+    elif which == "array":
+        where = " in the :class:`StairsArray`"
+        setup = "stairs = sc.StairsArray([s1, s2])"
+        calc_method = f"stairs.{calc_method}"
+        returns = ":class:`numpy.ndarray`"
+        if method == "percentiles":
+            returns = ":class:`numpy.ndarray`\n    If *q* is array-like then the array has a column for each percentile."
+        example_result = array_result
+        see_also = f":meth:`staircase.core.arrays.accessor.StairsAccessor.{method}`, :meth:`staircase.Stairs.{stairs_method}`"
+    return _element_stat_base.format(
+        calc=calc,
+        where=where,
+        stairs_method=stairs_method,
+        params=_percentiles_params if method == "percentiles" else "",
+        returns=returns,
+        see_also=see_also,
+        setup=setup,
+        calc_method=calc_method,
+        example_result=example_result,
+    )
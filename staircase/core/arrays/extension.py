@@ -4,7 +4,6 @@ import numbers
 from collections.abc import Iterable
 from typing import Any, Callable, Type
 
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 from pandas.api.extensions import (
@@ -15,7 +14,18 @@ from pandas.api.extensions import (
 from pandas.core.dtypes.inference import is_dict_like, is_list_like
 
 from staircase.constants import inf
-from staircase.core.arrays import docstrings
+from staircase.core.arrays import docstrings, statistics
+from staircase.core.arrays.aggregation import (
+    _check_n_jobs,
+    agg_stairs,
+    corr_matrix,
+    cov_matrix,
+    extreme_stairs,
+    pairwise_moments,
+    sum_stairs,
+)
+from staircase.core.arrays.packed import PackedStairs
+from staircase.core.data import StairsData
 from staircase.core.stairs import Stairs
 from staircase.core.stats.statistic import corr as _corr
 from staircase.core.stats.statistic import cov as _cov
@@ -63,7 +73,7 @@ class StairsArray(ExtensionArray):
 
     def __init__(self, data):
         if isinstance(data, self.__class__):
-            self.data = data.data
+            self._stairs, self._packed = data._stairs, data._packed
         elif isinstance(data, np.ndarray):
             if not data.ndim == 1:
                 raise ValueError(
@@ -77,17 +87,57 @@ class StairsArray(ExtensionArray):
         else:
             raise TypeError("'data' should be array of Stairs objects.")
 
+    @classmethod
+    def _from_packed(cls, packed: PackedStairs) -> StairsArray:
+        new_instance = cls.__new__(cls)
+        new_instance._stairs, new_instance._packed = None, packed
+        return new_instance
+
+    @property
+    def data(self) -> np.ndarray:
+        # the step functions are unpacked when first accessed, as they may then be changed in place
+        if self._stairs is None:
+            self._stairs = self._packed.to_stairs()
+            self._packed = None
+        return self._stairs
+
+    @data.setter
+    def data(self, data: np.ndarray):
+        self._stairs = data
+        self._packed = None
+
+    def _get_packed(self) -> PackedStairs:
+        if self._packed is not None:
+            return self._packed
+        return PackedStairs.from_stairs(self._stairs)
+
+    def __getstate__(self):
+        return {"packed": self._get_packed()}
+
+    def __setstate__(self, state):
+        if "packed" not in state:
+            # earlier versions pickled the array of Stairs instances
+            self.data = state["data"]
+            return
+        self._stairs, self._packed = None, state["packed"]
+
     @property
     def dtype(self) -> type:
         return self._dtype
 
     def __len__(self) -> int:
-        return len(self.data)
+        if self._stairs is None:
+            return len(self._packed)
+        return len(self._stairs)
 
     def __getitem__(self, idx: int) -> Any:
         if isinstance(idx, numbers.Integral):
             return self.data[idx]
         elif isinstance(idx, (Iterable, slice)):
+            if self._stairs is None:
+                return StairsArray._from_packed(
+                    self._packed.take(np.arange(len(self))[idx])
+                )
             return StairsArray(self.data[idx])
         else:
             raise TypeError("Index type not supported", idx)
@@ -106,18 +156,30 @@ class StairsArray(ExtensionArray):
                 self.data[key] = value
 
     def copy(self):
+        if self._stairs is None:
+            return StairsArray._from_packed(self._packed)
         return StairsArray(self.data.copy())
 
     def take(self, indices, allow_fill=False, fill_value=None):
         from pandas.api.extensions import take
 
+        # missing values are represented by None once unpacked, as set by __setitem__
+        if self._stairs is None and (not allow_fill or _isna(fill_value)):
+            indexer = np.asarray(indices, dtype="int64")
+            if not allow_fill:
+                indexer = np.arange(len(self))[indexer]
+            elif (indexer < -1).any():
+                raise ValueError("Invalid value in 'indices'.  Must be all >= -1.")
+            return StairsArray._from_packed(self._packed.take(indexer))
         result = take(self.data, indices, allow_fill=allow_fill, fill_value=fill_value)
         if allow_fill and fill_value is None:
             result[pd.isna(result)] = None
         return StairsArray(result)
 
     def isna(self):
-        return np.array([g is None for g in self.data], dtype="bool")
+        if self._stairs is None:
+            return self._packed.isna.copy()
+        return pd.isna(self._stairs)
 
     def bool(self):
         result = np.array([bool(s) for s in self.data])
@@ -135,14 +197,36 @@ class StairsArray(ExtensionArray):
 
     @property
     def nbytes(self):
-        return self._itemsize * len(self)
+        if self._stairs is None:
+            return self._packed.nbytes
+        # the size of the packed arrays, calculated without creating them
+        stairs = [s for s in self._stairs[~self.isna()] if s._data is not None]
+        return (
+            sum(s._data.index.nbytes + 8 * len(s._data) for s in stairs)
+            + 18 * len(self)
+            + 8
+        )
 
     @classmethod
     def _concat_same_type(cls, to_concat):
+        if all(array._stairs is None for array in to_concat):
+            return cls._from_packed(
+                PackedStairs.concat([array._packed for array in to_concat])
+            )
         return cls(np.concatenate([array.data for array in to_concat]))
 
+    def _get_aggregable_packed(self) -> PackedStairs | None:
+        # step functions with a common dtype for their step points are aggregated from the packed arrays
+        packed = self._get_packed()
+        if not len(packed) or packed.isna.any() or packed.index.dtype == object:
+            return None
+        return packed
+
     @Appender(docstrings.make_docstring("array", "mean"), join="\n", indents=1)
     def mean(self):
+        packed = self._get_aggregable_packed()
+        if packed is not None:
+            return sum_stairs(packed) / len(packed)
         return self.agg(np.mean)
 
     @Appender(docstrings.make_docstring("array", "median"), join="\n", indents=1)
@@ -151,18 +235,30 @@ class StairsArray(ExtensionArray):
 
     @Appender(docstrings.make_docstring("array", "sum"), join="\n", indents=1)
     def sum(self):
+        packed = self._get_aggregable_packed()
+        if packed is not None:
+            return sum_stairs(packed)
         return self.agg(np.sum)
 
     @Appender(docstrings.make_docstring("array", "min"), join="\n", indents=1)
     def min(self):
+        packed = self._get_aggregable_packed()
+        if packed is not None:
+            return extreme_stairs(packed, np.minimum)
         return self.agg(np.min)
 
     @Appender(docstrings.make_docstring("array", "max"), join="\n", indents=1)
     def max(self):
+        packed = self._get_aggregable_packed()
+        if packed is not None:
+            return extreme_stairs(packed, np.maximum)
         return self.agg(np.max)
 
     @Appender(docstrings.make_docstring("array", "agg"), join="\n", indents=1)
     def agg(self, func):
+        packed = self._get_aggregable_packed()
+        if packed is not None:
+            return agg_stairs(packed, func)
         index = pd.Index(
             np.unique(
                 np.concatenate(
@@ -179,14 +275,68 @@ class StairsArray(ExtensionArray):
 
         return Stairs._new(
             initial_value=func([s.initial_value for s in self.data]),
-            data=pd.Series(
-                new_values,
-                index=index,
-                name="value",
-            ).to_frame(),
+            data=StairsData(index, value=new_values),
             closed=self.data[0].closed,
         )._remove_redundant_step_points()
 
+    def to_frame(self):
+        """
+        Returns a :class:`staircase.StairsFrame`, in which the step functions share their step points.
+
+        Returns
+        -------
+        :class:`StairsFrame`
+
+        See Also
+        --------
+        StairsFrame.to_array
+        """
+        from staircase.core.arrays.frame import StairsFrame
+
+        return StairsFrame(self)
+
+    @Appender(
+        docstrings.make_element_stat_docstring("array", "integrals"),
+        join="\n",
+        indents=1,
+    )
+    def integrals(self) -> np.ndarray:
+        return statistics.integrals(self._get_packed())
+
+    @Appender(
+        docstrings.make_element_stat_docstring("array", "means"), join="\n", indents=1
+    )
+    def means(self) -> np.ndarray:
+        return statistics.means(self._get_packed())
+
+    @Appender(
+        docstrings.make_element_stat_docstring("array", "maxes"), join="\n", indents=1
+    )
+    def maxes(self) -> np.ndarray:
+        return statistics.extremes(self._get_packed(), np.fmax)
+
+    @Appender(
+        docstrings.make_element_stat_docstring("array", "mins"), join="\n", indents=1
+    )
+    def mins(self) -> np.ndarray:
+        return statistics.extremes(self._get_packed(), np.fmin)
+
+    @Appender(
+        docstrings.make_element_stat_docstring("array", "percentiles"),
+        join="\n",
+        indents=1,
+    )
+    def percentiles(self, q) -> np.ndarray:
+        return statistics.percentiles(self._get_packed(), q)
+
+    @Appender(
+        docstrings.make_element_stat_docstring("array", "step_counts"),
+        join="\n",
+        indents=1,
+    )
+    def step_counts(self) -> np.ndarray:
+        return statistics.step_counts(self._get_packed())
+
     @Appender(docstrings.make_docstring("array", "sample"), join="\n", indents=1)
     def sample(self, x) -> pd.Series:
         array = pd.Series(self.data)
@@ -199,15 +349,23 @@ class StairsArray(ExtensionArray):
 
     @Appender(docstrings.make_docstring("array", "logical_or"), join="\n", indents=1)
     def logical_or(self):
+        packed = self._get_aggregable_packed()
+        if packed is not None:
+            return extreme_stairs(packed, np.maximum, logical=True)
         return self.agg(_make_logical(np.logical_or))
 
     @Appender(docstrings.make_docstring("array", "logical_and"), join="\n", indents=1)
     def logical_and(self):
+        packed = self._get_aggregable_packed()
+        if packed is not None:
+            return extreme_stairs(packed, np.minimum, logical=True)
         return self.agg(_make_logical(np.logical_and))
 
     @Appender(docstrings.make_docstring("array", "plot"), join="\n", indents=1)
     def plot(self, ax=None, labels=None, **kwargs):
         if ax is None:
+            import matplotlib.pyplot as plt
+
             _, ax = plt.subplots()
         if labels is None:
             labels = range(len(self))
@@ -289,10 +447,18 @@ for funcstr in (
 
 
 def _make_corr_cov_func(
-    docstring: str, stairs_method: Callable, assume_ones_diagonal: int
+    docstring: str,
+    stairs_method: Callable,
+    assume_ones_diagonal: int,
+    matrix_func: Callable,
 ) -> Callable:
     @Appender(docstring, join="\n", indents=1)
-    def func(self, where=(-inf, inf)):
+    def func(self, where=(-inf, inf), n_jobs=None, executor=None):
+        _check_n_jobs(n_jobs)
+        packed = self._get_aggregable_packed()
+        if packed is not None:
+            return matrix_func(*pairwise_moments(packed, where, n_jobs, executor))
+        # collections with missing entries, or step points of mixed dtypes, are calculated serially
         size = len(self.data)
         vals = np.ones(shape=(size, size))
         for i in range(size):
@@ -305,8 +471,14 @@ def _make_corr_cov_func(
 
 
 StairsArray.corr = _make_corr_cov_func(
-    docstrings.make_docstring("array", "corr"), _corr, assume_ones_diagonal=True
+    docstrings.make_docstring("array", "corr"),
+    _corr,
+    assume_ones_diagonal=True,
+    matrix_func=corr_matrix,
 )
 StairsArray.cov = _make_corr_cov_func(
-    docstrings.make_docstring("array", "cov"), _cov, assume_ones_diagonal=False
+    docstrings.make_docstring("array", "cov"),
+    _cov,
+    assume_ones_diagonal=False,
+    matrix_func=cov_matrix,
 )
@@ -0,0 +1,377 @@
+from __future__ import annotations
+
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_dict_like, is_list_like
+
+from staircase.constants import inf
+from staircase.core.arrays.aggregation import (
+    _interval_edges,
+    _to_domain,
+    _weighted_moments,
+    corr_matrix,
+    cov_matrix,
+)
+from staircase.core.arrays.extension import StairsArray, _make_logical
+from staircase.core.data import StairsData
+from staircase.core.exceptions import ClosedMismatchError
+from staircase.core.stairs import Stairs
+
+
+def _shared_index(stairs: list[Stairs]) -> pd.Index:
+    indexes = [s._data.index for s in stairs if s._data is not None]
+    if not indexes:
+        return pd.Index([], dtype="float64")
+    # appending retains the dtype, including timezones
+    return indexes[0].append(indexes[1:]).unique().sort_values()
+
+
+class StairsFrame:
+    """
+    A collection of step functions which share their step points.
+
+    The step points of every step function are merged into one sorted array, and the values of
+    the step functions at these points are held in a single matrix, with one column per step
+    function.  Building a StairsFrame aligns the step functions once, after which aggregations,
+    sampling and correlations are single NumPy operations on the matrix, rather than repeating
+    the alignment on every call as :class:`StairsArray` does.
+
+    A StairsFrame is typically obtained with :meth:`StairsArray.to_frame`, and can be converted
+    back with :meth:`StairsFrame.to_array`.
+
+    Parameters
+    ----------
+    data : tuple, list, numpy array, dict, pandas.Series or :class:`StairsArray`
+        The Stairs instances.  If a dictionary or :class:`pandas.Series` is given then its keys,
+        or index, are used to label the step functions.
+
+    See Also
+    --------
+    StairsArray.to_frame
+    StairsFrame.to_array
+    """
+
+    def __init__(self, data):
+        if isinstance(data, pd.Series):
+            labels = data.index
+            stairs = list(data.values)
+        elif is_dict_like(data):
+            labels = pd.Index(list(data.keys()))
+            stairs = list(data.values())
+        elif isinstance(data, StairsArray):
+            labels = pd.RangeIndex(len(data))
+            stairs = list(data.data)
+        elif isinstance(data, Stairs) or is_list_like(data):
+            stairs = list(np.array(data, ndmin=1))
+            labels = pd.RangeIndex(len(stairs))
+        else:
+            raise TypeError("'data' should be array of Stairs objects.")
+        if not stairs:
+            raise ValueError("'data' should contain at least one Stairs object.")
+        for s in stairs[1:]:
+            if s._closed != stairs[0]._closed:
+                raise ClosedMismatchError(stairs[0], s)
+
+        index = _shared_index(stairs)
+        points = index.values
+        # row 0 holds the initial values, and row i + 1 the values from the i-th step point
+        matrix = np.empty((len(stairs), len(index) + 1))
+        for row, s in zip(matrix, stairs):
+            row[0] = s.initial_value
+            if s._data is None:
+                row[1:] = s.initial_value
+            else:
+                values = np.append([s.initial_value], s._get_values_array())
+                row[1:] = values[
+                    np.searchsorted(s._data.index.values, points, side="right")
+                ]
+        self._index = index
+        self._matrix = matrix.T
+        self._labels = labels
+        self._closed = stairs[0]._closed
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def __getitem__(self, label) -> Stairs:
+        return self._make_stairs(self._matrix[:, self._labels.get_loc(label)])
+
+    @property
+    def closed(self) -> str:
+        """
+        Indicates whether the half-open intervals of the step functions are left-closed or right-closed.
+        """
+        return self._closed
+
+    @property
+    def labels(self) -> pd.Index:
+        """
+        The labels of the step functions.
+        """
+        return self._labels
+
+    @property
+    def step_points(self) -> pd.Index:
+        """
+        The step points shared by the step functions.
+        """
+        return self._index
+
+    @property
+    def initial_values(self) -> pd.Series:
+        """
+        The values of the step functions at negative infinity, indexed by their labels.
+        """
+        return pd.Series(self._matrix[0], index=self._labels)
+
+    @property
+    def step_values(self) -> pd.DataFrame:
+        """
+        The values of the step functions at the shared step points.
+
+        Rows correspond to the step points, and columns to the step functions.  The values
+        are those obtained when approaching the step points from the right.
+        """
+        return pd.DataFrame(self._matrix[1:], index=self._index, columns=self._labels)
+
+    def _make_stairs(self, values: np.ndarray) -> Stairs:
+        if len(self._index) == 0:
+            return Stairs._new(values[0], None, closed=self._closed)
+        return Stairs._new(
+            initial_value=values[0],
+            data=StairsData(self._index, value=np.ascontiguousarray(values[1:])),
+            closed=self._closed,
+        )._remove_redundant_step_points()
+
+    def to_array(self) -> StairsArray:
+        """
+        Returns the step functions as a :class:`StairsArray`.
+
+        The step points which are redundant for each step function are removed, and
+        the labels are discarded.
+
+        Returns
+        -------
+        :class:`StairsArray`
+        """
+        result = np.empty(len(self), dtype=object)
+        result[:] = [self._make_stairs(self._matrix[:, i]) for i in range(len(self))]
+        return StairsArray(result)
+
+    def agg(self, func: Callable) -> Stairs:
+        """
+        Returns a :class:`staircase.Stairs` object representing the aggregate of the step functions.
+
+        Parameters
+        ----------
+        func : callable
+            A function, such as :func:`numpy.std`, which reduces a two-dimensional array along
+            the axis given by an *axis* parameter.
+
+        Returns
+        -------
+        :class:`Stairs`
+
+        See Also
+        --------
+        StairsArray.agg
+        """
+        values = func(self._matrix, axis=1)
+        if values.dtype == "bool":
+            values = values.astype(int)
+        return self._make_stairs(values)
+
+    def sum(self) -> Stairs:
+        """
+        Returns a :class:`staircase.Stairs` object representing the sum of the step functions.
+
+        Returns
+        -------
+        :class:`Stairs`
+        """
+        return self.agg(np.sum)
+
+    def mean(self) -> Stairs:
+        """
+        Returns a :class:`staircase.Stairs` object representing the mean of the step functions.
+
+        Returns
+        -------
+        :class:`Stairs`
+        """
+        return self.agg(np.mean)
+
+    def median(self) -> Stairs:
+        """
+        Returns a :class:`staircase.Stairs` object representing the median of the step functions.
+
+        Returns
+        -------
+        :class:`Stairs`
+        """
+        return self.agg(np.median)
+
+    def min(self) -> Stairs:
+        """
+        Returns a :class:`staircase.Stairs` object representing the minimum of the step functions.
+
+        Returns
+        -------
+        :class:`Stairs`
+        """
+        return self.agg(np.min)
+
+    def max(self) -> Stairs:
+        """
+        Returns a :class:`staircase.Stairs` object representing the maximum of the step functions.
+
+        Returns
+        -------
+        :class:`Stairs`
+        """
+        return self.agg(np.max)
+
+    def logical_or(self) -> Stairs:
+        """
+        Returns a boolean-valued step function resulting from a logical-or of the step functions.
+
+        Returns
+        -------
+        :class:`Stairs`
+        """
+        return self.agg(_make_logical(np.logical_or))
+
+    def logical_and(self) -> Stairs:
+        """
+        Returns a boolean-valued step function resulting from a logical-and of the step functions.
+
+        Returns
+        -------
+        :class:`Stairs`
+        """
+        return self.agg(_make_logical(np.logical_and))
+
+    def limit(self, x, side="right") -> pd.DataFrame:
+        """
+        Evaluates the limits of the step functions as they approach one, or more, points.
+
+        Parameters
+        ----------
+        x : scalar or vector data
+            The points at which to evaluate the limits.
+        side : {'left', 'right'}, default 'right'
+            Where a step change occurs at a point given by x, this parameter determines
+            if the step functions are evaluated at the interval to the left, or the right.
+
+        Returns
+        -------
+        :class:`pandas.DataFrame`
+            A dataframe, where rows correspond to the step functions, indexed by their labels,
+            and columns correspond to the points in *x*.
+
+        See Also
+        --------
+        StairsFrame.sample
+        StairsArray.limit
+        """
+        assert side in ("left", "right")
+        columns = list(x) if is_list_like(x) else [x]
+        points = np.array([_to_domain(point) for point in columns])
+        rows = np.searchsorted(self._index.values, points, side=side)
+        return pd.DataFrame(self._matrix[rows].T, index=self._labels, columns=columns)
+
+    def sample(self, x) -> pd.DataFrame:
+        """
+        Evaluates the values of the step functions at one, or more, points.
+
+        Parameters
+        ----------
+        x : scalar or vector data
+            The points at which to sample the step functions.
+
+        Returns
+        -------
+        :class:`pandas.DataFrame`
+            A dataframe, where rows correspond to the step functions, indexed by their labels,
+            and columns correspond to the points in *x*.
+
+        See Also
+        --------
+        StairsFrame.limit
+        StairsArray.sample
+        """
+        return self.limit(x, side="right" if self._closed == "left" else "left")
+
+    def _pairwise_moments(self, where):
+        # sums over the intervals where each pair of step functions are both defined, weighted by length
+        bounds = _interval_edges(self._index.values, where)
+        if bounds is None:
+            return (np.zeros((len(self), len(self))),) * 4
+        first, last, edges = bounds
+        lengths = np.diff(edges).astype(float)
+        # row i + 1 of the matrix holds the values from the i-th step point
+        values = self._matrix[first + 1 : last + 1].T
+        weights = lengths / lengths.sum()
+        # centring each step function first limits the rounding error in the differences
+        with np.errstate(invalid="ignore", divide="ignore"):
+            centres = np.nansum(values * weights, axis=1) / (
+                ~np.isnan(values) @ weights
+            )
+        return _weighted_moments([(weights, values)], np.nan_to_num(centres))
+
+    def _make_matrix(self, values: np.ndarray) -> pd.DataFrame:
+        return pd.DataFrame(values, index=self._labels, columns=self._labels)
+
+    def cov(self, where=(-inf, inf)) -> pd.DataFrame:
+        """
+        Calculates the covariance matrix of the step functions.
+
+        The covariance between each pair of step functions is calculated over the domain where both
+        are defined, as :meth:`Stairs.cov` does.  If *where* is not given then the domain is bounded
+        by the first and last shared step points.
+
+        Parameters
+        ----------
+        where : tuple or list of length two, optional
+            Indicates the domain interval over which to perform the calculation.
+            Default is (-sc.inf, sc.inf) or equivalently (None, None).
+
+        Returns
+        -------
+        :class:`pandas.DataFrame`
+            The covariance matrix, indexed by the labels of the step functions.
+
+        See Also
+        --------
+        StairsFrame.corr
+        StairsArray.cov
+        """
+        return self._make_matrix(cov_matrix(*self._pairwise_moments(where)))
+
+    def corr(self, where=(-inf, inf)) -> pd.DataFrame:
+        """
+        Calculates the correlation matrix of the step functions.
+
+        The correlation between each pair of step functions is calculated over the domain where both
+        are defined, as :meth:`Stairs.corr` does.  If *where* is not given then the domain is bounded
+        by the first and last shared step points.
+
+        Parameters
+        ----------
+        where : tuple or list of length two, optional
+            Indicates the domain interval over which to perform the calculation.
+            Default is (-sc.inf, sc.inf) or equivalently (None, None).
+
+        Returns
+        -------
+        :class:`pandas.DataFrame`
+            The correlation matrix, indexed by the labels of the step functions.
+
+        See Also
+        --------
+        StairsFrame.cov
+        StairsArray.corr
+        """
+        return self._make_matrix(corr_matrix(*self._pairwise_moments(where)))
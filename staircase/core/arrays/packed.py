@@ -0,0 +1,156 @@
+"""
+Compact storage for the step functions of a :class:`staircase.StairsArray`.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from staircase.core.data import StairsData
+from staircase.core.stairs import Stairs
+
+
+class PackedStairs:
+    """
+    Container for a collection of step functions, in flat arrays.
+
+    The step points of all step functions are concatenated in one :class:`pandas.Index`, and
+    their values in one NumPy array, with the step points of the i-th step function at positions
+    ``offsets[i]`` to ``offsets[i + 1]``.  Selecting, concatenating and pickling collections then
+    operate on a handful of arrays, rather than on an object per step function.
+
+    Like :class:`staircase.core.data.StairsData`, instances and their arrays are never modified
+    once created, and step functions unpacked from them share the arrays.
+
+    Parameters
+    ----------
+    index : :class:`pandas.Index`
+        The step points of all step functions.
+    values : :class:`numpy.ndarray`
+        The values of the step functions when approaching the step points from the right.
+    offsets : :class:`numpy.ndarray`
+        The positions, in *index* and *values*, of the first step point of each step function,
+        followed by the total number of step points.
+    initial_values : :class:`numpy.ndarray`
+        The values of the step functions at negative infinity.
+    right_closed : :class:`numpy.ndarray`
+        Indicates which step functions are right-closed.
+    isna : :class:`numpy.ndarray`
+        Indicates which entries of the collection are missing.
+    """
+
+    __slots__ = ("index", "values", "offsets", "initial_values", "right_closed", "isna")
+
+    def __init__(self, index, values, offsets, initial_values, right_closed, isna):
+        self.index = index
+        self.values = values
+        self.offsets = offsets
+        self.initial_values = initial_values
+        self.right_closed = right_closed
+        self.isna = isna
+
+    def __len__(self) -> int:
+        return len(self.initial_values)
+
+    def __getstate__(self):
+        return tuple(getattr(self, attr) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        for attr, value in zip(self.__slots__, state):
+            setattr(self, attr, value)
+
+    @classmethod
+    def from_stairs(cls, stairs: np.ndarray) -> PackedStairs:
+        isna = pd.isna(stairs)
+        present = [s for s in stairs[~isna] if s._data is not None]
+        lengths = np.zeros(len(stairs), dtype="int64")
+        lengths[~isna] = [0 if s._data is None else len(s._data) for s in stairs[~isna]]
+        initial_values = np.full(len(stairs), np.nan)
+        initial_values[~isna] = [s.initial_value for s in stairs[~isna]]
+        right_closed = np.zeros(len(stairs), dtype="bool")
+        right_closed[~isna] = [s._closed == "right" for s in stairs[~isna]]
+        if present:
+            # appending retains the dtype, including timezones
+            index = present[0]._data.index.append([s._data.index for s in present[1:]])
+            values = np.concatenate([s._get_values_array() for s in present])
+        else:
+            index = pd.Index([], dtype="float64")
+            values = np.array([], dtype="float64")
+        return cls(
+            index,
+            values,
+            np.concatenate([[0], np.cumsum(lengths)]),
+            initial_values,
+            right_closed,
+            isna,
+        )
+
+    def to_stairs(self) -> np.ndarray:
+        result = np.empty(len(self), dtype=object)
+        result[:] = [self._unpack(i) for i in range(len(self))]
+        return result
+
+    def _unpack(self, i: int) -> Stairs | None:
+        if self.isna[i]:
+            return None
+        start, stop = self.offsets[i], self.offsets[i + 1]
+        index = self.index[start:stop]
+        if index.dtype == object:
+            # step points of different dtypes were held together, such as numbers and datetimes
+            index = index.infer_objects()
+        return Stairs._new(
+            initial_value=self.initial_values[i],
+            data=(
+                None
+                if start == stop
+                else StairsData(index, value=self.values[start:stop])
+            ),
+            closed="right" if self.right_closed[i] else "left",
+        )
+
+    @property
+    def nbytes(self) -> int:
+        return sum(getattr(self, attr).nbytes for attr in self.__slots__)
+
+    def take(self, indexer: np.ndarray) -> PackedStairs:
+        """
+        Returns the step functions at integer positions, where -1 indicates a missing value.
+        """
+        indexer = np.asarray(indexer, dtype="int64")
+        missing = indexer < 0
+        # only missing values can be taken from an empty collection, as if from a missing entry
+        source = self if len(self) else PackedStairs.from_stairs(np.array([None]))
+        lengths = np.where(missing, 0, np.diff(source.offsets)[indexer])
+        offsets = np.concatenate([[0], np.cumsum(lengths)])
+        # the position of each selected step point, in the arrays of the source
+        positions = np.repeat(source.offsets[indexer] - offsets[:-1], lengths)
+        positions += np.arange(offsets[-1])
+        return PackedStairs(
+            source.index[positions],
+            source.values[positions],
+            offsets,
+            np.where(missing, np.nan, source.initial_values[indexer]),
+            source.right_closed[indexer] & ~missing,
+            source.isna[indexer] | missing,
+        )
+
+    @classmethod
+    def concat(cls, to_concat: list[PackedStairs]) -> PackedStairs:
+        starts = np.cumsum([0] + [len(packed.values) for packed in to_concat[:-1]])
+        indexes = [packed.index for packed in to_concat if len(packed.index)]
+        indexes = indexes or [to_concat[0].index]
+        return cls(
+            indexes[0].append(indexes[1:]),
+            np.concatenate([packed.values for packed in to_concat]),
+            np.concatenate(
+                [[0]]
+                + [
+                    packed.offsets[1:] + start
+                    for packed, start in zip(to_concat, starts)
+                ]
+            ),
+            np.concatenate([packed.initial_values for packed in to_concat]),
+            np.concatenate([packed.right_closed for packed in to_concat]),
+            np.concatenate([packed.isna for packed in to_concat]),
+        )
@@ -0,0 +1,208 @@
+"""
+Statistics of each step function in a collection, calculated from the packed arrays of all step functions together.
+"""
+
+from __future__ import annotations
+
+import warnings
+
+import numpy as np
+
+from staircase.core.arrays.packed import PackedStairs
+
+
+def _segment_reduce(
+    ufunc: np.ufunc, values: np.ndarray, members: np.ndarray, k: int, identity
+):
+    # reduces the values belonging to each of k step functions, where members is sorted
+    result = np.full(k, identity, dtype=values.dtype)
+    if len(values):
+        starts = np.flatnonzero(np.r_[True, members[1:] != members[:-1]])
+        result[members[starts]] = ufunc.reduceat(values, starts)
+    return result
+
+
+def _segment_cumsum(values: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    # cumulative sums within consecutive segments of the given lengths, summed in order as numpy.cumsum
+    # does, so that the results are identical to those for each segment alone
+    result = np.empty_like(values)
+    firsts = np.cumsum(counts) - counts
+    widths = np.zeros_like(counts)
+    nonempty = counts > 0
+    widths[nonempty] = 1 << np.ceil(np.log2(counts[nonempty])).astype("int64")
+    # segments are padded to a power of two, so that padding at most doubles the memory used
+    for width in np.unique(widths[nonempty]):
+        rows = np.flatnonzero(widths == width)
+        positions = firsts[rows, None] + np.arange(width)
+        inside = positions < (firsts + counts)[rows, None]
+        matrix = np.zeros(positions.shape, dtype=values.dtype)
+        matrix[inside] = values[positions[inside]]
+        result[positions[inside]] = np.cumsum(matrix, axis=1)[inside]
+    return result
+
+
+def _members(packed: PackedStairs) -> np.ndarray:
+    # the position, in the collection, of the step function each step point belongs to
+    return np.repeat(np.arange(len(packed)), np.diff(packed.offsets))
+
+
+def _intervals(packed: PackedStairs):
+    # the members, values and lengths of the intervals between consecutive step points, where defined
+    last = np.zeros(len(packed.values), dtype="bool")
+    nonempty = np.diff(packed.offsets) > 0
+    last[packed.offsets[1:][nonempty] - 1] = True
+    positions = np.flatnonzero(~last)
+    points = packed.index.values
+    members = _members(packed)[positions]
+    values = packed.values[positions].astype("float64")
+    lengths = points[positions + 1] - points[positions]
+    defined = ~np.isnan(values)
+    return members[defined], values[defined], lengths[defined]
+
+
+def _unpacked(packed: PackedStairs, func, dtype="float64") -> np.ndarray:
+    # evaluates func on each step function, when their step points have no common dtype
+    result = np.full(len(packed), np.nan, dtype=dtype)
+    for i in np.flatnonzero(~packed.isna):
+        result[i] = func(packed._unpack(i))
+    return result
+
+
+def _integrals_and_lengths(packed: PackedStairs):
+    # the integral of each step function, and the length of the domain on which it is defined
+    k = len(packed)
+    members, values, lengths = _intervals(packed)
+    # the integral and mean are undefined for step functions with fewer than two step points
+    undefined = packed.isna | (np.diff(packed.offsets) < 2)
+    overflow = np.zeros(k, dtype="bool")
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        if lengths.dtype.kind != "m":
+            integrals = _segment_reduce(np.add, lengths * values, members, k, 0.0)
+            totals = _segment_reduce(np.add, lengths, members, k, 0.0)
+            return integrals, totals, undefined, overflow
+        # as for Stairs.integral, each term is truncated to a whole number of units
+        lengths = lengths.view("int64")
+        terms = lengths.astype("float64") * values
+        # integrals which may not fit in int64 are left to the methods of Stairs
+        overflow = _segment_reduce(np.add, np.abs(terms), members, k, 0.0) >= 2**62
+        overflow &= ~undefined
+        terms[overflow[members]] = 0
+        integrals = _segment_reduce(np.add, terms.astype("int64"), members, k, 0)
+        totals = _segment_reduce(np.add, lengths, members, k, 0)
+    return integrals, totals, undefined, overflow
+
+
+def integrals(packed: PackedStairs) -> np.ndarray:
+    """
+    Returns the integral of each step function, as :meth:`Stairs.integral` does.
+
+    The products of the lengths and values of the intervals of all step functions are calculated
+    together, and summed for each step function with :meth:`numpy.ufunc.reduceat`.  Integrals in
+    a date-like domain are timedeltas, with NaT where undefined.
+    """
+    if packed.index.dtype == object:
+        return _unpacked(packed, lambda s: s.integral(), object)
+    result, _, undefined, overflow = _integrals_and_lengths(packed)
+    if packed.index.dtype.kind not in "mM":
+        result[undefined] = np.nan
+        return result
+    unit = np.datetime_data(packed.index.values.dtype)[0]
+    result = result.astype(f"timedelta64[{unit}]")
+    result[undefined] = np.timedelta64("NaT")
+    for i in np.flatnonzero(overflow):
+        result[i] = packed._unpack(i).integral().to_timedelta64()
+    return result
+
+
+def means(packed: PackedStairs) -> np.ndarray:
+    """
+    Returns the mean of each step function, as :meth:`Stairs.mean` does.
+    """
+    if packed.index.dtype == object:
+        return _unpacked(packed, lambda s: s.mean())
+    integrals, totals, undefined, overflow = _integrals_and_lengths(packed)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        result = integrals / totals
+    result[undefined] = np.nan
+    for i in np.flatnonzero(overflow):
+        result[i] = packed._unpack(i).mean()
+    return result
+
+
+def extremes(packed: PackedStairs, ufunc: np.ufunc) -> np.ndarray:
+    """
+    Returns the maximum, or minimum, of each step function, where *ufunc* is :func:`numpy.fmax`
+    or :func:`numpy.fmin`, as :meth:`Stairs.max` and :meth:`Stairs.min` do when no domain is given.
+    """
+    values = packed.values.astype("float64")
+    result = _segment_reduce(ufunc, values, _members(packed), len(packed), np.nan)
+    result = ufunc(result, packed.initial_values)
+    result[packed.isna] = np.nan
+    return result
+
+
+def step_counts(packed: PackedStairs) -> np.ndarray:
+    """
+    Returns the number of step points of each step function, as :attr:`Stairs.number_of_steps`
+    does, with NaN for missing entries.
+    """
+    counts = np.diff(packed.offsets)
+    if packed.isna.any():
+        counts = np.where(packed.isna, np.nan, counts)
+    return counts
+
+
+def percentiles(packed: PackedStairs, q) -> np.ndarray:
+    """
+    Returns percentiles of the values of each step function, as :attr:`Stairs.percentile` does.
+
+    The distinct values of all step functions are sorted together, and the cumulative fraction of
+    each step function's domain on which it takes each value is calculated for all step functions
+    together.  If *q* is a scalar then a one-dimensional array is returned, otherwise the
+    array has a column for each percentile in *q*.
+    """
+    k = len(packed)
+    scalar = np.ndim(q) == 0
+    q = np.atleast_1d(np.asarray(q, dtype="float64"))
+    if packed.index.dtype == object:
+        result = np.stack(
+            [
+                _unpacked(
+                    packed,
+                    lambda s: s.percentile(x) if s.number_of_steps > 1 else np.nan,
+                )
+                for x in q
+            ],
+            axis=1,
+        )
+        return result[:, 0] if scalar else result
+    result = np.full((k, len(q)), np.nan)
+    members, values, lengths = _intervals(packed)
+    if len(values) == 0:
+        return result[:, 0] if scalar else result
+    if lengths.dtype.kind == "m":
+        lengths = lengths.view("int64")
+    # the total length on which each step function takes each of its distinct values, in order of value
+    order = np.lexsort((values, members))
+    members, values, lengths = members[order], values[order], lengths[order]
+    starts = np.flatnonzero(
+        np.r_[True, (members[1:] != members[:-1]) | (values[1:] != values[:-1])]
+    )
+    members, values = members[starts], values[starts]
+    lengths = np.add.reduceat(lengths, starts).astype("float64")
+    totals = _segment_reduce(np.add, lengths, members, k, 0.0)
+    # the percentile at which each value is exceeded, as the step points of Percentiles
+    counts = np.bincount(members, minlength=k)
+    fractions = _segment_cumsum(lengths / totals[members], counts) * 100
+    first = np.cumsum(counts) - counts
+    defined = counts > 0
+    first, last = first[defined], counts[defined] - 1
+    for column, x in enumerate(q):
+        # Percentiles has step points at 0 and the fractions, and is evaluated either side of x
+        lower = _segment_reduce(np.add, (fractions < x).astype("int64"), members, k, 0)
+        upper = _segment_reduce(np.add, (fractions <= x).astype("int64"), members, k, 0)
+        lower = values[first + np.clip(lower[defined] - (x <= 0), 0, last)]
+        upper = values[first + np.clip(upper[defined] - (x < 0), 0, last)]
+        result[defined, column] = (lower + upper) / 2
+    return result[:, 0] if scalar else result
@@ -0,0 +1,85 @@
+"""
+Internal storage for the step points of a :class:`staircase.Stairs` instance.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+
+class StairsData:
+    """
+    Container for the step points of a step function.
+
+    The step points are held in a :class:`pandas.Index`, which retains the
+    dtype of the domain (including timezones), while the step changes and
+    the values of the step function at these points are held in NumPy arrays.
+    Either of *delta* or *value* may be None, in which case it is derived
+    on demand by the owning :class:`staircase.Stairs` instance.
+
+    Instances, and their arrays, are never modified once created.  This allows them
+    to be shared between :class:`staircase.Stairs` instances, including copies, without
+    copying.  Methods which change a step function in place, such as
+    :meth:`staircase.Stairs.layer`, assign a new instance instead.
+
+    Parameters
+    ----------
+    index : :class:`pandas.Index` or array-like
+        The step points, sorted in increasing order.
+    delta : :class:`numpy.ndarray`, optional
+        The step changes at each of the step points.
+    value : :class:`numpy.ndarray`, optional
+        The values of the step function when approaching the step points from the right.
+    """
+
+    __slots__ = ("index", "delta", "value")
+
+    def __init__(
+        self,
+        index: pd.Index,
+        delta: np.ndarray | None = None,
+        value: np.ndarray | None = None,
+    ):
+        if not isinstance(index, pd.Index):
+            index = pd.Index(index)
+        self.index = index
+        self.delta = delta
+        self.value = value
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __getstate__(self):
+        return self.index, self.delta, self.value
+
+    def __setstate__(self, state):
+        self.index, self.delta, self.value = state
+
+    def copy(self) -> StairsData:
+        return StairsData(
+            self.index.copy(),
+            delta=None if self.delta is None else self.delta.copy(),
+            value=None if self.value is None else self.value.copy(),
+        )
+
+    def take(self, indexer: np.ndarray) -> StairsData:
+        """
+        Returns the step points selected by a boolean mask, or integer positions.
+        """
+        return StairsData(
+            self.index[indexer],
+            delta=None if self.delta is None else self.delta[indexer],
+            value=None if self.value is None else self.value[indexer],
+        )
+
+    def with_index(self, index: pd.Index) -> StairsData:
+        """
+        Returns the same step changes and values, relocated to *index*.
+        """
+        return StairsData(index, delta=self.delta, value=self.value)
+
+    def has_na(self) -> bool:
+        return any(
+            np.isnan(arr).any() for arr in (self.delta, self.value) if arr is not None
+        )
@@ -15,6 +15,8 @@ from pandas.api.types import (
 )
 
 from staircase.constants import Inf, NegInf
+from staircase.core.data import StairsData
+from staircase.core.stats.statistic import _update_cache_for_layer
 from staircase.docstrings import examples
 from staircase.util._decorators import Appender
 
@@ -98,6 +100,219 @@ def _extract_from_frame(frame=None, start=None, end=None, value=None):
     return start, end, value
 
 
+def _make_layer_vectors(start, end, value):
+    # returns start points, end points and values of equal length
+    value = np.array(value)
+    assert not pd.isna(value).any(), "value parameter cannot contain null values"
+    start = _convert_to_series(start)
+    end = _convert_to_series(end)
+    _check_args_dtypes(start, end)  # conversion to Series required before checking
+    df = pd.concat([start, end], axis=1, ignore_index=True)
+    values = np.broadcast_to(value, len(df))
+    starts = pd.Index(df.iloc[:, 0]).rename(None)
+    ends = pd.Index(df.iloc[:, 1]).rename(None)
+    return starts, ends, values
+
+
+def _append_indexes(indexes):
+    # empty indexes are skipped so they do not coerce the dtype of the result
+    indexes = [index for index in indexes if len(index)]
+    if not indexes:
+        return pd.Index([], dtype="float64")
+    return indexes[0].append(indexes[1:])
+
+
+def _ordered_group_sum(values, sizes, compensated):
+    """
+    Sums contiguous groups of floats, from left to right.
+
+    If *compensated* is True then Kahan summation is used, which reproduces, bit for bit,
+    the sums calculated by :meth:`pandas.core.groupby.GroupBy.sum` for float data.
+    Otherwise the sums are identical to adding the values one at a time.
+    """
+    # Groups are ordered by decreasing size, so the groups with more than k elements
+    # are always a prefix.  Values are then laid out so that the k-th elements of these
+    # groups are contiguous, and each step of the summation is applied to slices.
+    by_size = np.argsort(-sizes, kind="stable")
+    rank = np.empty(len(sizes), dtype=np.intp)
+    rank[by_size] = np.arange(len(sizes))
+    # the number of groups with more than k elements
+    counts = np.bincount(sizes - 1)[::-1].cumsum()[::-1]
+    offsets = np.concatenate(([0], counts.cumsum()))
+    positions = np.arange(len(values)) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+    layout = np.empty_like(values)
+    layout[offsets[positions] + np.repeat(rank, sizes)] = values
+
+    sums = layout[: counts[0]] + 0.0
+    compensation = np.zeros_like(sums)
+    for k in range(1, len(counts)):
+        n = counts[k]
+        if not compensated:
+            sums[:n] += layout[offsets[k] : offsets[k] + n]
+            continue
+        y = layout[offsets[k] : offsets[k] + n] - compensation[:n]
+        t = sums[:n] + y
+        compensation[:n] = (t - sums[:n]) - y
+        # infinite values result in a nan compensation
+        compensation[:n][np.isnan(compensation[:n])] = 0
+        sums[:n] = t
+    return sums[rank]
+
+
+def _group_sum(values, group_starts, sizes, compensated=True):
+    # sums contiguous groups of values, which begin at group_starts
+    if values.dtype.kind == "i":
+        return np.add.reduceat(values, group_starts, dtype=values.dtype)
+    if values.dtype.kind == "u":
+        # pandas sums unsigned integers as 64-bit
+        return np.add.reduceat(values.astype(np.uint64, copy=False), group_starts)
+    if values.dtype == np.float64:
+        sums = np.add.reduceat(values, group_starts) + 0.0
+        # The order of summation has no effect on groups of one or two.  For larger
+        # groups reduceat may use pairwise summation, so these are summed separately.
+        large = sizes > 2
+        if large.any():
+            sums[large] = _ordered_group_sum(
+                values[np.repeat(large, sizes)], sizes[large], compensated
+            )
+        return sums
+    labels = np.repeat(np.arange(len(group_starts)), sizes)
+    return pd.Series(values).groupby(labels).sum().to_numpy()
+
+
+# sample size used to estimate the number of distinct step points
+_DUPLICATES_SAMPLE_SIZE = 2**14
+
+
+def _has_many_duplicates(point_values):
+    # Estimates whether there are more than three deltas per step point, on average, in which
+    # case the hash-based groupby of pandas is faster than restoring the order of float deltas
+    # after sorting.  A sample of size s, from U distinct points, contains approximately
+    # s^2 / 2U repeated points.
+    if len(point_values) < 4 * _DUPLICATES_SAMPLE_SIZE:
+        return False
+    sample = point_values[:: len(point_values) // _DUPLICATES_SAMPLE_SIZE]
+    repeats = len(sample) - len(np.unique(sample))
+    return 2 * repeats * len(point_values) > 3 * len(sample) ** 2
+
+
+def _sum_deltas_by_point(points, deltas, compensated=True):
+    """
+    Sums the deltas which share a step point.
+
+    For numerical and datetime-like step points this is a sort, followed by
+    a sum over each run of equal step points.  The sums are identical to those given by
+    :meth:`pandas.Series.groupby`, with deltas summed in the order they are given.
+    If *compensated* is False then floats are instead summed from left to right, which
+    is identical to adding the deltas one at a time.
+
+    Parameters
+    ----------
+    points : pandas.Index
+        Step points, which need not be sorted or unique.
+    deltas : numpy.ndarray
+        The step changes at each of the step points.  Null step points, and null deltas,
+        are ignored (consistent with :meth:`pandas.Series.groupby` sums).
+    compensated : bool, default True
+        Whether floats are summed with Kahan summation, as :meth:`pandas.Series.groupby` does.
+        Only applies to numerical and datetime-like step points.
+
+    Returns
+    -------
+    pandas.Index
+        The sorted, unique, step points
+    numpy.ndarray
+        The sum of the deltas for each of the step points
+    """
+    notnull = ~points.isna() & ~pd.isna(deltas)
+    if not notnull.all():
+        points = points[notnull]
+        deltas = deltas[notnull]
+    if len(points) == 0:
+        return points, deltas
+    point_values = points.values
+    if (
+        not isinstance(point_values, np.ndarray)
+        or point_values.dtype.kind not in "iufmM"
+        or (
+            compensated
+            and deltas.dtype.kind == "f"
+            and _has_many_duplicates(point_values)
+        )
+    ):
+        deltas = pd.Series(deltas, index=points)
+        deltas = deltas.groupby(level=0).sum()
+        return deltas.index, deltas.to_numpy()
+    order = np.argsort(point_values)
+    sorted_points = point_values[order]
+    is_new = np.empty(len(points), dtype=bool)
+    is_new[0] = True
+    np.not_equal(sorted_points[1:], sorted_points[:-1], out=is_new[1:])
+    group_starts = np.flatnonzero(is_new)
+    sizes = np.diff(np.append(group_starts, len(points)))
+    if deltas.dtype.kind == "f":
+        # the sum of three or more floats depends on their order, so restore the
+        # original order within these groups (cheaper than a stable sort of all points)
+        in_large_group = np.repeat(sizes > 2, sizes)
+        if in_large_group.any():
+            group_ids = np.cumsum(is_new)[in_large_group]
+            positions = order[in_large_group]
+            order[in_large_group] = positions[
+                np.argsort(group_ids * len(points) + positions)
+            ]
+    new_deltas = _group_sum(deltas[order], group_starts, sizes, compensated)
+    return points.take(order[group_starts]), new_deltas
+
+
+def _layer_vectors(self, chunks):
+    # layers intervals, given as chunks of equal length vectors, in a single aggregation
+    # existing deltas are derived from values, if necessary, before initial_value changes
+    existing = (
+        None if self._data is None else (self._data.index, self._get_deltas_array())
+    )
+    points = []
+    deltas = []
+    for starts, ends, values in chunks:
+        null_starts = np.asarray(starts.isna())
+        null_ends = np.asarray(ends.isna())
+        self.initial_value += values[null_starts].sum()
+        points.extend([starts[~null_starts], ends[~null_ends]])
+        deltas.extend([values[~null_starts], -values[~null_ends]])
+    if existing is not None:
+        points.append(existing[0])
+        deltas.append(existing[1])
+    index, deltas = _sum_deltas_by_point(
+        _append_indexes(points), np.concatenate(deltas)
+    )
+    self._data = StairsData(index, delta=deltas) if len(index) else None
+    self._remove_redundant_step_points()
+    return self
+
+
+def _has_cached_stats(self):
+    return (
+        self._integral_and_mean is not None
+        or self._min_and_max is not None
+        or ("dist" in self.__dict__ and self.dist._value_sums is not None)
+    )
+
+
+def _is_local_layer(self, start, end, value):
+    # whether cached statistics can be updated for an interval, rather than discarded
+    if start is None or end is None or self._data is None:
+        return False
+    if not _has_cached_stats(self) or not np.isfinite(value):
+        return False
+    _check_args_types(start, end)
+    index = self._data.index
+    try:
+        if not index[0] <= start < end <= index[-1]:
+            return False
+    except TypeError:
+        return False
+    return not self._has_na()
+
+
 def _layer_scalar(self, start, end, value):
     _check_args_types(start, end)
 
@@ -105,31 +320,39 @@ def _layer_scalar(self, start, end, value):
         return self
 
     if self._data is None:
-        deltas = pd.Series(name="delta", dtype="float64")
+        index = None
+        deltas = np.array([], dtype="float64")
     else:
-        deltas = self._get_deltas()
+        index = self._data.index
+        # deltas of integer-valued step functions are promoted if the value is not an integer
+        deltas = self._get_deltas_array()
+        deltas = deltas.astype(np.result_type(deltas, value), copy=False)
 
     if start is None:
         self.initial_value += value
-    else:
-        if start in deltas.index:
-            deltas.loc[start] += value
-        else:
-            deltas.loc[start] = float(value)
-        if deltas.loc[start] == 0:
-            deltas.drop(start, inplace=True)
 
-    if end is not None:
-        if end in deltas.index:
-            deltas.loc[end] -= value
+    for point, change in ((start, value), (end, -value)):
+        if point is None or change == 0:
+            continue
+        if index is None:
+            index = pd.Index([point])
+            deltas = np.array([change], dtype="float64")
+            continue
+        position = index.searchsorted(point)
+        if position < len(index) and index[position] == point:
+            deltas = deltas.copy()
+            deltas[position] += change
+            if deltas[position] == 0:
+                index = index.delete(position)
+                deltas = np.delete(deltas, position)
         else:
-            deltas.loc[end] = -value
-        if deltas.loc[end] == 0:
-            deltas.drop(end, inplace=True)
-    if len(deltas) > 0:
-        self._data = deltas.sort_index().to_frame()
-        self._valid_deltas = True
-    self._valid_values = False
+            index = index.insert(position, point)
+            deltas = np.insert(deltas, position, change)
+
+    if index is None or len(index) == 0:
+        self._data = None
+    else:
+        self._data = StairsData(index, delta=deltas)
     return self
 
 
@@ -167,37 +390,159 @@ def layer(self, start=None, end=None, value=None, frame=None):
     """
     if self._data is None and np.isnan(self.initial_value):
         return self
-    self._clear_cache()
     start, end, value = _preprocess_layer_args(frame, start, end, value)
     if not any(list(map(is_list_like, (start, end, value)))):
+        if _is_local_layer(self, start, end, value):
+            index, values = self._data.index, self._get_values_array()
+            _layer_scalar(self, start, end, value)
+            _update_cache_for_layer(self, index, values, start, end)
+            return self
+        self._clear_cache()
         return _layer_scalar(self, start, end, value)
-    value = np.array(value)
-    assert not pd.isna(value).any(), "value parameter cannot contain null values"
-    start = _convert_to_series(start)
-    end = _convert_to_series(end)
-    _check_args_dtypes(start, end)  # conversion to Series required before checking
-    df = pd.concat([start, end], axis=1, ignore_index=True)
-    start_series = pd.Series(value, index=df.iloc[:, 0])
-    self.initial_value += start_series[start_series.index.isna()].sum()
-    if self._data is None:
-        to_concat = [
-            start_series,
-            pd.Series(-value, index=df.iloc[:, 1]),
-        ]
-    else:
-        to_concat = [
-            start_series,
-            pd.Series(-value, index=df.iloc[:, 1]),
-            self._get_deltas(),
-        ]
-    deltas = pd.concat(to_concat)
-
-    self._data = deltas.groupby(deltas.index).sum().rename("delta").to_frame()
-    self._valid_deltas = True
-    self._valid_values = False
-    self._remove_redundant_step_points()
-    return self
+    self._clear_cache()
+    return _layer_vectors(self, [_make_layer_vectors(start, end, value)])
+
+
+class StairsBuilder:
+    """
+    Accumulates intervals, and layers them onto a :class:`Stairs` instance in a single operation.
+
+    Each call to :meth:`Stairs.layer` sorts and aggregates all step changes of the step function.
+    When intervals arrive one at a time, for example from an event loop, a StairsBuilder can be used
+    to buffer them instead, so that the sorting and aggregation only happen once, when
+    :meth:`StairsBuilder.build` is called.
+
+    A StairsBuilder is typically obtained with :meth:`Stairs.batch`.
+
+    Parameters
+    ----------
+    stairs : :class:`Stairs`, optional
+        The instance the intervals will be layered onto.  If not provided
+        then a new :class:`Stairs` instance, with an initial value of 0, is used.
+
+    See Also
+    --------
+    Stairs.batch
+    Stairs.layer
+    """
+
+    def __init__(self, stairs=None):
+        if stairs is None:
+            from staircase.core.stairs import Stairs
+
+            stairs = Stairs()
+        self._stairs = stairs
+        self._chunks = []
+        self._starts = []
+        self._ends = []
+        self._values = []
+
+    def __len__(self) -> int:
+        return len(self._values) + sum(len(values) for _, _, values in self._chunks)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.build()
+
+    def _flush_scalars(self):
+        if self._values:
+            self._chunks.append(
+                _make_layer_vectors(self._starts, self._ends, self._values)
+            )
+            self._starts, self._ends, self._values = [], [], []
+
+    def layer(self, start=None, end=None, value=None, frame=None):
+        """
+        Buffers one or more intervals, to be layered when :meth:`StairsBuilder.build` is called.
+
+        Parameters are interpreted identically to :meth:`Stairs.layer`.
+
+        Parameters
+        ----------
+        start : scalar, array-like or string, default None
+            Start point(s) of the interval(s).
+            A value of None is interpreted as negative infinity.
+        end : scalar, array-like or string, default None
+            End points(s) of the interval(s).
+            A value of None is interpreted as positive infinity.
+        value : float, array-like or string, default None
+            Value(s) of the interval(s).
+            A value of None is equivalent to a value of 1.
+        frame : :class:`pandas.DataFrame`, optional
+            A dataframe containing named columns, whose names may appear as values
+            for the other parameters.
+
+        Returns
+        -------
+        :class:`StairsBuilder`
+            The current instance is returned to facilitate method chaining
+        """
+        start, end, value = _preprocess_layer_args(frame, start, end, value)
+        if not any(list(map(is_list_like, (start, end, value)))):
+            _check_args_types(start, end)
+            self._starts.append(np.nan if start is None else start)
+            self._ends.append(np.nan if end is None else end)
+            self._values.append(value)
+        else:
+            self._flush_scalars()
+            self._chunks.append(_make_layer_vectors(start, end, value))
+        return self
+
+    def build(self):
+        """
+        Layers the buffered intervals onto the step function, and empties the buffer.
+
+        Returns
+        -------
+        :class:`Stairs`
+        """
+        self._flush_scalars()
+        chunks, self._chunks = self._chunks, []
+        stairs = self._stairs
+        if not chunks or (stairs._data is None and np.isnan(stairs.initial_value)):
+            return stairs
+        stairs._clear_cache()
+        return _layer_vectors(stairs, chunks)
+
+
+def batch(self):
+    """
+    Returns a :class:`StairsBuilder` for layering many intervals onto the step function in a single operation.
+
+    The builder can be used as a context manager, in which case the buffered intervals
+    are layered, in place, when the context exits.  The result is the same as calling
+    :meth:`Stairs.layer` once with all of the intervals.
+
+    Returns
+    -------
+    :class:`StairsBuilder`
+
+    See Also
+    --------
+    Stairs.layer
+
+    Examples
+    --------
+
+    >>> sf = sc.Stairs()
+    >>> with sf.batch() as batch:
+    ...     for start, end in [(1, 3), (2, 4), (5, 6)]:
+    ...         batch.layer(start, end)
+    >>> sf.step_values
+    1    1
+    2    2
+    3    1
+    4    0
+    5    1
+    6    0
+    Name: value, dtype: int64
+    """
+    return StairsBuilder(self)
 
 
 def add_methods(cls):
     cls.layer = layer
+    cls.batch = batch
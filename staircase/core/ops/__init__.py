@@ -1,4 +1,13 @@
-from staircase.core.ops.arithmetic import add, divide, multiply, negate, subtract
+from staircase.core.ops.arithmetic import (
+    add,
+    divide,
+    iadd,
+    imultiply,
+    isubtract,
+    multiply,
+    negate,
+    subtract,
+)
 from staircase.core.ops.logical import (
     invert,
     logical_and,
@@ -45,6 +54,9 @@ def add_operations(cls):
     cls.__sub__ = subtract
     cls.__mul__ = multiply
     cls.__truediv__ = divide
+    cls.__iadd__ = iadd
+    cls.__isub__ = isubtract
+    cls.__imul__ = imultiply
     cls.__eq__ = eq
     cls.__ne__ = ne
     cls.__lt__ = lt
@@ -5,15 +5,28 @@ import numpy as np
 import pandas as pd
 
 import staircase as sc
+from staircase.core.data import StairsData
 from staircase.core.ops import docstrings
-from staircase.core.ops.common import _combine_stairs_via_values, requires_closed_match
+from staircase.core.ops.common import (
+    _align_deltas,
+    _combine_stairs_via_values,
+    _merge_step_points,
+    requires_closed_match,
+)
 from staircase.util import _sanitize_binary_operands
 from staircase.util._decorators import Appender
 
 
 @Appender(docstrings.negate_docstring, join="\n", indents=1)
 def negate(self):
-    data = -self._data if self._data is not None else None
+    if self._data is None:
+        data = None
+    else:
+        data = StairsData(
+            self._data.index,
+            delta=None if self._data.delta is None else -self._data.delta,
+            value=None if self._data.value is None else -self._data.value,
+        )
     return sc.Stairs._new(
         initial_value=-self.initial_value,
         data=data,
@@ -21,25 +34,24 @@ def negate(self):
     )
 
 
-def _add_or_sub_deltas_no_mask(self, other, series_op, float_op):
+def _add_or_sub_deltas_no_mask(self, other, array_op, float_op):
     # assume self and other have ._data, and at least one has valid _deltas
-    # if not other._valid_deltas:
-    #     other._create_deltas()
-    # if not self._valid_deltas:
-    #     self._create_deltas()
-
-    deltas = series_op(self._get_deltas(), other._get_deltas(), fill_value=0)
+    new_index, locations_1, locations_2 = _merge_step_points(
+        self._data.index, other._data.index
+    )
+    deltas = _align_deltas(self._get_deltas_array(), locations_1, len(new_index))
+    deltas[locations_2] = array_op(deltas[locations_2], other._get_deltas_array())
 
     new_instance = sc.Stairs._new(
         initial_value=float_op(self.initial_value, other.initial_value),
-        data=pd.DataFrame({"delta": deltas}),
+        data=StairsData(new_index, delta=deltas),
         closed=self.closed,
     )
     new_instance._remove_redundant_step_points()
     return new_instance
 
 
-def _make_add_or_sub_func(docstring, series_op, float_op, series_rop):
+def _make_add_or_sub_func(docstring, array_op, float_op):
     @Appender(docstring, join="\n", indents=1)
     @requires_closed_match
     def func(self, other):
@@ -54,9 +66,9 @@ def _make_add_or_sub_func(docstring, series_op, float_op, series_rop):
             if np.isnan(other.initial_value):
                 data = None
             else:
-                data = self._data.copy()
+                data = StairsData(self._data.index, delta=self._data.delta)
                 if self._valid_values:
-                    data["value"] = series_op(data["value"], other.initial_value)
+                    data.value = float_op(self._data.value, other.initial_value)
             return sc.Stairs._new(
                 initial_value=float_op(self.initial_value, other.initial_value),
                 data=data,
@@ -66,11 +78,11 @@ def _make_add_or_sub_func(docstring, series_op, float_op, series_rop):
             if np.isnan(self.initial_value):
                 data = None
             else:
-                data = other._data.copy()
+                data = StairsData(other._data.index)
                 if other._valid_values:
-                    data["value"] = series_rop(data["value"], self.initial_value)
+                    data.value = float_op(self.initial_value, other._data.value)
                 if other._valid_deltas:
-                    data["delta"] = series_rop(data["delta"], 0)
+                    data.delta = float_op(0, other._data.delta)
             return sc.Stairs._new(
                 initial_value=float_op(self.initial_value, other.initial_value),
                 data=data,
@@ -78,11 +90,11 @@ def _make_add_or_sub_func(docstring, series_op, float_op, series_rop):
             )
         # self._data or other._data exists
         elif self._has_na() or other._has_na():
-            return _combine_stairs_via_values(self, other, series_op, float_op)
+            return _combine_stairs_via_values(self, other, array_op, float_op)
         elif self._valid_deltas or other._valid_deltas:
-            return _add_or_sub_deltas_no_mask(self, other, series_op, float_op)
+            return _add_or_sub_deltas_no_mask(self, other, array_op, float_op)
         elif self._valid_values and other._valid_values:
-            return _combine_stairs_via_values(self, other, series_op, float_op)
+            return _combine_stairs_via_values(self, other, array_op, float_op)
         else:
             raise RuntimeError("This code should not execute")
 
@@ -91,33 +103,81 @@ def _make_add_or_sub_func(docstring, series_op, float_op, series_rop):
 
 add = _make_add_or_sub_func(
     docstrings.add_docstring,
-    pd.Series.add,
+    np.add,
     operator.add,
-    pd.Series.radd,
 )
 
 subtract = _make_add_or_sub_func(
     docstrings.subtract_docstring,
-    pd.Series.sub,
+    np.subtract,
     operator.sub,
-    pd.Series.rsub,
 )
 
 
-def _make_mul_div_func(docstring, series_op, float_op, series_rop, float_rop):
+def _assign_result(self, result):
+    # makes self the step function represented by result
+    self._data = result._data
+    self.initial_value = result.initial_value
+    self._clear_cache()
+    return self
+
+
+def _is_masked(stairs):
+    return np.isnan(stairs.initial_value) or (
+        stairs._data is not None and stairs._data.has_na()
+    )
+
+
+def _make_inplace_add_or_sub_func(docstring, binary_func, negate_deltas):
+    @Appender(docstring, join="\n", indents=1)
+    @requires_closed_match
+    def func(self, other):
+        if not isinstance(other, sc.Stairs):
+            other = sc.Stairs(initial_value=other, closed=self.closed)
+        elif other is self:
+            other = self.copy()
+        if not self._pending_deltas:
+            if _is_masked(self) or _is_masked(other):
+                return _assign_result(self, binary_func(self, other))
+            if self._data is not None:
+                # values are discarded, as they will not be valid once initial_value changes
+                self._data = StairsData(
+                    self._data.index, delta=self._get_deltas_array()
+                )
+            self._pending_deltas = []
+        elif _is_masked(other):
+            return _assign_result(self, binary_func(self, other))
+
+        if negate_deltas:
+            self.initial_value = self.initial_value - other.initial_value
+        else:
+            self.initial_value = self.initial_value + other.initial_value
+        if other._data is not None:
+            deltas = other._get_deltas_array()
+            self._pending_deltas.append(
+                (other._data.index, -deltas if negate_deltas else deltas)
+            )
+        self._clear_cache()
+        return self
+
+    return func
+
+
+def _make_mul_div_func(docstring, array_op, float_op, float_rop):
     @Appender(docstring, join="\n", indents=1)
     @requires_closed_match
     def func(self, other):
-        def op_with_scalar(self, other, series_op, float_op):
+        def op_with_scalar(self, other, float_op, reflected):
             # other is scalar
-            if other == 0 and series_op == pd.Series.divide:
+            if other == 0 and array_op == np.divide and not reflected:
                 return sc.Stairs._new(np.nan, None, closed=self.closed)
             if self._data is None or np.isnan(other):
                 data = None
             else:
-                data = pd.DataFrame({"value": series_op(self._get_values(), other)})
-                if series_op in (pd.Series.divide, pd.Series.rdiv):
-                    data = data.replace(np.inf, np.nan)
+                values = float_op(self._get_values_array(), other)
+                if array_op == np.divide:
+                    values = np.where(values == np.inf, np.nan, values)
+                data = StairsData(self._data.index, value=values)
             initial_value = float_op(self.initial_value, other)
             initial_value = initial_value if np.isfinite(initial_value) else np.nan
             return sc.Stairs._new(
@@ -128,11 +188,11 @@ def _make_mul_div_func(docstring, series_op, float_op, series_rop, float_rop):
 
         self, other = _sanitize_binary_operands(self, other)
         if other._data is None:
-            return op_with_scalar(self, other.initial_value, series_op, float_op)
+            return op_with_scalar(self, other.initial_value, float_op, False)
         elif self._data is None:
-            return op_with_scalar(other, self.initial_value, series_rop, float_rop)
+            return op_with_scalar(other, self.initial_value, float_rop, True)
         else:
-            return _combine_stairs_via_values(self, other, series_op, float_op)
+            return _combine_stairs_via_values(self, other, array_op, float_op)
 
     return func
 
@@ -145,16 +205,27 @@ def float_rdiv(a, b):
 
 multiply = _make_mul_div_func(
     docstrings.multiply_docstring,
-    pd.Series.multiply,
+    np.multiply,
     operator.mul,
-    pd.Series.rmul,
     operator.mul,
 )
 
 divide = _make_mul_div_func(
     docstrings.divide_docstring,
-    pd.Series.divide,
     np.divide,
-    pd.Series.rdiv,
+    np.divide,
     float_rdiv,
 )
+
+
+iadd = _make_inplace_add_or_sub_func(docstrings.iadd_docstring, add, False)
+
+isubtract = _make_inplace_add_or_sub_func(
+    docstrings.isubtract_docstring, subtract, True
+)
+
+
+@Appender(docstrings.imultiply_docstring, join="\n", indents=1)
+@requires_closed_match
+def imultiply(self, other):
+    return _assign_result(self, multiply(self, other))
@@ -4,106 +4,123 @@ import numpy as np
 import pandas as pd
 
 import staircase as sc
+from staircase.core.data import StairsData
 from staircase.core.exceptions import ClosedMismatchError
 
 
-def _not_arithmetic_op(series_op):
-    return series_op not in (
-        pd.Series.add,
-        pd.Series.sub,
-        pd.Series.mul,
-        pd.Series.div,
+def _not_arithmetic_op(array_op):
+    return array_op not in (
+        np.add,
+        np.subtract,
+        np.multiply,
+        np.divide,
     )
 
 
-def _reindex_deltas(new_index, deltas, initial_value):
-    mask = deltas.where(np.isnan(deltas.values), 0)
-    deltas_reindexed = deltas.reindex(new_index, fill_value=0)
-    mask_initial_value = np.nan if np.isnan(initial_value) else 0
-    mask_reindexed = _reindex_values(new_index, mask, mask_initial_value)
-    return deltas_reindexed + mask_reindexed
+def _merge_step_points(index_1, index_2):
+    """
+    Merges two sorted, unique, indexes of step points.
 
+    Parameters
+    ----------
+    index_1 : pandas.Index
+    index_2 : pandas.Index
 
-def _reindex_values(new_index, values, initial_value):
+    Returns
+    -------
+    pandas.Index
+        The sorted union of *index_1* and *index_2*
+    numpy.ndarray
+        The position of each element of *index_1* in the union
+    numpy.ndarray
+        The position of each element of *index_2* in the union
     """
-    Conform values to new index
+    points = np.concatenate([index_1.values, index_2.values])
+    # both halves are already sorted, so a stable sort is a linear merge
+    order = np.argsort(points, kind="stable")
+    sorted_points = points[order]
+    is_new = np.empty(len(points), dtype=bool)
+    is_new[0] = True
+    np.not_equal(sorted_points[1:], sorted_points[:-1], out=is_new[1:])
+    locations = np.empty(len(points), dtype=np.intp)
+    locations[order] = np.cumsum(is_new) - 1
+    new_index = index_1.append(index_2).take(order[is_new])
+    return new_index, locations[: len(index_1)], locations[len(index_1) :]
+
+
+def _align_values(values, initial_value, locations, size):
+    """
+    Conform values to the union of step points, in a single forward fill.
 
     Parameters
     ----------
-    new_index : pandas.Index
-    values : pandas.Series
+    values : numpy.ndarray
     initial_value : float
+    locations : numpy.ndarray
+        The positions of the step points for *values* in the union
+    size : int
+        The length of the union of step points
 
     Returns
     -------
-    pandas.Series
+    numpy.ndarray
     """
-    first_step = values.index[0]
-    new_values = values.reindex(new_index, method="ffill")
-    new_values.loc[new_values.index < first_step] = initial_value
-    return new_values
-
-
-def _combine_step_series(
-    series_1, series_2, initial_value_1, initial_value_2, series_op, kind
-):
-    # kind = "values" or "deltas"
-    new_index = series_1.index.union(series_2.index)
-
-    reindex_method = _reindex_values if kind == "values" else _reindex_deltas
-    reindexed_series_1 = reindex_method(new_index, series_1, initial_value_1)
-    reindexed_series_2 = reindex_method(new_index, series_2, initial_value_2)
+    positions = np.zeros(size, dtype=np.intp)
+    positions[locations] = np.arange(1, len(values) + 1)
+    np.maximum.accumulate(positions, out=positions)
+    return np.append([initial_value], values)[positions]
 
-    new_series = series_op(
-        reindexed_series_1,
-        reindexed_series_2,
-    ).astype(float)
 
-    if series_op == pd.Series.divide:
-        new_series.replace(np.inf, np.nan, inplace=True)
-
-    return new_series
+def _align_deltas(deltas, locations, size):
+    """
+    Conform deltas to the union of step points, with zero deltas where absent.
+    """
+    new_deltas = np.zeros(size, dtype="float64")
+    new_deltas[locations] = deltas
+    return new_deltas
 
 
-def _combine_stairs_via_values(stairs1, stairs2, series_op, float_op):
+def _combine_stairs_via_values(stairs1, stairs2, array_op, float_op):
     # self.values and other._values should be able to be created
-    values = _combine_step_series(
-        stairs1._get_values(),
-        stairs2._get_values(),
+    new_index, locations_1, locations_2 = _merge_step_points(
+        stairs1._data.index, stairs2._data.index
+    )
+    values_1 = _align_values(
+        stairs1._get_values_array(),
         stairs1.initial_value,
+        locations_1,
+        len(new_index),
+    )
+    values_2 = _align_values(
+        stairs2._get_values_array(),
         stairs2.initial_value,
-        series_op,
-        "values",
+        locations_2,
+        len(new_index),
     )
 
-    requires_manual_masking = _not_arithmetic_op(series_op)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        values = array_op(values_1, values_2).astype(float)
+
+    requires_manual_masking = _not_arithmetic_op(array_op)
 
     if requires_manual_masking and (stairs1._has_na() or stairs2._has_na()):
-        mask = _combine_step_series(
-            stairs1._get_values().isnull(),
-            stairs2._get_values().isnull(),
-            np.isnan(stairs1.initial_value),
-            np.isnan(stairs2.initial_value),
-            np.logical_or,
-            "values",
-        ).astype(bool)
-        values.loc[mask] = np.nan
+        values[np.isnan(values_1) | np.isnan(values_2)] = np.nan
 
     if requires_manual_masking and (
         np.isnan(stairs1.initial_value) or np.isnan(stairs2.initial_value)
     ):
         initial_value = np.nan
-    elif series_op == pd.Series.divide and stairs2.initial_value == 0:
+    elif array_op == np.divide and stairs2.initial_value == 0:
         initial_value = np.nan
     else:
         initial_value = float_op(stairs1.initial_value, stairs2.initial_value) * 1
 
-    if series_op == pd.Series.divide:
-        values = values.replace(np.inf, np.nan).replace(-np.inf, np.nan)
+    if array_op == np.divide:
+        values[np.isinf(values)] = np.nan
 
     new_instance = sc.Stairs._new(
         initial_value=initial_value,
-        data=pd.DataFrame({"value": values}),
+        data=StairsData(new_index, value=values),
         closed=stairs1.closed,
     )
     new_instance._remove_redundant_step_points()
@@ -114,9 +131,9 @@ def _assert_closeds_equal(stairs1, stairs2):
     if (
         isinstance(stairs1, sc.Stairs)
         and isinstance(stairs2, sc.Stairs)
+        and stairs1._closed != stairs2._closed
         and stairs1.number_of_steps != 0
         and stairs2.number_of_steps != 0
-        and stairs1._closed != stairs2._closed
     ):
         raise ClosedMismatchError(stairs1, stairs2)
 
@@ -489,3 +489,36 @@ Examples
 """.format(
     examples=fillna_examples
 )
+
+_inplace_docstring = """
+Replaces *self* with *self* {symbol} *other*, in place.
+{note}
+Parameters
+----------
+other : int, float or :class:`Stairs`
+
+Returns
+-------
+:class:`Stairs`
+    The current instance
+
+See Also
+--------
+{see_also}
+"""
+
+_deferred_merge_note = """
+The step changes of *other* are merged with those of *self* when the step function
+is next used, so accumulating many step functions with {symbol}= merges all of
+their step points once, rather than once per step function.
+"""
+
+iadd_docstring = _inplace_docstring.format(
+    symbol="+", note=_deferred_merge_note.format(symbol="+"), see_also="Stairs.add"
+)
+isubtract_docstring = _inplace_docstring.format(
+    symbol="-", note=_deferred_merge_note.format(symbol="-"), see_also="Stairs.subtract"
+)
+imultiply_docstring = _inplace_docstring.format(
+    symbol="*", note="", see_also="Stairs.multiply"
+)
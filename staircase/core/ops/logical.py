@@ -4,6 +4,7 @@ import numpy as np
 import pandas as pd
 
 import staircase as sc
+from staircase.core.data import StairsData
 from staircase.core.ops import docstrings
 from staircase.core.ops.common import _combine_stairs_via_values, requires_closed_match
 from staircase.util import _sanitize_binary_operands
@@ -20,13 +21,12 @@ def _make_boolean_func(docstring, series_comp, float_comp):
 
         if self._data is None:
             return sc.Stairs(initial_value=initial_value, closed=self.closed)
-        values = series_comp(self._get_values(), 0) * 1
-        values.loc[np.isnan(self._get_values().values)] = np.nan
+        values = self._get_values_array()
+        new_values = (series_comp(values, 0) * 1).astype("float64")
+        new_values[np.isnan(values)] = np.nan
         result = sc.Stairs._new(
             initial_value=initial_value,
-            data=pd.DataFrame(
-                {"value": values},
-            ),
+            data=StairsData(self._data.index, value=new_values),
             closed=self.closed,
         )
         result._remove_redundant_step_points()
@@ -36,11 +36,11 @@ def _make_boolean_func(docstring, series_comp, float_comp):
 
 
 make_boolean = _make_boolean_func(
-    docstrings.make_boolean_docstring, pd.Series.ne, operator.ne
+    docstrings.make_boolean_docstring, np.not_equal, operator.ne
 )
 
 
-invert = _make_boolean_func(docstrings.invert_docstring, pd.Series.eq, operator.eq)
+invert = _make_boolean_func(docstrings.invert_docstring, np.equal, operator.eq)
 
 
 def _make_logical_func(docstring, array_op, float_op):
@@ -6,6 +6,7 @@ import pandas as pd
 
 import staircase as sc
 from staircase.constants import inf
+from staircase.core.data import StairsData
 from staircase.core.ops import docstrings
 from staircase.core.ops.common import (
     convert_string_args_to_timestamp,
@@ -15,6 +16,18 @@ from staircase.util import _replace_none_with_infs
 from staircase.util._decorators import Appender
 
 
+def _append_to_index(index, point):
+    if index is None or len(index) == 0:
+        return pd.Index([point])
+    return index.insert(len(index), point)
+
+
+def _prepend_to_index(index, point):
+    if index is None or len(index) == 0:
+        return pd.Index([point])
+    return index.insert(0, point)
+
+
 def _get_slice_index(self, lower, upper, lower_how, upper_how):
     # returns series
     if self._data is None:
@@ -44,21 +57,21 @@ def clip(self, lower=-inf, upper=inf):
     )
 
     if right_index == -1:
-        sliced_values = pd.Series(dtype="float64")
+        index = None
+        values = np.array([], dtype="float64")
     else:
-        sliced_values = self._get_values().iloc[max(0, left_index) : right_index]
+        index = self._data.index[max(0, left_index) : right_index]
+        values = self._get_values_array()[max(0, left_index) : right_index]
     if upper != inf:
-        sliced_values.loc[upper] = np.nan
+        index = _append_to_index(index, upper)
+        values = np.append(values, np.nan)
     if lower != -inf and left_index < 0:
-        sliced_values = pd.concat(
-            [pd.Series([self.initial_value], index=[lower]), sliced_values]
-        )
-    elif sliced_values.index[0] < lower:
-        index = pd.Series(sliced_values.index)
-        index.iloc[0] = lower
-        sliced_values.index = index
+        index = _prepend_to_index(index, lower)
+        values = np.append([self.initial_value], values)
+    elif index[0] < lower:
+        index = _prepend_to_index(index[1:], lower)
 
-    data = pd.DataFrame({"value": sliced_values})
+    data = StairsData(index, value=values)
 
     initial_value = self.initial_value if lower == -inf else np.nan
 
@@ -78,8 +91,10 @@ def _maskify(self, inverse=False):
     if self._data is None:
         data = None
     else:
-        data = pd.DataFrame(
-            {"value": self._get_values().where(func, np.nan).where(np.isnan, 0)}
+        values = self._get_values_array()
+        data = StairsData(
+            self._data.index,
+            value=np.where(func(values) & ~np.isnan(values), 0.0, np.nan),
         )
 
     return sc.Stairs._new(
@@ -146,8 +161,8 @@ def _make_null_comparison_func(docstring, comp_func):
         if self._data is None:
             data = None
         else:
-            data = pd.DataFrame(
-                comp_func(self._get_values()) * 1, index=self._data.index
+            data = StairsData(
+                self._data.index, value=comp_func(self._get_values_array()) * 1
             )
 
         new_instance = sc.Stairs._new(
@@ -184,7 +199,7 @@ def _make_data_fillna_method(self, value):
         values = fillmethod(values)
         if value in ("backfill", "bfill") and np.isnan(self.initial_value):
             initial_value = values.iloc[0]
-        data = pd.DataFrame({"value": values})
+        data = StairsData(values.index, value=values.values)
     return initial_value, data
 
 
@@ -197,8 +212,8 @@ def _make_data_fillna_scalar(self, value):
     if self._data is None:
         data = None
     else:
-        values = self._get_values().copy().fillna(value=value)
-        data = pd.DataFrame({"value": values})
+        values = self._get_values().fillna(value=value)
+        data = StairsData(values.index, value=values.values)
     return initial_value, data
 
 
@@ -4,15 +4,14 @@ import numpy as np
 import pandas as pd
 
 import staircase as sc
+from staircase.core.data import StairsData
 from staircase.core.ops import docstrings
 from staircase.core.ops.common import _combine_stairs_via_values, requires_closed_match
 from staircase.util import _sanitize_binary_operands
 from staircase.util._decorators import Appender
 
 
-def _make_relational_func(
-    docstring, numpy_relational, series_relational, float_relational
-):
+def _make_relational_func(docstring, numpy_relational, float_relational):
     @Appender(docstring, join="\n", indents=1)
     @requires_closed_match
     def func(self, other):
@@ -38,29 +37,26 @@ def _make_relational_func(
             )
         elif self._data is None or other._data is None:
             if other._data is None:  # self._data exists
-                values = self._get_values()
+                values = self._get_values_array()
                 new_values = numpy_relational(values, other.initial_value) * 1
                 # new_values[values.isna()] = np.nan  # *1 converts bool to nan where applicable
                 new_index = self._data.index
             else:  # other._data exists
-                values = other._get_values()
+                values = other._get_values_array()
                 new_values = numpy_relational(self.initial_value, values)
                 # new_values[values.isna()] = np.nan  # *1 converts bool to nan where applicable
                 new_index = other._data.index
 
             new_instance = sc.Stairs._new(
                 initial_value=initial_value,
-                data=pd.DataFrame(
-                    {"value": new_values},
-                    index=new_index,
-                ),
+                data=StairsData(new_index, value=new_values),
                 closed=self.closed,
             )
             new_instance._remove_redundant_step_points()
             return new_instance
         else:
             return _combine_stairs_via_values(
-                self, other, series_relational, float_relational
+                self, other, numpy_relational, float_relational
             )
 
     return func
@@ -124,7 +120,7 @@ def identical(self, other):
     elif self._data is None or other._data is None:
         return False
     elif self._valid_values and other._valid_values:
-        return _is_series_equal(self._data["value"], other._data["value"])
+        return _is_series_equal(self._get_values(), other._get_values())
     else:
         return _is_series_equal(self._get_deltas(), other._get_deltas())
 
@@ -132,7 +128,6 @@ def identical(self, other):
 lt = _make_relational_func(
     docstrings.lt_docstring,
     np.less,
-    pd.Series.lt,
     operator.lt,
 )
 
@@ -140,7 +135,6 @@ lt = _make_relational_func(
 gt = _make_relational_func(
     docstrings.gt_docstring,
     np.greater,
-    pd.Series.gt,
     operator.gt,
 )
 
@@ -148,7 +142,6 @@ gt = _make_relational_func(
 le = _make_relational_func(
     docstrings.le_docstring,
     np.less_equal,
-    pd.Series.le,
     operator.le,
 )
 
@@ -156,7 +149,6 @@ le = _make_relational_func(
 ge = _make_relational_func(
     docstrings.ge_docstring,
     np.greater_equal,
-    pd.Series.ge,
     operator.ge,
 )
 
@@ -164,7 +156,6 @@ ge = _make_relational_func(
 eq = _make_relational_func(
     docstrings.eq_docstring,
     np.equal,
-    pd.Series.eq,
     operator.eq,
 )
 
@@ -172,6 +163,5 @@ eq = _make_relational_func(
 ne = _make_relational_func(
     docstrings.ne_docstring,
     np.not_equal,
-    pd.Series.ne,
     operator.ne,
 )
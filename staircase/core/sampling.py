@@ -84,7 +84,7 @@ def limit(self: Stairs, x, side, include_index=False) -> pd.Series:
         else:
             return self.initial_value
     amended_values = np.append(
-        self._get_values().values, [self.initial_value]
+        self._get_values_array(), [self.initial_value]
     )  # hack for -1 index value
     if pd.api.types.is_list_like(x) and _is_datetime_like(next(iter(x))):
         x = pd.Series(x).values  # faster, but also bug free in numpy
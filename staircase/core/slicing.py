@@ -9,7 +9,12 @@ from typing_extensions import Literal
 
 import staircase as sc
 from staircase.core.ops.masking import clip
-from staircase.core.stats.statistic import _get_stairs_method
+from staircase.core.stats.statistic import (
+    _get_range_index,
+    _get_stairs_method,
+    _range_extremes,
+    _window_agg,
+)
 from staircase.docstrings import slicing as docstrings
 from staircase.util._decorators import Appender
 
@@ -33,8 +38,7 @@ class StairsSlicer:
     def agg(self, funcs) -> pd.DataFrame:
         if isinstance(funcs, str):
             funcs = [funcs]
-        self._ensure_slices()
-        df = pd.DataFrame(index=self._slices.index)
+        df = pd.DataFrame(index=self._interval_index)
         for func in funcs:
             df[func] = getattr(self, func)()
         return df
@@ -44,6 +48,29 @@ class StairsSlicer:
         self._ensure_slices()
         return self._slices.apply(func, args=args, **kwargs)
 
+    def _extremes(self, ufunc) -> pd.Series:
+        # extremes over the interior of each interval, without creating slices
+        stairs = self._stairs
+        if stairs._data is None:
+            # the range index holds only the initial value
+            start = np.zeros(len(self._interval_index), dtype="int64")
+            stop = start + 1
+        else:
+            # positions in the range index are offset by the initial value
+            index = stairs._data.index
+            start = index.searchsorted(self._interval_index.left, side="right")
+            stop = index.searchsorted(self._interval_index.right, side="left") + 1
+        return pd.Series(
+            _range_extremes(_get_range_index(stairs), ufunc, start, stop),
+            index=self._interval_index,
+        )
+
+    def _max(self) -> pd.Series:
+        return self._extremes(np.fmax)
+
+    def _min(self) -> pd.Series:
+        return self._extremes(np.fmin)
+
     @Appender(docstrings._docstrings["max"], join="\n", indents=1)
     def max(self) -> float:
         result = self._max()
@@ -88,10 +115,9 @@ class StairsSlicer:
             raise ValueError(
                 "Slices must be monotonic increasing (ascending order) and not overlapping"
             )
-        self._ensure_slices()
         new_values = getattr(self, func)()
-        left_bound = self._slices.index.left.min()
-        right_bound = self._slices.index.right.max()
+        left_bound = self._interval_index.left.min()
+        right_bound = self._interval_index.right.max()
         stairs_na = self._stairs.isna().mask((left_bound, right_bound)).fillna(0)
         return (
             self._stairs.mask((left_bound, right_bound))
@@ -108,13 +134,23 @@ def make_slice_method(method_name: str) -> Callable:
 
     @Appender(docstring, join="\n", indents=1)
     def method(self):
+        if method_name in ("mean", "integral"):
+            # evaluated for all slices at once, where possible, without creating them
+            result = _window_agg(
+                self._stairs,
+                func,
+                self._interval_index.left,
+                self._interval_index.right,
+            )
+            if result is not None:
+                return pd.Series(result, index=self._interval_index)
         self._ensure_slices()
         return self._slices.map(func)
 
     return method
 
 
-for method_name in ["_max", "_min", "mean", "median", "integral", "mode"]:
+for method_name in ["mean", "median", "integral", "mode"]:
     method = make_slice_method(method_name)
     setattr(StairsSlicer, method_name, method)
 
@@ -26,31 +26,40 @@ from staircase import docstrings
 from staircase.constants import inf
 from staircase.core import stats
 from staircase.core.accessor import CachedAccessor
-from staircase.core.layering import _check_args_dtypes
+from staircase.core.data import StairsData
+from staircase.core.layering import (
+    _append_indexes,
+    _check_args_dtypes,
+    _sum_deltas_by_point,
+)
 from staircase.plotting.accessor import PlotAccessor
 from staircase.util import _replace_none_with_infs
 from staircase.util._decorators import Appender
 
 
-def _make_deltas_from_vals(init_val, vals: pd.DataFrame) -> pd.Series:
-    if not np.isnan(vals).any():
-        result = pd.Series(
-            np.diff((np.append([init_val], vals.values))), dtype="float64"
-        )
+def _make_deltas_from_vals(init_val, vals: np.ndarray) -> np.ndarray:
+    temp = np.append([init_val], vals).astype("float64")
+    notnull = ~np.isnan(temp)
+    if notnull.all():
+        result = np.diff(temp)
     else:
-        temp = pd.Series(np.append([init_val], vals.values), dtype="float64")
-        result = pd.Series.add(
-            temp[pd.notnull(temp)].diff(), temp[pd.isnull(temp)], fill_value=0
-        )[1:]
+        # nan values are skipped when differencing, and propagate as nan deltas
+        result = np.full(len(vals), np.nan)
+        notnull_positions = np.flatnonzero(notnull)
+        result[notnull_positions[1:] - 1] = np.diff(temp[notnull_positions])
     if np.isnan(init_val):
-        result.iloc[0] = vals.iloc[0]
-    result.index = vals.index
+        result[0] = vals[0]
     return result
 
 
-def _make_vals_from_deltas(init_val: float, deltas: pd.DataFrame):
+def _make_vals_from_deltas(init_val: float, deltas: np.ndarray) -> np.ndarray:
     base = 0 if np.isnan(init_val) else init_val
-    return deltas.cumsum() + base
+    isna = np.isnan(deltas)
+    if not isna.any():
+        return np.cumsum(deltas) + base
+    result = np.nancumsum(deltas) + base
+    result[isna] = np.nan
+    return result
 
 
 class Stairs:
@@ -69,8 +78,6 @@ class Stairs:
     ):
         assert frame is None or isinstance(frame, pd.DataFrame)
         self._data = None
-        self._valid_deltas = False
-        self._valid_values = False
         self._masked = False
         self._closed = closed
         self.initial_value = initial_value
@@ -79,22 +86,70 @@ class Stairs:
         if any([x is not None for x in (start, end, value)]):
             self.layer(start, end, value, frame)
 
+    @property
+    def _data(self) -> StairsData | None:
+        # step changes added by in-place arithmetic are merged when the data is read
+        if self._pending_deltas:
+            self._merge_pending_deltas()
+        return self._step_data
+
+    @_data.setter
+    def _data(self, data: StairsData | None):
+        self._step_data = data
+        self._pending_deltas = None
+
+    def _merge_pending_deltas(self):
+        indexes = [index for index, _ in self._pending_deltas]
+        deltas = [deltas for _, deltas in self._pending_deltas]
+        if self._step_data is not None:
+            indexes.insert(0, self._step_data.index)
+            deltas.insert(0, self._step_data.delta)
+        index, deltas = _sum_deltas_by_point(
+            _append_indexes(indexes), np.concatenate(deltas), compensated=False
+        )
+        self._data = StairsData(index, delta=deltas) if len(index) else None
+        self._remove_redundant_step_points()
+
+    def __setstate__(self, state):
+        if not isinstance(state.get("_data"), pd.DataFrame):
+            self.__dict__.update(state)
+            return
+        # earlier versions held the step changes and values in a dataframe, where a column was stale
+        # if flagged as invalid, and pickled cached statistics which are no longer compatible
+        frame = state["_data"]
+        columns = {
+            column: frame[column].to_numpy()
+            for column, valid in (
+                ("delta", "_valid_deltas"),
+                ("value", "_valid_values"),
+            )
+            if column in frame and state.get(valid, True)
+        }
+        self._masked = state.get("_masked", False)
+        self._closed = state.get("_closed", "left")
+        self.initial_value = state["initial_value"]
+        self._data = StairsData(frame.index, **columns) if len(frame) else None
+        self._clear_cache()
+
     def _clear_cache(self):
-        self.dist._reset()
+        if "dist" in self.__dict__:
+            self.dist._reset()
         self._integral_and_mean = None
+        self._var = None
+        self._min_and_max = None
+        self._window_index = None
+        self._range_index = None
 
     @classmethod
     def _new(
         cls,
         initial_value: float,
-        data: pd.DataFrame,
+        data: StairsData | None,
         closed: Literal["left", "right"] = "left",
     ) -> Stairs:
         new_instance = cls(closed=closed)
         new_instance.initial_value = initial_value
         new_instance._data = data
-        new_instance._valid_deltas = False if data is None else "delta" in data.columns
-        new_instance._valid_values = False if data is None else "value" in data.columns
         return new_instance
 
     @classmethod
@@ -143,43 +198,63 @@ class Stairs:
 
         new_instance = cls(closed=closed)
         new_instance.initial_value = initial_value
-        new_instance._data = values.to_frame("value")
-        new_instance._valid_deltas = False
-        new_instance._valid_values = True
+        new_instance._data = StairsData(values.index, value=values.values)
         return new_instance
 
+    @property
+    def _valid_deltas(self) -> bool:
+        return self._data is not None and self._data.delta is not None
+
+    @property
+    def _valid_values(self) -> bool:
+        return self._data is not None and self._data.value is not None
+
     def _has_na(self) -> bool | np.array:
-        return np.isnan(self._data.values).any() or np.isnan(self.initial_value)
+        return self._data.has_na() or np.isnan(self.initial_value)
+
+    # _data may be shared with other instances, so it is replaced rather than modified
 
     def _create_values(self) -> Stairs:
         assert self._valid_deltas
-        self._data["value"] = _make_vals_from_deltas(
-            self.initial_value, self._data["delta"]
+        self._data = StairsData(
+            self._data.index,
+            delta=self._data.delta,
+            value=_make_vals_from_deltas(self.initial_value, self._data.delta),
         )
-        self._valid_values = True
         return self
 
     def _create_deltas(self) -> Stairs:
         assert self._valid_values
-        self._data["delta"] = _make_deltas_from_vals(
-            self.initial_value, self._data["value"]
+        self._data = StairsData(
+            self._data.index,
+            delta=_make_deltas_from_vals(self.initial_value, self._data.value),
+            value=self._data.value,
         )
-        self._valid_deltas = True
         return self
 
-    def _get_deltas(self) -> pd.Series:
+    def _get_deltas_array(self) -> np.ndarray:
         if self._data is None:
-            return pd.Series(dtype="float64")
+            return np.array([], dtype="float64")
         if not self._valid_deltas:
             self._create_deltas()
-        return self._data["delta"]
+        return self._data.delta
 
-    def _get_values(self) -> pd.Series:
+    def _get_values_array(self) -> np.ndarray:
         if self._data is None:
-            return pd.Series(dtype="float64")
+            return np.array([], dtype="float64")
         if not self._valid_values:
             self._create_values()
-        return self._data["value"]
+        return self._data.value
+
+    def _get_deltas(self) -> pd.Series:
+        if self._data is None:
+            return pd.Series(dtype="float64")
+        return pd.Series(self._get_deltas_array(), index=self._data.index, name="delta")
+
+    def _get_values(self) -> pd.Series:
+        if self._data is None:
+            return pd.Series(dtype="float64")
+        return pd.Series(self._get_values_array(), index=self._data.index, name="value")
 
     @property
     def closed(self):
@@ -512,39 +587,46 @@ class Stairs:
     def _remove_redundant_step_points(self) -> Stairs:
 
         # preferred over values method
-        def remove_via_deltas() -> None:
-            remove_index = (
-                self._data["delta"].isna() & self._data["delta"].isna().shift()
-            ) | (self._data["delta"] == 0)
-            self._data = self._data.loc[~remove_index]
+        def remove_via_deltas() -> np.ndarray:
+            deltas = self._data.delta
+            isna = np.isnan(deltas)
+            remove_index = deltas == 0
+            remove_index[1:] |= isna[1:] & isna[:-1]
+            return remove_index
 
         # do we just make deltas and then run above method?
-        def remove_via_values() -> None:
-            remove_index = (
-                self._data["value"].isna() & self._data["value"].isna().shift()
-            ) | (self._data["value"] == self._data["value"].shift())
-            if (self._data["value"].iloc[0] == self.initial_value) or (
-                pd.isnull(self._data.loc[:, "value"].iloc[0])
-                and pd.isnull(self.initial_value)
-            ):
-                remove_index.iloc[0] = True
-            self._data = self._data.loc[~remove_index]
+        def remove_via_values() -> np.ndarray:
+            values = self._data.value
+            isna = np.isnan(values)
+            remove_index = np.empty(len(values), dtype=bool)
+            remove_index[1:] = (isna[1:] & isna[:-1]) | (values[1:] == values[:-1])
+            remove_index[0] = (values[0] == self.initial_value) or (
+                isna[0] and pd.isnull(self.initial_value)
+            )
+            return remove_index
 
         if self._data is not None:
             if self._valid_deltas:
-                remove_via_deltas()
+                remove_index = remove_via_deltas()
             elif self._valid_values:
-                remove_via_values()
+                remove_index = remove_via_values()
             else:
                 assert False, "no deltas or values valid!"
-            if len(self._data) == 0:
+            if remove_index.all():
                 self._data = None
+            elif remove_index.any():
+                self._data = self._data.take(~remove_index)
 
         return self
 
     def copy(self) -> Stairs:
         """
-        Returns a deep copy of this Stairs instance
+        Returns a copy of this Stairs instance
+
+        The step data is shared with the copy, rather than duplicated, as it is never
+        modified in place.  Methods which change a step function, such as
+        :meth:`Stairs.layer`, replace its step data instead, so changes to the copy
+        do not affect the original, and vice versa.
 
         Returns
         -------
@@ -552,7 +634,7 @@ class Stairs:
         """
         new_instance = Stairs._new(
             initial_value=self.initial_value,
-            data=self._data.copy() if self._data is not None else None,
+            data=self._data,
             closed=self.closed,
         )
         return new_instance
@@ -640,7 +722,7 @@ class Stairs:
             return Stairs(initial_value=self.initial_value)
         return Stairs._new(
             initial_value=self.initial_value,
-            data=self._data.set_index(self._data.index + delta),
+            data=self._data.with_index(self._data.index + delta),
             closed=self.closed,
         )
 
@@ -700,32 +782,133 @@ class Stairs:
 
         See Also
         --------
-        Stairs.mean
+        Stairs.mean, Stairs.rolling_integral, Stairs.rolling_std
         """
-        where = _replace_none_with_infs(where)
-        assert len(window) == 2, "Window should be a listlike object of length 2."
-        left_delta, right_delta = window
-        lower, upper = where
-        clipped = self.clip(lower, upper)
-        if clipped._data is None:
-            return pd.Series([clipped.initial_value] * 2, index=where)
-        step_points = clipped._data.index
-        sample_points = pd.Index.union(
-            step_points - left_delta,
-            step_points - right_delta,
-        )
-        ii = pd.IntervalIndex.from_arrays(
-            sample_points + left_delta, sample_points + right_delta
-        )
-        s = pd.Series(
-            clipped.slice(ii).mean().values,
-            index=sample_points,
-        )
-        if lower != -inf:
-            s = s.loc[s.index >= lower - left_delta]
-        if upper != inf:
-            s = s.loc[s.index <= upper - right_delta]
-        return s
+        return stats.statistic._rolling_agg(self, stats.mean, window, where)
+
+    @Appender(docstrings.examples.rolling_integral_example, join="\n", indents=2)
+    def rolling_integral(
+        self,
+        window: tuple[int | int] = (0, 0),
+        where: tuple[float | float] = (-inf, inf),
+    ) -> pd.Series:
+        """
+        Returns coordinates defining rolling integral
+
+        Like the rolling mean, the rolling integral of a step function is a continous piece-wise linear
+        function, described by a sequence of x,y coordinates which mark where the function changes gradient.
+        The window, and the *where* parameter, are interpreted as for :meth:`Stairs.rolling_mean`.
+
+        Parameters
+        ----------
+        window : array-like of int, float or pandas.Timedelta
+            should be length of 2. Defines distances from focal point to window boundaries.
+        where : tuple or list of length two, optional
+            Indicates the domain interval over which to evaluate the step function.
+            Default is (-sc.inf, sc.inf) or equivalently (None, None).
+
+        Returns
+        -------
+        :class:`pandas.Series`
+
+        See Also
+        --------
+        Stairs.integral, Stairs.rolling_mean
+        """
+        return stats.statistic._rolling_agg(self, stats.integral, window, where)
+
+    @Appender(docstrings.examples.rolling_std_example, join="\n", indents=2)
+    def rolling_std(
+        self,
+        window: tuple[int | int] = (0, 0),
+        where: tuple[float | float] = (-inf, inf),
+    ) -> pd.Series:
+        """
+        Returns the rolling standard deviation at the points where the rolling mean changes gradient
+
+        The window, and the *where* parameter, are interpreted as for :meth:`Stairs.rolling_mean`,
+        and the result has the same index.  Unlike the rolling mean, the rolling standard deviation is
+        not linear between these points, so the result should not be interpolated.
+
+        Parameters
+        ----------
+        window : array-like of int, float or pandas.Timedelta
+            should be length of 2. Defines distances from focal point to window boundaries.
+        where : tuple or list of length two, optional
+            Indicates the domain interval over which to evaluate the step function.
+            Default is (-sc.inf, sc.inf) or equivalently (None, None).
+
+        Returns
+        -------
+        :class:`pandas.Series`
+
+        See Also
+        --------
+        Stairs.std, Stairs.rolling_mean
+        """
+        return stats.statistic._rolling_agg(self, stats.std, window, where)
+
+    @Appender(docstrings.examples.rolling_max_example, join="\n", indents=2)
+    def rolling_max(
+        self,
+        window: tuple[int | int] = (0, 0),
+        where: tuple[float | float] = (-inf, inf),
+    ) -> Stairs:
+        """
+        Returns the maximum of the step function over a rolling window
+
+        The window, and the *where* parameter, are interpreted as for :meth:`Stairs.rolling_mean`.
+        The result is a step function, whose value at a focal point is the maximum over the window.
+        It is undefined at focal points whose window extends beyond *where*.
+
+        Parameters
+        ----------
+        window : array-like of int, float or pandas.Timedelta
+            should be length of 2. Defines distances from focal point to window boundaries.
+        where : tuple or list of length two, optional
+            Indicates the domain interval over which to evaluate the step function.
+            Default is (-sc.inf, sc.inf) or equivalently (None, None).
+
+        Returns
+        -------
+        :class:`Stairs`
+
+        See Also
+        --------
+        Stairs.max, Stairs.rolling_min
+        """
+        return stats.statistic._rolling_extremes(self, np.fmax, window, where)
+
+    @Appender(docstrings.examples.rolling_min_example, join="\n", indents=2)
+    def rolling_min(
+        self,
+        window: tuple[int | int] = (0, 0),
+        where: tuple[float | float] = (-inf, inf),
+    ) -> Stairs:
+        """
+        Returns the minimum of the step function over a rolling window
+
+        The window, and the *where* parameter, are interpreted as for :meth:`Stairs.rolling_mean`.
+        The result is a step function, whose value at a focal point is the minimum over the window.
+        It is undefined at focal points whose window extends beyond *where*.
+
+        Parameters
+        ----------
+        window : array-like of int, float or pandas.Timedelta
+            should be length of 2. Defines distances from focal point to window boundaries.
+        where : tuple or list of length two, optional
+            Indicates the domain interval over which to evaluate the step function.
+            Default is (-sc.inf, sc.inf) or equivalently (None, None).
+
+        Returns
+        -------
+        :class:`Stairs`
+
+        See Also
+        --------
+        Stairs.min, Stairs.rolling_max
+        """
+        return stats.statistic._rolling_extremes(self, np.fmin, window, where)
 
     def to_frame(self) -> pd.DataFrame:
         """
@@ -759,12 +942,10 @@ class Stairs:
             ends = [inf]
             values = [self.initial_value]
         else:
-            if not self._valid_values:
-                self._create_values()
             step_points = self._data.index
             starts = [-inf] + step_points.to_list()
             ends = step_points.to_list() + [inf]
-            values = np.append(self.initial_value, self._data["value"].values)
+            values = np.append(self.initial_value, self._get_values_array())
         return pd.DataFrame({"start": starts, "end": ends, "value": values})
 
     def pipe(self, func: Callable, *args, **kwargs) -> Any:
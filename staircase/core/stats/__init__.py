@@ -13,6 +13,7 @@ from staircase.core.stats.statistic import (
     value_sums,
     values_in_range,
     var,
+    window_agg,
 )
 
 
@@ -24,6 +25,7 @@ def add_methods(cls):
     cls.cov = cov
     cls.corr = corr
     cls.agg = agg
+    cls.window_agg = window_agg
 
     cls.integral = integral
     cls.mean = mean
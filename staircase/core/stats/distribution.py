@@ -4,6 +4,7 @@ import numpy as np
 import pandas as pd
 
 import staircase as sc
+from staircase.core.data import StairsData
 
 
 class Xtiles(sc.core.stairs.Stairs):
@@ -22,9 +23,9 @@ class Xtiles(sc.core.stairs.Stairs):
         assert ecdf._data is not None
         return cls._new(
             initial_value=ecdf._data.index[0],
-            data=pd.DataFrame(
-                {"value": np.append(ecdf._data.index, ecdf._data.index[-1])},
-                index=np.append(0, ecdf._get_values().values * cls.scale_factor),
+            data=StairsData(
+                np.append(0, ecdf._get_values_array() * cls.scale_factor),
+                value=np.append(ecdf._data.index, ecdf._data.index[-1]),
             ),
         )
 
@@ -42,9 +43,10 @@ class Fractiles(Xtiles):
 
     def to_percentiles(self):
 
-        data = self._get_values().copy()
-        data.index = data.index * 100
-        return Percentiles._new(initial_value=self.initial_value, data=data.to_frame())
+        return Percentiles._new(
+            initial_value=self.initial_value,
+            data=self._data.with_index(self._data.index * 100),
+        )
 
 
 class ECDF(sc.core.stairs.Stairs):
@@ -53,13 +55,20 @@ class ECDF(sc.core.stairs.Stairs):
 
     @staticmethod
     def from_stairs(stairs):
-        ecdf_deltas = stairs.value_sums(dropna=True).rename("delta")
+        return ECDF.from_value_sums(stairs.value_sums(dropna=True))
+
+    @staticmethod
+    def from_value_sums(value_sums):
+        ecdf_deltas = value_sums.rename("delta")
         deltas_sum = ecdf_deltas.sum()
         normalized_probability_deltas = ecdf_deltas / deltas_sum
 
         ecdf = ECDF._new(
             initial_value=0,
-            data=normalized_probability_deltas.to_frame(),
+            data=StairsData(
+                normalized_probability_deltas.index,
+                delta=normalized_probability_deltas.values,
+            ),
             closed="left",
         )
         ecdf._denormalize_probability_factor = deltas_sum
@@ -111,14 +120,39 @@ class Dist:
         self._stairs = stairs
 
     def _reset(self):
+        self._value_sums = None
         self._ecdf = None
         self._fractiles = None
         self._percentiles = None
 
+    def _update_value_sums(self, value_sums, values, lengths):
+        # Replaces the distribution with one derived from value_sums, after adding lengths, which may be
+        # negative, to the given values.  Lengths must be integers, or timedeltas, so that values whose
+        # lengths are all removed are exactly zero.
+        changes = pd.Series(lengths, index=values).groupby(level=0).sum()
+        # integer values are promoted if any of the changed values is not an integer
+        keys = value_sums.index.values
+        keys = keys.astype(np.result_type(keys, changes.index.values), copy=False)
+        sums = value_sums.values.copy()
+        positions = np.searchsorted(keys, changes.index.values)
+        present = np.zeros(len(changes), dtype=bool)
+        in_bounds = positions < len(keys)
+        present[in_bounds] = (
+            keys[positions[in_bounds]] == changes.index.values[in_bounds]
+        )
+        sums[positions[present]] += changes.values[present]
+        keys = np.insert(keys, positions[~present], changes.index.values[~present])
+        sums = np.insert(sums, positions[~present], changes.values[~present])
+        nonzero = sums != sums.dtype.type(0)
+        self._reset()
+        self._value_sums = pd.Series(sums[nonzero], index=keys[nonzero])
+
     @property
     def ecdf(self):
         if self._ecdf is None:
-            self._ecdf = ECDF.from_stairs(self._stairs)
+            if self._value_sums is None:
+                self._value_sums = self._stairs.value_sums(dropna=True)
+            self._ecdf = ECDF.from_value_sums(self._value_sums)
         return self._ecdf
 
     def hist(self, bins="unit", closed="left", stat="sum"):
@@ -187,6 +187,51 @@ Examples
 """
 
 
+window_agg_docstring = """
+Returns the aggregation of the step function over each of several domain intervals.
+
+The result is equivalent to calling :meth:`Stairs.agg` once for each interval, but
+'integral' and 'mean' aggregations are calculated together, with a binary search for
+each interval bound.  This uses an index of cumulative integrals, which is built when first
+required and kept until the step function is changed.  The index is not used for other
+aggregations, or for unbounded intervals if the step function is undefined anywhere.
+
+Parameters
+----------
+name : {'max', 'min', 'mode', 'median', 'mean', 'integral', 'var', 'std'} or list of these
+    The name of the function which which to perform the aggregation.
+lower : array-like
+    The left bounds of the intervals.  A value of None is interpreted as negative infinity.
+upper : array-like
+    The right bounds of the intervals, of the same length as *lower*.
+    A value of None is interpreted as positive infinity.
+
+Returns
+-------
+:class:`numpy.ndarray` or :class:`pandas.DataFrame`
+    A dataframe is returned, with a column for each aggregation, if *name* is list-like.
+
+See Also
+--------
+Stairs.agg, Stairs.slice
+
+Examples
+--------
+.. plot::
+    :context: close-figs
+
+    >>> s1.plot(arrows=True)
+
+>>> s1.window_agg("integral", [1, 0, 2], [4, 6, None])
+array([2., 1., 0.])
+
+>>> s1.window_agg(["mean", "max"], [1, 0], [4, 6])
+       mean  max
+0  0.666667  1.0
+1  0.166667  1.0
+"""
+
+
 # VALUE SUMS -----------------------------------------------------
 
 value_sums_docstring = """
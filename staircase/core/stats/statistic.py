@@ -5,7 +5,8 @@ import pandas as pd
 from pandas.api.types import is_list_like
 
 import staircase as sc
-from staircase.constants import inf
+from staircase.constants import inf, neginf
+from staircase.core.data import StairsData
 from staircase.core.ops.masking import _get_slice_index
 from staircase.core.stats import docstrings
 from staircase.docstrings import examples
@@ -13,27 +14,126 @@ from staircase.util import _get_lims, _replace_none_with_infs
 from staircase.util._decorators import Appender
 
 
+def _timedelta_integral(lengths, values):
+    # lengths are integers, in the unit of a date-like domain
+    # each term is truncated to a whole number of units, as multiplying a pandas.Timedelta by a float is
+    terms = lengths.astype("float64") * values
+    if len(terms) and np.abs(terms).max() >= 2**63:
+        raise OverflowError
+    terms = terms.astype("int64")
+    if abs(terms.sum(dtype="float64")) < 2**62:
+        # int64 addition wraps around, so the sum is exact when the total fits, even if partial sums do not
+        return terms.sum()
+    integral = sum(terms.tolist())
+    if abs(integral) >= 2**63:
+        raise OverflowError
+    return integral
+
+
 def _cache_integral_and_mean(self):
     if self._data is None or len(self._data) < 2:
         self._integral_and_mean = np.nan, np.nan
-    else:
-        value_sums = self.value_sums(group=False)
-        value_sums = value_sums[value_sums.index.notnull()]
+        return
+    values = self._get_values_array()[:-1]
+    index_values = self._data.index.values
+    lengths = np.diff(index_values)
+    defined = ~np.isnan(values)
+    values, lengths = values[defined], lengths[defined]
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        if index_values.dtype.kind not in "mM":
+            integral = np.dot(lengths, values)
+            self._integral_and_mean = (integral, integral / lengths.sum())
+            return
+        lengths = lengths.view("int64")
+        total_length = lengths.sum()
+        try:
+            integral = _timedelta_integral(lengths, values)
+        except OverflowError:
+            self._integral_and_mean = (None, np.dot(lengths / total_length, values))
+            raise
+        unit = np.datetime_data(index_values.dtype)[0]
+        self._integral_and_mean = (
+            pd.Timedelta(integral, unit=unit),
+            integral / total_length,
+        )
+
+
+def _update_cache_for_layer(self, index, values, start, end):
+    # Called by Stairs.layer after a single interval, from start to end, has been layered within the domain
+    # of a step function without undefined values.  The step points and values from before are given.
+    # Cached statistics are updated from the intervals which overlap the layered interval, rather than
+    # discarded, unless step points were removed, the domain changed dtype, or rounding changed the values
+    # of other intervals.
+    integral_and_mean, min_and_max = self._integral_and_mean, self._min_and_max
+    value_sums = self.dist._value_sums if "dist" in self.__dict__ else None
+    self._clear_cache()
+    if self._data is None:
+        return
+    new_index = self._data.index
+    if new_index.dtype != index.dtype:
+        return
+    lower = index.searchsorted(start, side="right") - 1
+    upper = index.searchsorted(end, side="left")
+    if len(new_index) != len(index) + (index[lower] != start) + (index[upper] != end):
+        return
+    new_upper = upper + len(new_index) - len(index)
+    new_values = self._get_values_array()
+    if not (
+        np.array_equal(new_values[:lower], values[:lower])
+        and np.array_equal(new_values[new_upper:], values[upper:])
+    ):
+        return
+    removed_values = values[lower:upper]
+    removed_lengths = np.diff(index.values[lower : upper + 1])
+    added_values = new_values[lower:new_upper]
+    added_lengths = np.diff(new_index.values[lower : new_upper + 1])
+    date_like = index.dtype.kind in "mM"
+
+    # integrals are only updated for date-like domains, where the sum of the truncated terms is exact, as
+    # float sums would depend on whether the integral had been calculated before layering
+    # integrals of date-like domains are sums of truncated integers, so updating them is exact, whereas float
+    # integrals are left to be recalculated from the merged arrays, which avoids accumulating rounding errors
+    if date_like and integral_and_mean is not None and integral_and_mean[0] is not None:
+        unit = np.datetime_data(index.dtype)[0]
+        total_length = np.diff(index.values[[0, -1]]).view("int64")[0]
         try:
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore")
-                # integral calculated this way to force an overflow error if required
-                # pandas.TimedeltaIndex * int is not raising an overflow error when it ideally should
-                integral = np.array(
-                    [x * y for x, y in zip(value_sums.index, value_sums)]
-                ).sum()
-                mean = integral / value_sums.sum()
-                self._integral_and_mean = (integral, mean)
-        except (OverflowError, ValueError) as exc:
+            added = _timedelta_integral(added_lengths.view("int64"), added_values)
+            removed = _timedelta_integral(removed_lengths.view("int64"), removed_values)
+            integral = (
+                integral_and_mean[0] // pd.Timedelta(1, unit=unit)
+                + int(added)
+                - int(removed)
+            )
+        except OverflowError:
             integral = None
-            mean = ((value_sums / value_sums.sum()) * value_sums.index).sum()
-            self._integral_and_mean = (integral, mean)
-            raise exc
+        if integral is not None and abs(integral) < 2**63:
+            self._integral_and_mean = (
+                pd.Timedelta(integral, unit=unit),
+                integral / total_length,
+            )
+
+    if min_and_max is not None:
+        self._min_and_max = [None, None]
+        for position, ufunc in enumerate((np.fmin, np.fmax)):
+            extreme = min_and_max[position]
+            if extreme is None:
+                continue
+            removed_extreme = ufunc.reduce(removed_values)
+            added_extreme = ufunc.reduce(added_values)
+            # the extreme is attained outside of the changed intervals, or the changed intervals are no less extreme
+            if (
+                extreme != removed_extreme
+                or ufunc(added_extreme, removed_extreme) == added_extreme
+            ):
+                self._min_and_max[position] = ufunc(extreme, added_extreme)
+
+    if value_sums is not None and index.dtype.kind in "imM":
+        self.dist._update_value_sums(
+            value_sums,
+            np.concatenate([removed_values, added_values]),
+            np.concatenate([-removed_lengths, added_lengths]),
+        )
 
 
 @Appender(docstrings.integral_docstring, join="\n", indents=1)
@@ -70,7 +170,7 @@ def value_sums(self, dropna=True, group=True):
         return None
 
     value_sums = pd.Series(
-        np.diff(self._data.index.values), index=self._get_values().iloc[:-1]
+        np.diff(self._data.index.values), index=self._get_values_array()[:-1]
     )
     # .values used to avoid a strange numpy Future Warning
     if group:
@@ -92,15 +192,30 @@ def mode(self):
 
 @Appender(docstrings.var_docstring, join="\n", indents=1)
 def var(self):
-    percentile_minus_mean = self.dist.percentile - mean(self)
-    values = percentile_minus_mean._get_values()
-    squared_values = values * values
-    return (
-        sc.Stairs._new(
-            initial_value=0,
-            data=pd.DataFrame({"value": squared_values}),
-        ).agg("integral", (0, 100))
-        / 100
+    if self._var is None:
+        _cache_var(self)
+    return self._var
+
+
+def _cache_var(self):
+    if self._data is None or len(self._data) < 2:
+        self._var = np.nan
+        return
+    values = self._get_values_array()[:-1]
+    lengths = np.diff(self._data.index.values).astype(float)
+    defined = ~np.isnan(values)
+    values, lengths = values[defined], lengths[defined]
+    total_length = lengths.sum()
+    if total_length == 0:
+        self._var = np.nan
+        return
+    # two-pass, with the compensating term removing the rounding error in the mean
+    deviations = values - np.dot(lengths, values) / total_length
+    weighted = lengths * deviations
+    self._var = np.maximum(
+        (np.dot(weighted, deviations) - weighted.sum() ** 2 / total_length)
+        / total_length,
+        0.0,
     )
 
 
@@ -120,22 +235,128 @@ def values_in_range(self, where=(-inf, inf), closed=None):
     left_index, right_index = _get_slice_index(self, lower, upper, lower_how, upper_how)
     if right_index == -1:
         return np.array([self.initial_value])
-    values = self._get_values().iloc[max(0, left_index) : right_index]
+    values = self._get_values_array()[max(0, left_index) : right_index]
     if left_index < 0 and not np.isnan(self.initial_value):
         values = np.append([self.initial_value], values)
     unique = np.unique(values)
     return unique[~np.isnan(unique)]
 
 
+# the number of consecutive values, in a range index, summarised by the prefix and suffix extremes
+_RANGE_BLOCK_SIZE = 64
+
+
+def _get_range_index(self):
+    # built on first use, and discarded by _clear_cache when the step function changes
+    if self._range_index is None:
+        self._range_index = _make_range_index(self)
+    return self._range_index
+
+
+def _make_range_index(self):
+    # Returns a tuple of the values of the step function, starting with the initial value, and
+    # a dictionary which maps each of np.fmin and np.fmax to
+    #  - the extremes of the values in each block, from the start of the block to each value,
+    #  - the extremes of the values in each block, from each value to the end of the block, and
+    #  - a sparse table, whose k-th row holds the extremes over 2**k consecutive blocks.
+    # NaN values are ignored, unless they are the only values in a range.
+    values = np.append(self.initial_value, self._get_values_array()).astype("float64")
+    num_blocks = -(-len(values) // _RANGE_BLOCK_SIZE)
+    blocks = np.full(num_blocks * _RANGE_BLOCK_SIZE, np.nan)
+    blocks[: len(values)] = values
+    blocks = blocks.reshape(num_blocks, _RANGE_BLOCK_SIZE)
+    extremes = {}
+    for ufunc in (np.fmin, np.fmax):
+        from_start = ufunc.accumulate(blocks, axis=1).ravel()
+        from_end = ufunc.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+        table = np.full((max(num_blocks.bit_length(), 1), num_blocks), np.nan)
+        table[0] = ufunc.reduce(blocks, axis=1)
+        for k in range(1, len(table)):
+            width = 2 ** (k - 1)
+            table[k, : num_blocks - 2 * width + 1] = ufunc(
+                table[k - 1, : num_blocks - 2 * width + 1],
+                table[k - 1, width : num_blocks - width + 1],
+            )
+        extremes[ufunc] = (from_start, from_end, table)
+    return values, extremes
+
+
+def _range_extremes(range_index, ufunc, start, stop):
+    # Returns the extremes of values[start:stop], for arrays of positions in the values of the range index,
+    # where ufunc is np.fmin or np.fmax.  The result is NaN for an empty range, or one with only NaN values.
+    values, extremes = range_index
+    from_start, from_end, table = extremes[ufunc]
+    start = np.asarray(start, dtype="int64")
+    stop = np.asarray(stop, dtype="int64")
+    result = np.full(len(start), np.nan)
+    nonempty = start < stop
+    first_block = start // _RANGE_BLOCK_SIZE
+    last_block = (stop - 1) // _RANGE_BLOCK_SIZE
+
+    # ranges spanning blocks combine the ends of the first and last blocks, and the blocks between
+    spanning = np.flatnonzero(nonempty & (first_block < last_block))
+    result[spanning] = ufunc(from_end[start[spanning]], from_start[stop[spanning] - 1])
+    inner_first = first_block[spanning] + 1
+    inner_count = last_block[spanning] - inner_first
+    has_inner = inner_count > 0
+    spanning, inner_first, inner_count = (
+        spanning[has_inner],
+        inner_first[has_inner],
+        inner_count[has_inner],
+    )
+    level = np.floor(np.log2(inner_count)).astype("int64")
+    inner = ufunc(
+        table[level, inner_first],
+        table[level, inner_first + inner_count - 2**level],
+    )
+    result[spanning] = ufunc(result[spanning], inner)
+
+    # ranges within a block are reduced directly, in order of their start so that the
+    # ranges between them, which np.ufunc.reduceat also reduces, do not overlap
+    within = np.flatnonzero(nonempty & (first_block == last_block))
+    if len(within):
+        within = within[np.argsort(start[within], kind="stable")]
+        bounds = np.column_stack((start[within], stop[within])).ravel()
+        padded = np.append(values[: stop[within].max()], np.nan)
+        result[within] = ufunc.reduceat(padded, bounds)[::2]
+    return result
+
+
+def _extreme(self, ufunc, where, closed):
+    where = _replace_none_with_infs(where)
+    if closed is None:
+        closed = self._closed
+    if self._data is None:
+        return ufunc.reduce([self.initial_value])
+    if _scalar_bound(where[0]) is None and _scalar_bound(where[1]) is None:
+        return _global_extreme(self, ufunc)
+    lower_how, upper_how = _get_lims(self, closed)
+    left_index, right_index = _get_slice_index(self, *where, lower_how, upper_how)
+    # the values of the range index are offset by the initial value
+    return _range_extremes(
+        _get_range_index(self), ufunc, [left_index + 1], [right_index + 1]
+    )[0]
+
+
+def _global_extreme(self, ufunc):
+    # the minimum and maximum of the whole step function are cached separately,
+    # as layer may be able to update one but not the other
+    if self._min_and_max is None:
+        self._min_and_max = [None, None]
+    position = int(ufunc is np.fmax)
+    if self._min_and_max[position] is None:
+        self._min_and_max[position] = ufunc.reduce(
+            np.append(self.initial_value, self._get_values_array()), dtype="float64"
+        )
+    return self._min_and_max[position]
+
+
 def _min(
     self,
     where=(-inf, inf),
     closed=None,
 ):
-    where = _replace_none_with_infs(where)
-    if closed is None:
-        closed = self._closed
-    return min(self.values_in_range(where, closed))
+    return _extreme(self, np.fmin, where, closed)
 
 
 def _max(
@@ -143,17 +364,429 @@ def _max(
     where=(-inf, inf),
     closed=None,
 ):
+    return _extreme(self, np.fmax, where, closed)
+
+
+def _get_window_index(self):
+    # built on first use, and discarded by _clear_cache when the step function changes
+    if self._window_index is None:
+        self._window_index = _make_window_index(self)
+    return self._window_index
+
+
+def _make_window_index(self):
+    # Returns None if there are no step points, which leaves the type of the domain unknown.
+    # Otherwise returns a tuple of
+    #  - the step points, as floats (date-like domains are converted to integers of their unit,
+    #    relative to the first step point, so that they are exact when converted to floats),
+    #  - the value on each interval between step points, starting with the initial value, relative to
+    #    a reference value, with NaN replaced by 0,
+    #  - 1 for each interval on which the step function is defined, 0 otherwise,
+    #  - the squares of these relative values,
+    #  - the integral, the integral of the squared values, and the length of the domain where defined,
+    #    from the first step point to each step point,
+    #  - the first and last step points where the value changes,
+    #  - the reference value, which is one of the values of the step function, so that the integrals
+    #    of squared values do not cancel catastrophically when calculating variances,
+    #  - the integer window index, if the domain is date-like (see _make_timedelta_window_index),
+    #  - the first step point, as an integer, if the domain is date-like,
+    #  - whether the step function is undefined anywhere, and
+    #  - the dtype of the domain, if date-like.
+    if self._data is None:
+        return None
+    domain_dtype = None
+    timedelta_index = None
+    origin = 0
+    index_values = self._data.index.values
+    values = np.append(self.initial_value, self._get_values_array()).astype("float64")
+    if index_values.dtype.kind in "mM":
+        domain_dtype = index_values.dtype
+        index_values = index_values.view("int64")
+        origin = index_values[0]
+        index_values = index_values - origin
+        timedelta_index = _make_timedelta_window_index(index_values, values)
+    points = index_values.astype("float64")
+    changes = np.flatnonzero(np.diff(values))
+    first_change = points[changes[0]] if len(changes) else np.inf
+    last_change = points[changes[-1]] if len(changes) else -np.inf
+    isna = np.isnan(values)
+    interior = values[1:-1][~isna[1:-1]]
+    reference = np.sort(interior)[len(interior) // 2] if len(interior) else 0.0
+    values = values - reference
+    values[isna] = 0
+    squares = values * values
+    defined = (~isna).astype("float64")
+    widths = np.diff(points)
+    cumulative = np.zeros((3, len(points)))
+    np.cumsum(values[1:-1] * widths, out=cumulative[0, 1:])
+    np.cumsum(squares[1:-1] * widths, out=cumulative[1, 1:])
+    np.cumsum(defined[1:-1] * widths, out=cumulative[2, 1:])
+    return (
+        points,
+        values,
+        squares,
+        defined,
+        cumulative[0],
+        cumulative[1],
+        cumulative[2],
+        first_change,
+        last_change,
+        reference,
+        timedelta_index,
+        origin,
+        isna.any(),
+        domain_dtype,
+    )
+
+
+def _truncated_terms(lengths, values):
+    # the terms of an integral over a date-like domain, truncated as in _timedelta_integral, with
+    # undefined values contributing nothing, or None if a term does not fit in an int64
+    terms = lengths.astype("float64") * values
+    terms[np.isnan(terms)] = 0
+    if len(terms) and np.abs(terms).max() >= 2**63:
+        return None
+    return terms.astype("int64")
+
+
+def _make_timedelta_window_index(points, values):
+    # For date-like domains, integrals over windows are calculated in integers of the domain's unit,
+    # with each term truncated, over the intervals of the step function clipped to the window, so that the
+    # results are the same as for the clipped step function, which floats cannot guarantee beyond 2**53.
+    # Returns None if a term does not fit in an int64.  Otherwise returns a tuple of
+    #  - the step points, relative to the first step point, where the value changes, as clipping removes
+    #    the others,
+    #  - the value on each interval between these step points, starting with the initial value,
+    #  - the truncated integral, its approximation as a float, and the length of the domain where
+    #    defined, from the first of these step points to each of them,
+    #  - the integral and the length of the domain where defined, from the first step point to the last,
+    #    as for windows which are unbounded on both sides, or None if the integral does not fit in an int64.
+    widths = np.diff(points)
+    interior = values[1:-1]
+    try:
+        total = (
+            _timedelta_integral(
+                widths[~np.isnan(interior)], interior[~np.isnan(interior)]
+            ),
+            widths[~np.isnan(interior)].sum(),
+        )
+    except OverflowError:
+        total = None
+    isna = np.isnan(values)
+    changes = np.flatnonzero(~((values[:-1] == values[1:]) | (isna[:-1] & isna[1:])))
+    points = points[changes]
+    values = np.append(values[0], values[changes + 1])
+    widths = np.diff(points)
+    interior = values[1:-1]
+    terms = _truncated_terms(widths, interior)
+    if terms is None:
+        return None
+    cumulative = np.zeros((2, len(points)), dtype="int64")
+    # int64 addition wraps around, so differences of the cumulative sums are exact when they fit
+    np.cumsum(terms, out=cumulative[0, 1:])
+    np.cumsum(np.where(np.isnan(interior), 0, widths), out=cumulative[1, 1:])
+    approximate = np.zeros(len(points))
+    np.cumsum(terms.astype("float64"), out=approximate[1:])
+    return points, values, cumulative[0], approximate, cumulative[1], total
+
+
+def _window_bounds(bounds, domain_dtype, origin, unbounded):
+    # Converts window bounds to floats comparable with the points of the window index.  For date-like
+    # domains the bounds are also returned as integers relative to the origin, which are exact, with 0 for
+    # unbounded sides, and otherwise None is returned in their place.
+    if domain_dtype is None:
+        bounds = np.asarray(bounds, dtype="float64")
+        return np.where(np.isnan(bounds), unbounded, bounds), None
+    convert = pd.to_datetime if domain_dtype.kind == "M" else pd.to_timedelta
+    bounds = np.asarray(convert(bounds).values)
+    isnat = np.isnat(bounds)
+    bounds = bounds.astype(domain_dtype).view("int64")
+    integers = np.where(isnat, 0, bounds - origin)
+    floats = integers.astype("float64")
+    floats[isnat] = unbounded
+    return floats, integers
+
+
+def _window_integrals_and_lengths(window_index, lower, upper, squared=False):
+    # The integral over a window is calculated as for the step function clipped to the window,
+    # where an unbounded side extends to the outermost change in value on that side, or to the outermost
+    # step point if both sides are unbounded.  Windows are undefined if the clipped step function has
+    # fewer than two step points, or no interval where it is defined.  The length of a window excludes
+    # intervals where the step function is undefined.  Unbounded windows are not supported
+    # if the step function is undefined anywhere.  If *squared* then the integrals of the
+    # squared deviations from the mean over each window are also returned.
+    (
+        points,
+        values,
+        squares,
+        defined,
+        cumulative_integral,
+        cumulative_square_integral,
+        cumulative_length,
+        first_change,
+        last_change,
+        reference,
+        _,
+        _,
+        has_na,
+        _,
+    ) = window_index
+    lower_unbounded, upper_unbounded = np.isinf(lower), np.isinf(upper)
+    lower = np.where(
+        lower_unbounded,
+        np.where(upper_unbounded, points[0], first_change),
+        lower,
+    )
+    upper = np.where(
+        upper_unbounded,
+        np.where(lower_unbounded, points[-1], last_change),
+        upper,
+    )
+    # the window starts in the interval to the left of points[start]
+    # and ends in the interval to the left of points[end]
+    start = np.searchsorted(points, lower, side="right")
+    end = np.searchsorted(points, upper, side="left")
+    spans = start < end
+    span_start, span_end = start[spans], end[spans]
+
+    def integrate(values, cumulative):
+        result = values[start] * (upper - lower)
+        result[spans] = (
+            (cumulative[span_end - 1] - cumulative[span_start])
+            + values[span_start] * (points[span_start] - lower[spans])
+            + values[span_end] * (upper[spans] - points[span_end - 1])
+        )
+        return result
+
+    with np.errstate(invalid="ignore", over="ignore"):
+        integrals = integrate(values, cumulative_integral)
+        if has_na:
+            lengths = integrate(defined, cumulative_length)
+        else:
+            lengths = upper - lower
+        if squared:
+            # the squared deviations from the mean, which is the same for the relative values
+            square_integrals = integrate(squares, cumulative_square_integral)
+            square_integrals -= integrals * integrals / lengths
+        integrals += reference * lengths
+    undefined = ~(lower < upper) | (lengths <= 0)
+    integrals[undefined] = np.nan
+    lengths[undefined] = np.nan
+    if squared:
+        return integrals, lengths, square_integrals
+    return integrals, lengths
+
+
+def _window_timedelta_integrals_and_lengths(
+    timedelta_index, lower, upper, lower_unbounded, upper_unbounded
+):
+    # As _window_integrals_and_lengths, for date-like domains, with integers of the domain's unit as bounds.
+    # Returns None if an integral does not fit in an int64, otherwise the integrals and lengths as int64
+    # arrays, and whether each window is undefined.
+    (
+        points,
+        values,
+        cumulative_integral,
+        approximate_integral,
+        cumulative_length,
+        total,
+    ) = timedelta_index
+    both_unbounded = lower_unbounded & upper_unbounded
+    if len(points) == 0 and (lower_unbounded | upper_unbounded).any():
+        return None
+    if total is None and both_unbounded.any():
+        return None
+    if len(points):
+        lower = np.where(lower_unbounded, points[0], lower)
+        upper = np.where(upper_unbounded, points[-1], upper)
+    start = np.searchsorted(points, lower, side="right")
+    end = np.searchsorted(points, upper, side="left")
+    spans = start < end
+    span_start, span_end = start[spans], end[spans]
+    defined = ~np.isnan(values)
+
+    def integrate(first, last, cumulative):
+        # first and last are the terms of the intervals which contain the bounds, or all of a window
+        # which is within a single interval
+        result = first.copy()
+        result[spans] = (
+            cumulative[span_end - 1] - cumulative[span_start] + first[spans] + last
+        )
+        return result
+
+    first_lengths = np.where(spans, np.append(points, 0)[start] - lower, upper - lower)
+    last_lengths = upper[spans] - points[span_end - 1]
+    first_terms = _truncated_terms(first_lengths, values[start])
+    last_terms = _truncated_terms(last_lengths, values[span_end])
+    if first_terms is None or last_terms is None:
+        return None
+    approximate = integrate(
+        first_terms.astype("float64"),
+        last_terms.astype("float64"),
+        approximate_integral,
+    )
+    if (np.abs(approximate) >= 2**62).any():
+        return None
+    integrals = integrate(first_terms, last_terms, cumulative_integral)
+    lengths = integrate(
+        np.where(defined[start], first_lengths, 0),
+        np.where(defined[span_end], last_lengths, 0),
+        cumulative_length,
+    )
+    if both_unbounded.any():
+        integrals[both_unbounded], lengths[both_unbounded] = total
+    undefined = ~(lower < upper) | (lengths <= 0)
+    undefined[both_unbounded] = lengths[both_unbounded] <= 0
+    return integrals, lengths, undefined
+
+
+def _window_agg(self, func, lower, upper):
+    # Evaluates integral, mean or std over windows, using the window index.  Returns None if
+    # the windows cannot be evaluated this way, in which case the step function should be clipped.
+    window_index = _get_window_index(self)
+    if window_index is None:
+        return None
+    timedelta_index, origin, has_na, domain_dtype = window_index[-4:]
+    lower, lower_integers = _window_bounds(lower, domain_dtype, origin, -np.inf)
+    upper, upper_integers = _window_bounds(upper, domain_dtype, origin, np.inf)
+    if has_na and not (np.isfinite(lower).all() and np.isfinite(upper).all()):
+        return None
+    if lower.shape != upper.shape:
+        raise ValueError("'lower' and 'upper' must have the same length.")
+    if domain_dtype is not None:
+        # compared as integers, which are exact, where both sides are bounded
+        bounded = np.isfinite(lower) & np.isfinite(upper)
+        ordered = lower < upper
+        ordered[bounded] = lower_integers[bounded] < upper_integers[bounded]
+    else:
+        ordered = lower < upper
+    if not ordered.all():
+        raise ValueError("'lower' must be strictly less than 'upper'.")
+    if timedelta_index is not None and func is not std:
+        result = _window_timedelta_integrals_and_lengths(
+            timedelta_index,
+            lower_integers,
+            upper_integers,
+            np.isinf(lower),
+            np.isinf(upper),
+        )
+        if result is not None:
+            return _timedelta_window_result(func, domain_dtype, *result)
+    if func is std:
+        integrals, lengths, square_integrals = _window_integrals_and_lengths(
+            window_index, lower, upper, squared=True
+        )
+        return np.sqrt(np.maximum(square_integrals / lengths, 0))
+    integrals, lengths = _window_integrals_and_lengths(window_index, lower, upper)
+    if func is mean:
+        return integrals / lengths
+    if domain_dtype is None:
+        return integrals
+    if (np.abs(integrals) >= 2**63).any():
+        raise OverflowError(
+            "Integral calculation results in overflow error.  Consider scaling down step function values to accommodate."
+        )
+    unit = np.datetime_data(domain_dtype)[0]
+    return np.asarray(pd.to_timedelta(integrals, unit=unit).values)
+
+
+def _timedelta_window_result(func, domain_dtype, integrals, lengths, undefined):
+    if func is mean:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            result = integrals / lengths
+        result[undefined] = np.nan
+        return result
+    unit = np.datetime_data(domain_dtype)[0]
+    result = np.asarray(pd.to_timedelta(integrals, unit=unit).values)
+    result[undefined] = np.timedelta64("NaT")
+    return result
+
+
+def _rolling_focal_points(clipped, left_delta, right_delta):
+    # the focal points where either bound of the window meets a step point
+    step_points = clipped._data.index
+    # the union of sorted indexes is a merge, and the window bounds are then in sorted order
+    return pd.Index.union(step_points - left_delta, step_points - right_delta)
+
+
+def _rolling_agg(self, func, window, where):
+    # evaluates integral, mean or std over a rolling window, at the focal points where these change gradient
     where = _replace_none_with_infs(where)
-    if closed is None:
-        closed = self._closed
-    return max(self.values_in_range(where, closed))
+    assert len(window) == 2, "Window should be a listlike object of length 2."
+    left_delta, right_delta = window
+    lower, upper = where
+    clipped = self.clip(lower, upper)
+    if clipped._data is None:
+        value = clipped.initial_value
+        if func is integral:
+            value = value * (right_delta - left_delta)
+        elif func is std:
+            value = np.nan if np.isnan(value) else 0.0
+        return pd.Series([value] * 2, index=where)
+    focal_points = _rolling_focal_points(clipped, left_delta, right_delta)
+    s = pd.Series(
+        _window_agg(
+            clipped,
+            func,
+            focal_points + left_delta,
+            focal_points + right_delta,
+        ),
+        index=focal_points,
+    )
+    if lower != -inf:
+        s = s.loc[s.index >= lower - left_delta]
+    if upper != inf:
+        s = s.loc[s.index <= upper - right_delta]
+    return s
+
+
+def _rolling_extremes(self, ufunc, window, where):
+    # the step function of extremes over a rolling window, where ufunc is np.fmin or np.fmax
+    where = _replace_none_with_infs(where)
+    assert len(window) == 2, "Window should be a listlike object of length 2."
+    left_delta, right_delta = window
+    if not left_delta <= right_delta:
+        raise ValueError("The left boundary of the window must not exceed the right.")
+    lower, upper = where
+    clipped = self.clip(lower, upper)
+    if clipped._data is None:
+        return clipped.copy()
+    focal_points = _rolling_focal_points(clipped, left_delta, right_delta)
+    # between consecutive focal points the window meets the same intervals, which are found from the midpoint
+    midpoints = focal_points[:-1] + (focal_points[1:] - focal_points[:-1]) / 2
+    index = clipped._data.index
+    extremes = _range_extremes(
+        _get_range_index(clipped),
+        ufunc,
+        index.searchsorted(midpoints + left_delta, side="right"),
+        index.searchsorted(midpoints + right_delta, side="right") + 1,
+    )
+    # beyond the last focal point the window only meets the last interval
+    values = np.append(extremes, clipped._get_values_array()[-1])
+    result = sc.Stairs._new(
+        initial_value=clipped.initial_value,
+        data=StairsData(focal_points, value=values),
+        closed=self.closed,
+    )
+    result._remove_redundant_step_points()
+    return result.clip(
+        lower if lower == -inf else lower - left_delta,
+        upper if upper == inf else upper - right_delta,
+    )
+
+
+def _scalar_bound(bound):
+    # replaces staircase's infinities, which numpy and pandas do not recognise
+    if bound is inf or bound is neginf:
+        return None
+    return bound
 
 
 @Appender(docstrings.agg_docstring, join="\n", indents=1)
 def agg(self, name, where=(-inf, inf), closed=None):
 
     where = _replace_none_with_infs(where)
-    stairs = self if where == (-inf, inf) else self.clip(*where)
+    clipped = []
 
     def apply(func):
         if isinstance(func, str):
@@ -163,14 +796,58 @@ def agg(self, name, where=(-inf, inf), closed=None):
             name = func.__name__
         if name in ("min", "max"):
             return name, func(self, where=where, closed=closed)
-        else:
-            return name, func(stairs)
+        if where == (-inf, inf):
+            return name, func(self)
+        if func in (integral, mean):
+            lower, upper = map(_scalar_bound, where)
+            result = _window_agg(self, func, [lower], [upper])
+            if result is not None:
+                result = result[0]
+                if isinstance(result, np.timedelta64):
+                    result = np.nan if np.isnat(result) else pd.Timedelta(result)
+                return name, result
+        if not clipped:
+            clipped.append(self.clip(*where))
+        return name, func(clipped[0])
 
     if is_list_like(name):
         return pd.Series({func: calc for func, calc in map(apply, name)})
     return apply(name)[1]
 
 
+@Appender(docstrings.window_agg_docstring, join="\n", indents=1)
+def window_agg(self, name, lower, upper):
+    if is_list_like(name):
+        return pd.DataFrame(
+            {func: window_agg(self, func, lower, upper) for func in name}
+        )
+    func = _get_stairs_method(name) if isinstance(name, str) else name
+    if func in (integral, mean):
+        result = _window_agg(self, func, lower, upper)
+        if result is not None:
+            return result
+    lower = [None if pd.isna(bound) else bound for bound in lower]
+    upper = [None if pd.isna(bound) else bound for bound in upper]
+    if len(lower) != len(upper):
+        raise ValueError("'lower' and 'upper' must have the same length.")
+    results = [self.agg(name, where) for where in zip(lower, upper)]
+    return pd.Series(results, dtype=object).infer_objects().to_numpy()
+
+
+def _pair_domain(self, other, where):
+    # infinite bounds are replaced by the first, or last, step point of either step function, so that
+    # the means of both step functions, and of their product, are taken over the same domain
+    indexes = [s._data.index for s in (self, other) if s._data is not None]
+    if not indexes:
+        return where
+    lower, upper = where
+    if lower == -inf:
+        lower = min(index[0] for index in indexes)
+    if upper == inf:
+        upper = max(index[-1] for index in indexes)
+    return [lower, upper]
+
+
 @Appender(examples.cov_example, join="\n", indents=1)
 def cov(self, other, where=(-inf, inf), lag=0, clip="pre"):
     """
@@ -185,8 +862,9 @@ def cov(self, other, where=(-inf, inf), lag=0, clip="pre"):
     other: :class:`Stairs`
         the stairs instance with which to compute the covariance
     where : tuple or list of length two, optional
-    Indicates the domain interval over which to perform the calculation.
-        Default is (-sc.inf, sc.inf) or equivalently (None, None).
+        Indicates the domain interval over which to perform the calculation.
+        Default is (-sc.inf, sc.inf) or equivalently (None, None).  An infinite bound is
+        replaced by the first, or last, step point of either step function.
     lag : int, float, pandas.Timedelta
         A pandas.Timedelta is only valid when domain is date-like.
     clip : {'pre', 'post'}, default 'pre'
@@ -212,6 +890,9 @@ def cov(self, other, where=(-inf, inf), lag=0, clip="pre"):
     mask = self.isna() | other.isna()
     self = self.mask(mask)
     other = other.mask(mask)
+    where = _pair_domain(self, other, where)
+    if not where[0] < where[1]:
+        return np.nan
     return (self * other).clip(*where).mean() - self.clip(*where).mean() * other.clip(
         *where
     ).mean()
@@ -234,7 +915,8 @@ def corr(self, other, where=(-inf, inf), lag=0, clip="pre"):
         the stairs instance with which to compute the correlation
     where : tuple or list of length two, optional
         Indicates the domain interval over which to perform the calculation.
-        Default is (-sc.inf, sc.inf) or equivalently (None, None).
+        Default is (-sc.inf, sc.inf) or equivalently (None, None).  An infinite bound is
+        replaced by the first, or last, step point of either step function.
     lag : int, float, pandas.Timedelta
         A pandas.Timedelta is only valid when domain is date-like.
     clip : {'pre', 'post'}, default 'pre'
@@ -260,6 +942,9 @@ def corr(self, other, where=(-inf, inf), lag=0, clip="pre"):
     mask = self.isna() | other.isna()
     self = self.mask(mask)
     other = other.mask(mask)
+    where = _pair_domain(self, other, where)
+    if not where[0] < where[1]:
+        return np.nan
     denominator = self.clip(*where).std() * other.clip(*where).std()
     if denominator == 0:
         return np.nan
@@ -0,0 +1,277 @@
+from __future__ import annotations
+
+import datetime
+import heapq
+
+import numpy as np
+import pandas as pd
+from typing_extensions import Literal
+
+from staircase.core.data import StairsData
+from staircase.core.stairs import Stairs
+
+# the capacity of the step point arrays when they are first allocated
+_INITIAL_CAPACITY = 64
+
+
+class StreamingStairs(Stairs):
+    """
+    A step function which is built from intervals that arrive in order of their start points.
+
+    Each call to :meth:`Stairs.layer` sorts and aggregates all step changes of the step function.
+    When intervals arrive in order of their start points, for example from a message queue,
+    :meth:`StreamingStairs.append` can instead add each interval in amortised constant time.
+    The step points and step changes are held in arrays whose capacity doubles when full, and
+    the ends of intervals which are later than the most recent start point are held separately
+    until a later start point passes them.
+
+    A retention policy bounds the memory used by a step function which is appended to indefinitely.
+    Step points older than *max_age* before the latest start point, or beyond the most recent
+    *max_steps*, are discarded when an interval is appended.  Their step changes are added to
+    :attr:`initial_value`, so the step function is unchanged after the latest step point discarded,
+    and constant before it.  The retained step points are moved to the start of the arrays when
+    they are next reallocated, so that memory use does not grow.
+
+    A StreamingStairs is a :class:`Stairs`, and supports all of its methods which do not change
+    the step function, such as sampling, clipping and statistics.  Methods which change the step
+    function in place, such as :meth:`Stairs.layer`, are not supported.  Numerical step points
+    are stored as floats.
+
+    Parameters
+    ----------
+    initial_value : int or float, default 0
+        The value of the step function at negative infinity.
+    closed : {"left", "right"}, default "left"
+        Indicates whether the half-open intervals comprising the step function should be interpreted
+        as left-closed or right-closed.
+    max_age : int, float, or timedelta-like, optional
+        If given, step points earlier than the latest start point by more than *max_age* are discarded.
+    max_steps : int, optional
+        If given, only the most recent *max_steps* step points up to the latest start point are retained.
+
+    See Also
+    --------
+    StreamingStairs.append
+    StreamingStairs.to_stairs
+    Stairs.batch
+    """
+
+    class_name = "StreamingStairs"
+
+    def __init__(
+        self,
+        initial_value: float = 0,
+        closed: Literal["left", "right"] = "left",
+        max_age=None,
+        max_steps: int | None = None,
+    ):
+        self._max_age = max_age
+        self._max_steps = max_steps
+        self._points = None
+        self._deltas = None
+        # the step points and step changes are held in positions from _head to _size of the arrays
+        self._head = 0
+        self._size = 0
+        # the number of leading entries of the arrays which are referenced by StairsData instances
+        self._shared = 0
+        self._ends = []
+        self._latest = None
+        self._domain = None
+        self._stale = False
+        super().__init__(initial_value=initial_value, closed=closed)
+
+    @property
+    def _data(self) -> StairsData | None:
+        if self._stale:
+            self._stale = False
+            self._step_data = self._make_data()
+        return self._step_data
+
+    @_data.setter
+    def _data(self, data: StairsData | None):
+        # only used to store step changes, or values, derived for the current step points
+        self._step_data = data
+        self._pending_deltas = None
+
+    def _to_point(self, point) -> int | float:
+        # date-like step points are held as integer nanoseconds, from the epoch in UTC for datetimes
+        if isinstance(point, (datetime.datetime, np.datetime64)):
+            point = pd.Timestamp(point)
+            domain = ("datetime", point.tz)
+        elif isinstance(point, (datetime.timedelta, np.timedelta64)):
+            point = pd.Timedelta(point)
+            domain = ("timedelta", None)
+        else:
+            domain = ("numeric", None)
+        if self._domain is None:
+            self._domain = domain
+        elif domain != self._domain:
+            raise TypeError(
+                "Step points must all be numbers, all be timedeltas, or all be datetimes with the same timezone."
+            )
+        return float(point) if domain[0] == "numeric" else point.value
+
+    def _make_index(self, points: np.ndarray) -> pd.Index:
+        kind, tz = self._domain
+        if kind == "numeric":
+            return pd.Index(points)
+        if kind == "timedelta":
+            return pd.TimedeltaIndex(points, dtype="timedelta64[ns]")
+        if tz is None:
+            return pd.DatetimeIndex(points, dtype="datetime64[ns]")
+        return pd.DatetimeIndex(points, dtype=pd.DatetimeTZDtype("ns", tz))
+
+    def _points_dtype(self) -> str:
+        return "float64" if self._domain[0] == "numeric" else "int64"
+
+    def _reallocate(self, capacity: int):
+        # also moves the retained step points to the start of the arrays
+        points = np.empty(capacity, dtype=self._points_dtype())
+        deltas = np.empty(capacity, dtype="float64")
+        size = self._size - self._head
+        if size:
+            points[:size] = self._points[self._head : self._size]
+            deltas[:size] = self._deltas[self._head : self._size]
+        self._points, self._deltas = points, deltas
+        self._head, self._size, self._shared = 0, size, 0
+
+    def _add_delta(self, point: int | float, delta: float):
+        if delta == 0:
+            return
+        last = self._size - 1
+        if last >= self._head and self._points[last] == point:
+            if last < self._shared:
+                self._reallocate(len(self._points))
+                last = self._size - 1
+            self._deltas[last] += delta
+            if self._deltas[last] == 0:
+                self._size = last
+            return
+        if self._points is None:
+            self._reallocate(_INITIAL_CAPACITY)
+        elif self._size == len(self._points):
+            self._reallocate(max(_INITIAL_CAPACITY, 2 * (self._size - self._head)))
+        self._points[self._size] = point
+        self._deltas[self._size] = delta
+        self._size += 1
+
+    def _evict(self):
+        if self._points is None:
+            return
+        size = self._size - self._head
+        count = 0 if self._max_steps is None else max(size - self._max_steps, 0)
+        if self._max_age is not None:
+            if self._domain[0] == "numeric":
+                max_age = float(self._max_age)
+            else:
+                max_age = pd.Timedelta(self._max_age).value
+            horizon = self._latest - max_age
+            points = self._points[self._head : self._size]
+            count = max(count, np.searchsorted(points, horizon))
+        if count:
+            evicted = self._deltas[self._head : self._head + count]
+            self.initial_value = self.initial_value + evicted.sum()
+            self._head += count
+
+    def _make_data(self) -> StairsData | None:
+        if self._domain is None:
+            return None
+        self._shared = max(self._shared, self._size)
+        points = np.empty(0, dtype=self._points_dtype())
+        deltas = np.empty(0, dtype="float64")
+        if self._size:
+            points = self._points[self._head : self._size]
+            deltas = self._deltas[self._head : self._size]
+        if self._ends:
+            # the ends are all later than the step points in the arrays
+            ends = sorted(self._ends)
+            end_points = np.array([end for end, _ in ends], dtype=points.dtype)
+            changes = np.array([change for _, change in ends], dtype="float64")
+            end_points, group_starts = np.unique(end_points, return_index=True)
+            changes = np.add.reduceat(changes, group_starts)
+            nonzero = changes != 0
+            points = np.concatenate([points, end_points[nonzero]])
+            deltas = np.concatenate([deltas, changes[nonzero]])
+        if len(points) == 0:
+            return None
+        return StairsData(self._make_index(points), delta=deltas)
+
+    def append(self, start, end=None, value=None) -> StreamingStairs:
+        """
+        Adds an interval, whose start point is no earlier than that of any interval already appended.
+
+        Parameters
+        ----------
+        start : int, float, or datetime-like
+            Start point of the interval.
+        end : int, float, or datetime-like, optional
+            End point of the interval.  A value of None is interpreted as positive infinity.
+        value : float, default None
+            Value of the interval.  A value of None is equivalent to a value of 1.
+
+        Returns
+        -------
+        :class:`StreamingStairs`
+            The current instance is returned to facilitate method chaining
+
+        Examples
+        --------
+
+        >>> sf = sc.StreamingStairs().append(1, 3).append(2, 4).append(5, 6)
+        >>> sf.step_values
+        1.0    1.0
+        2.0    2.0
+        3.0    1.0
+        4.0    0.0
+        5.0    1.0
+        6.0    0.0
+        Name: value, dtype: float64
+        """
+        value = 1 if value is None else value
+        start = self._to_point(start)
+        if self._latest is not None and start < self._latest:
+            raise ValueError(
+                "Intervals must be appended in order of their start points."
+            )
+        if end is not None:
+            end = self._to_point(end)
+            if end < start:
+                raise ValueError("The end of an interval must not precede its start.")
+        self._latest = start
+        while self._ends and self._ends[0][0] <= start:
+            self._add_delta(*heapq.heappop(self._ends))
+        if end != start:
+            self._add_delta(start, value)
+            if end is not None:
+                heapq.heappush(self._ends, (end, -value))
+        self._evict()
+        self._stale = True
+        self._clear_cache()
+        return self
+
+    def to_stairs(self) -> Stairs:
+        """
+        Returns a :class:`Stairs` instance with the same step function.
+
+        The step points and step changes are shared with the result, rather than copied,
+        unless some appended intervals end after the latest start point.  Appending to the
+        StreamingStairs does not change the result.
+
+        Returns
+        -------
+        :class:`Stairs`
+        """
+        return Stairs._new(
+            initial_value=self.initial_value, data=self._data, closed=self.closed
+        )
+
+    def _raise_append_only(self, *args, **kwargs):
+        raise TypeError(
+            "StreamingStairs can only be changed with append.  Use to_stairs to obtain a Stairs instance."
+        )
+
+    layer = _raise_append_only
+    batch = _raise_append_only
+    __iadd__ = _raise_append_only
+    __isub__ = _raise_append_only
+    __imul__ = _raise_append_only
@@ -260,10 +260,10 @@ Examples
     ...     ax.set_title(title)
 
 >>> s1.cov(s2)
-0.1404958677685951
+0.14049586776859505
 
 >>> s2.cov(s1)
-0.1404958677685951
+0.14049586776859505
 
 >>> s1.cov(s2, where=(0, 6))
 0.125
@@ -295,10 +295,10 @@ Examples
     ...     ax.set_title(title)
 
 >>> s1.corr(s2)
-0.24687803791136045
+0.2859668218573078
 
 >>> s2.corr(s1)
-0.24687803791136045
+0.2859668218573078
 
 >>> s1.corr(s2, where=(0, 6))
 0.27500954910846337
@@ -352,3 +352,84 @@ dtype: float64
     ...     ax.set_title(title)
     ...     ax.legend()
 """
+
+rolling_integral_example = """
+Examples
+--------
+
+>>> s2.rolling_integral(window=[-1, 1])
+-1.0    0.0
+ 1.0    1.0
+ 2.0    0.5
+ 3.0   -1.0
+ 4.0   -2.0
+ 4.5   -2.0
+ 6.5    0.0
+dtype: float64
+
+.. plot::
+    :context: close-figs
+
+    >>> ax = s2.plot()
+    >>> s2.rolling_integral(window=[-1, 1]).plot(ax=ax, label='rolling integral')
+    >>> ax.legend()
+"""
+
+rolling_std_example = """
+Examples
+--------
+
+>>> s2.rolling_std(window=[-1, 1])
+-1.0    0.00
+ 1.0    0.00
+ 2.0    0.25
+ 3.0    0.50
+ 4.0    0.00
+ 4.5    0.00
+ 6.5    0.00
+dtype: float64
+"""
+
+rolling_max_example = """
+Examples
+--------
+
+.. plot::
+    :context: close-figs
+
+    >>> fig, axes = plt.subplots(nrows=1, ncols=2, figsize=(7,3), sharey=True, sharex=True, tight_layout=True)
+    >>> for ax, title, window in zip(axes, ("trailing window", "centred window"), ([-1, 0], [-0.5, 0.5])):
+    ...     s2.plot(ax=ax)
+    ...     s2.rolling_max(window=window).plot(ax=ax, label='rolling max')
+    ...     ax.set_title(title)
+    ...     ax.legend()
+
+>>> s2.rolling_max(window=[-1, 0]).step_values
+0.0    0.5
+3.0    0.0
+4.0   -1.0
+5.5    0.0
+Name: value, dtype: float64
+"""
+
+rolling_min_example = """
+Examples
+--------
+
+.. plot::
+    :context: close-figs
+
+    >>> fig, axes = plt.subplots(nrows=1, ncols=2, figsize=(7,3), sharey=True, sharex=True, tight_layout=True)
+    >>> for ax, title, window in zip(axes, ("trailing window", "centred window"), ([-1, 0], [-0.5, 0.5])):
+    ...     s2.plot(ax=ax)
+    ...     s2.rolling_min(window=window).plot(ax=ax, label='rolling min')
+    ...     ax.set_title(title)
+    ...     ax.legend()
+
+>>> s2.rolling_min(window=[-1, 0], where=(0, 5.5)).step_values
+1.0    0.5
+2.0    0.0
+3.0   -1.0
+5.5    NaN
+Name: value, dtype: float64
+"""
@@ -1,4 +1,3 @@
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 from pandas.plotting import register_matplotlib_converters
@@ -88,6 +87,8 @@ def plot(
     if arrow_kwargs is None:
         arrow_kwargs = {}
     if ax is None:
+        import matplotlib.pyplot as plt
+
         _, ax = plt.subplots()
     frame = self.to_frame()
     if len(frame) == 1:
@@ -22,17 +22,13 @@ def _is_datetime_like(x):
     )
 
 
-def _sanitize_binary_operands(self, other, copy_other=False):
+def _sanitize_binary_operands(self, other):
+    # Binary operations never modify their operands, so Stairs instances
+    # are returned as is, rather than copied
     if not isinstance(self, sc.Stairs):
         self = sc.Stairs(initial_value=self, closed=other.closed)
-    else:
-        self = self.copy()
-
     if not isinstance(other, sc.Stairs):
         other = sc.Stairs(initial_value=other, closed=self.closed)
-    else:
-        if copy_other:
-            other = other.copy()
     return self, other
 
 
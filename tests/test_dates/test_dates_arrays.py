@@ -1,3 +1,5 @@
+import pickle
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -601,3 +603,61 @@ def test_aggregation_with_constant_stairs(func, swap_order):
     s2 = sc.Stairs()
     arr = [s2, s1] if swap_order else [s1, s2]
     func(arr)
+
+
+def test_StairsFrame(date_func):
+    arr = sc.StairsArray([s1(date_func), s2(date_func), s3(date_func)])
+    frame = arr.to_frame()
+    for func_str in ("sum", "max", "median", "logical_and"):
+        assert getattr(frame, func_str)().identical(getattr(arr, func_str)())
+    x = [timestamp(2020, 1, day, date_func=date_func) for day in (1, 3, 7, 12)]
+    pd.testing.assert_frame_equal(frame.sample(x), arr.sample(x), check_dtype=False)
+    where = (x[0], x[-1])
+    np.testing.assert_allclose(frame.cov(where).values, arr.cov(where))
+
+
+def test_corr_cov_constant_stairs(date_func):
+    data = [Stairs(initial_value=1), Stairs()]
+    where = (
+        timestamp(2020, 1, 1, date_func=date_func),
+        timestamp(2020, 1, 12, date_func=date_func),
+    )
+    expected_corr = np.array([[1, np.nan], [np.nan, 1]])
+    np.testing.assert_array_equal(sc.cov(data, where).values, np.zeros((2, 2)))
+    np.testing.assert_array_equal(sc.corr(data, where).values, expected_corr)
+    frame = sc.StairsFrame(data)
+    np.testing.assert_array_equal(frame.cov(where).values, np.zeros((2, 2)))
+    np.testing.assert_array_equal(frame.corr(where).values, expected_corr)
+
+
+def test_StairsArray_pickle(date_func):
+    data = [s1(date_func), s2(date_func), Stairs()]
+    arr = pickle.loads(pickle.dumps(sc.StairsArray(data)))
+    assert arr.nbytes == sc.StairsArray(data).nbytes
+    for x, y in zip(arr, data):
+        assert x.identical(y)
+
+
+def test_StairsArray_element_stats(date_func):
+    data = [s1(date_func), s2(date_func), s3(date_func), s4(date_func)]
+    arr = sc.StairsArray(data)
+    integrals = arr.integrals()
+    assert integrals.dtype.kind == "m"
+    assert [pd.Timedelta(x) for x in integrals] == [s.integral() for s in data]
+    np.testing.assert_allclose(arr.means(), [s.mean() for s in data])
+    np.testing.assert_allclose(arr.maxes(), [s.max() for s in data])
+    np.testing.assert_allclose(
+        arr.percentiles([10, 50, 90]), [s.percentile([10, 50, 90]) for s in data]
+    )
+
+
+def test_StairsArray_mixed_domains():
+    data = [
+        Stairs().layer(1, 3),
+        Stairs().layer(pd.Timestamp("2020"), pd.Timestamp("2020-01-03")),
+    ]
+    arr = pickle.loads(pickle.dumps(sc.StairsArray(data)))
+    for x, y in zip(arr, data):
+        assert x.identical(y)
+    np.testing.assert_allclose(arr.means(), [1, 1])
+    assert list(arr.integrals()) == [2, pd.Timedelta(2, "D")]
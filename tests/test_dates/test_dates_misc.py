@@ -6,7 +6,7 @@ import pytest
 import pytz
 
 import staircase.test_data as test_data
-from staircase import Stairs
+from staircase import Stairs, StreamingStairs
 from staircase.constants import inf
 
 
@@ -356,3 +356,54 @@ def test_from_values(date_func):
     print(sf._data)
     print(s1(date_func)._data)
     assert sf.identical(s1(date_func))
+
+
+def test_batch(date_func):
+    intervals = [
+        ((2020, 1, 1), (2020, 1, 10), 2),
+        ((2020, 1, 3), (2020, 1, 5), 2.5),
+        ((2020, 1, 6), (2020, 1, 7), -2.5),
+        ((2020, 1, 7), (2020, 1, 10), -2.5),
+    ]
+    sf = Stairs()
+    with sf.batch() as batch:
+        for start, end, value in intervals:
+            batch.layer(
+                timestamp(*start, date_func=date_func),
+                timestamp(*end, date_func=date_func),
+                value,
+            )
+    assert_expected_type(sf, date_func)
+    assert sf.identical(s1(date_func))
+
+
+def test_streaming(date_func):
+    intervals = [
+        ((2020, 1, 1), (2020, 1, 10), 2),
+        ((2020, 1, 3), (2020, 1, 5), 2.5),
+        ((2020, 1, 6), (2020, 1, 7), -2.5),
+        ((2020, 1, 7), (2020, 1, 10), -2.5),
+    ]
+    sf = StreamingStairs()
+    for start, end, value in intervals:
+        sf.append(
+            timestamp(*start, date_func=date_func),
+            timestamp(*end, date_func=date_func),
+            value,
+        )
+    assert_expected_type(sf, date_func)
+    assert sf.identical(s1(date_func))
+    assert sf.to_stairs().identical(s1(date_func))
+
+
+def test_streaming_retention(date_func):
+    sf = StreamingStairs(max_age=pd.Timedelta(days=2))
+    for day in range(1, 10):
+        sf.append(
+            timestamp(2020, 1, day, date_func=date_func),
+            timestamp(2020, 1, day + 1, 12, date_func=date_func),
+        )
+    # only the interval starting on the 6th covers the 7th, two days before the latest start
+    assert sf.initial_value == 1
+    assert sf.number_of_steps == 7
+    assert sf.max() == 2
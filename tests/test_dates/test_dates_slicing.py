@@ -16,3 +16,17 @@ def test_slice_month_period_range(freq_str):
     slicer1._create_slices()
     slicer2._create_slices()
     assert all([s1.identical(s2) for s1, s2, in zip(slicer1._slices, slicer2._slices)])
+
+
+def test_slice_integral_long_span():
+    # step points further apart than 2**53 nanoseconds, where floats are not exact
+    points = pd.Timestamp("2000-01-01") + pd.to_timedelta(
+        [0, 2**53 + 1, 2**55 + 7, 2**57 + 3], "ns"
+    )
+    sf = sc.Stairs().layer(points[:-1], points[1:], [1 / 3, 2.7, -0.9])
+    cuts = points[:1].append(points[1:] - pd.Timedelta(1, "ns"))
+    slicer = sf.slice(cuts)
+    integrals, means = slicer.integral(), slicer.mean()
+    slicer._create_slices()
+    assert list(integrals) == [s.integral() for s in slicer._slices]
+    assert list(means) == [s.mean() for s in slicer._slices]
@@ -416,6 +416,50 @@ def test_integral_dates_4(date_func):
     ), "Expected integral to be 132 hours"
 
 
+def test_window_agg_dates(date_func):
+    lower = [
+        None,
+        timestamp(2020, 1, 4, date_func=date_func),
+        timestamp(2020, 1, 4, date_func=date_func),
+    ]
+    upper = [
+        timestamp(2020, 1, 6, date_func=date_func),
+        None,
+        timestamp(2020, 1, 8, date_func=date_func),
+    ]
+    integrals = s1(date_func).window_agg("integral", lower, upper)
+    assert list(integrals / pd.Timedelta("1 h")) == [360, 108, 132]
+    means = s1(date_func).window_agg("mean", lower, upper)
+    assert means == pytest.approx(
+        [s1(date_func).agg("mean", where) for where in zip(lower, upper)]
+    )
+
+
+def test_window_agg_dates_precision():
+    # step points a whole number of nanoseconds apart, which are not exact as floats
+    start = pd.Timestamp("2021-01-01")
+    points = start + pd.to_timedelta([0, 1_693_588_105_513, 3_387_176_211_029], "ns")
+    sf = Stairs().layer(points[:2], points[1:], [3, 2])
+    where = (points[0] + pd.Timedelta(7, "ns"), points[2] - pd.Timedelta(3, "ns"))
+    assert sf.agg("integral", where) == sf.clip(*where).integral()
+    assert sf.agg("mean", where) == sf.clip(*where).mean()
+
+
+def test_window_agg_dates_long_span():
+    # step points further apart than 2**53 nanoseconds, and values which truncate each term
+    start = pd.Timestamp("2000-01-01")
+    offsets = [0, 2**53 + 1, 2**55 + 7, 2**57 + 3]
+    points = start + pd.to_timedelta(offsets, "ns")
+    sf = Stairs().layer(points[:-1], points[1:], [1 / 3, 2.7, -0.9])
+    lower = [None, points[0] + pd.Timedelta(1, "ns"), points[1] - pd.Timedelta(5, "ns")]
+    upper = [points[2] + pd.Timedelta(3, "ns"), None, points[3] + pd.Timedelta(1, "D")]
+    integrals = sf.window_agg("integral", lower, upper)
+    means = sf.window_agg("mean", lower, upper)
+    for i, where in enumerate(zip(lower, upper)):
+        assert integrals[i] == sf.clip(*where).integral()
+        assert means[i] == sf.clip(*where).mean()
+
+
 # low, high = timestamp(2020,1,1, date_func=date_func), timestamp(2020,1,10, date_func=date_func)
 # total_secs = int((high-low).total_seconds())
 # pts = [low + pd.Timedelta(x, unit='sec') for x in np.linspace(0, total_secs, total_secs)]
@@ -958,3 +1002,42 @@ def test_mean_no_overflow():
         .layer(pd.Timestamp("1990"), pd.Timestamp("2060"), 4000)
     )
     s.mean()
+
+
+def test_integral_overflow_partial_sums():
+    # the integral over the first two years does not fit, but the total does
+    s = Stairs().layer(
+        pd.to_datetime(["2020", "2021", "2022", "2023"]),
+        pd.to_datetime(["2021", "2022", "2023", "2024"]),
+        [250, 240, -250, -200],
+    )
+    assert s.integral() == pd.Timedelta(days=366 * 250 - 365 * 10 - 365 * 200)
+
+
+def test_integral_truncates_like_timedelta():
+    s = Stairs().layer(
+        pd.Timestamp("2020"), pd.Timestamp("2020") + pd.Timedelta(5), 1.5
+    )
+    assert s.integral() == pd.Timedelta(5) * 1.5
+
+
+def test_integral_mean_all_masked():
+    s = Stairs().layer(pd.Timestamp("2020"), pd.Timestamp("2021"), 3)
+    s = s.mask((pd.Timestamp("2019"), pd.Timestamp("2022")))
+    assert s.integral() == pd.Timedelta(0)
+    assert np.isnan(s.mean())
+
+
+def test_stats_after_layer():
+    s = Stairs().layer(
+        pd.to_datetime(["2020-01-01", "2020-01-03"]),
+        pd.to_datetime(["2020-01-05", "2020-01-10"]),
+        [2, 1],
+    )
+    s.integral(), s.max(), s.percentile(50)
+    s.layer(pd.Timestamp("2020-01-02"), pd.Timestamp("2020-01-04 06:00"), 1.5)
+    fresh = s.copy()
+    assert s.integral() == fresh.integral()
+    assert s.mean() == fresh.mean()
+    assert s.max() == fresh.max()
+    assert s.percentile.identical(fresh.percentile)
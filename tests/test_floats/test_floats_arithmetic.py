@@ -326,3 +326,72 @@ def test_binary_ops_with_nan(s1_fix, op, nan_pos):
     operands = (np.nan, s1_fix) if nan_pos == "first" else (s1_fix, np.nan)
     result = op(*operands)
     assert result._data is None, "wrong internal representation in resulting Stairs"
+
+
+@pytest.mark.parametrize(
+    "op",
+    [
+        operator.add,
+        operator.sub,
+        operator.mul,
+        operator.truediv,
+    ],
+)
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_binary_ops_random(op, seed):
+    rng = np.random.default_rng(seed)
+    stairs = [
+        Stairs(initial_value=rng.integers(1, 4)).layer(
+            rng.integers(0, 40, 20), rng.integers(40, 80, 20), rng.integers(1, 4, 20)
+        )
+        for _ in range(2)
+    ]
+    points = np.linspace(-1, 81, 165)
+    result = op(*stairs)
+    expected = op(*(s(points) for s in stairs))
+    np.testing.assert_allclose(result(points), expected)
+
+
+@pytest.mark.parametrize(
+    "op, iop",
+    [
+        (operator.add, operator.iadd),
+        (operator.sub, operator.isub),
+        (operator.mul, operator.imul),
+    ],
+)
+@pytest.mark.parametrize("other", ["stairs", "scalar", "nan"])
+def test_inplace_ops(s1_fix, s2_fix, op, iop, other):
+    other = {"stairs": s2_fix, "scalar": 2.5, "nan": s2_fix.mask((2, 3))}[other]
+    expected = op(s1(), other)
+    result = iop(s1_fix, other)
+    assert result is s1_fix
+    assert result.identical(expected)
+    assert s2_fix.identical(s2())
+
+
+def test_inplace_accumulation():
+    rng = np.random.default_rng(0)
+    stairs = [
+        Stairs().layer(
+            rng.integers(0, 40, 10), rng.integers(40, 80, 10), rng.normal(size=10)
+        )
+        for _ in range(50)
+    ]
+    expected = Stairs(initial_value=1)
+    result = Stairs(initial_value=1)
+    for i, sf in enumerate(stairs):
+        if i % 3:
+            expected = expected + sf
+            result += sf
+        else:
+            expected = expected - sf
+            result -= sf
+    assert result.identical(expected)
+    pd.testing.assert_series_equal(result.step_changes, expected.step_changes)
+
+
+def test_inplace_add_self(s1_fix, s2_fix):
+    s1_fix += s2_fix
+    s1_fix += s1_fix
+    assert s1_fix.identical((s1() + s2()) * 2)
@@ -1,3 +1,6 @@
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
@@ -368,6 +371,46 @@ def test_StairsArray_concat_same_type(IS1):
     sc.StairsArray([IS1, None, IS1]).shift()
 
 
+def test_StairsArray_nbytes(IS1, IS2):
+    ia = sc.StairsArray([IS1, None, IS2, sc.Stairs()])
+    packed = pickle.loads(pickle.dumps(ia))
+    assert ia.nbytes == packed.nbytes
+    assert pd.Series(ia, dtype="Stairs").memory_usage(index=False) == ia.nbytes
+
+
+def test_StairsArray_pickle(IS1, IS2):
+    data = [IS1, None, IS2, sc.Stairs(initial_value=2, closed="right")]
+    ia = pickle.loads(pickle.dumps(sc.StairsArray(data)))
+    assert (ia.isna() == np.array([False, True, False, False])).all()
+    for x, y in zip(ia, data):
+        assert (x is None and y is None) or x.identical(y)
+    assert ia[3].closed == "right"
+
+
+def test_StairsArray_unpickle_data_state(IS1, IS2):
+    # earlier versions pickled the array of Stairs instances
+    class PickledState:
+        def __reduce__(self):
+            return object.__new__, (sc.StairsArray,), {"data": data}
+
+    data = np.array([IS1, None, IS2], dtype=object)
+    ia = pickle.loads(pickle.dumps(PickledState()))
+    assert (ia.isna() == np.array([False, True, False])).all()
+    assert ia[0].identical(IS1) and ia[2].identical(IS2)
+    ia = pickle.loads(pickle.dumps(ia))
+    assert ia[0].identical(IS1) and ia[2].identical(IS2)
+
+
+def test_StairsArray_take_packed(IS1, IS2):
+    ia = pickle.loads(pickle.dumps(sc.StairsArray([IS1, None, IS2])))
+    result = sc.StairsArray._concat_same_type(
+        [ia.take([2, -1, 0], allow_fill=True), ia[::2]]
+    )
+    assert (result.isna() == np.array([False, True, False, False, False])).all()
+    for x, y in zip(result, [IS2, None, IS1, IS1, IS2]):
+        assert (x is None and y is None) or x.identical(y)
+
+
 def test_StairsArray_plot(IS1, IS2):
     ia = sc.StairsArray([IS1, IS2])
     ia.plot()
@@ -388,3 +431,266 @@ def test_toplevel_plot(IS1, IS2):
 def test_accessor_plot(IS1, IS2):
     arr = pd.Series([IS1, IS2], dtype="Stairs")
     arr.sc.plot()
+
+
+@pytest.mark.parametrize(
+    "func_str",
+    ["sum", "mean", "median", "min", "max", "logical_or", "logical_and"],
+)
+def test_StairsFrame_aggregation(IS1, IS2, func_str):
+    arr = sc.StairsArray([IS1, IS2, IS1 - IS2])
+    expected = getattr(arr, func_str)()
+    assert getattr(arr.to_frame(), func_str)().identical(expected)
+
+
+def test_StairsFrame_to_array(IS1, IS2):
+    data = [IS1, IS2, sc.Stairs(initial_value=3)]
+    for x, y in zip(sc.StairsArray(data).to_frame().to_array(), data):
+        assert x.identical(y)
+
+
+def test_StairsFrame_labels(IS1, IS2):
+    frame = sc.StairsFrame({"a": IS1, "b": IS2})
+    assert frame["b"].identical(IS2)
+    pd.testing.assert_series_equal(
+        frame.initial_values, pd.Series([0.0, 0.0], index=["a", "b"])
+    )
+    assert frame.step_values.shape == (len(frame.step_points), 2)
+
+
+@pytest.mark.parametrize("func_str", ["sample", "limit"])
+def test_StairsFrame_sample(IS1, IS2, func_str):
+    x = [-5, -4, 1, 2.5, 6.5, 10, 12]
+    arr = sc.StairsArray([IS1, IS2])
+    pd.testing.assert_frame_equal(
+        getattr(arr.to_frame(), func_str)(x),
+        getattr(arr, func_str)(x),
+        check_dtype=False,
+    )
+
+
+@pytest.mark.parametrize("func_str", ["corr", "cov"])
+def test_StairsFrame_corr_cov(IS1, IS2, func_str):
+    arr = sc.StairsArray([IS1, IS2, IS1 + IS2])
+    np.testing.assert_allclose(
+        getattr(arr.to_frame(), func_str)((-4, 10)).values,
+        getattr(arr, func_str)((-4, 10)),
+    )
+
+
+def test_StairsFrame_closed_mismatch(IS1):
+    with pytest.raises(ValueError):
+        sc.StairsFrame([IS1, sc.Stairs(closed="right")])
+
+
+@pytest.mark.parametrize("func_str", ["sum", "mean"])
+def test_sum_mean_matches_agg(IS1, IS2, func_str):
+    arr = sc.StairsArray([IS1, IS2, sc.Stairs(initial_value=1.5), -IS1])
+    result = getattr(arr, func_str)()
+    expected = arr.agg(getattr(np, func_str))
+    assert result.identical(expected)
+
+
+def test_sum_constant_stairs():
+    result = sc.sum([sc.Stairs(initial_value=2), sc.Stairs(initial_value=3)])
+    assert result.identical(sc.Stairs(initial_value=5))
+
+
+def test_sum_cancelling_step_changes():
+    # step changes of 0.1, 0.2 and -0.3 at the same point do not sum to zero in floating point
+    arr = sc.StairsArray(
+        [
+            sc.Stairs().layer(1, 3, 0.1),
+            sc.Stairs().layer(1, 3, 0.2),
+            sc.Stairs().layer([1, 2], [2, 3], [0.3, -0.3]),
+        ]
+    )
+    result = arr.sum()
+    assert list(result.step_points) == [1, 2]
+    assert result.step_values.tolist() == pytest.approx([0.6, 0])
+
+
+def test_sum_no_residual_tail():
+    # the cumulative sum of the step changes 0.1, 0.3, -0.1, 0.2, -0.3 and -0.2 drifts from zero
+    arr = sc.StairsArray(
+        [
+            sc.Stairs().layer(1, 3, 0.1),
+            sc.Stairs().layer(2, 4, 0.2),
+            sc.Stairs().layer(1, 5, 0.3),
+        ]
+    )
+    result = arr.sum()
+    assert list(result.step_points) == [1, 2, 3, 4, 5]
+    assert result.step_values.tolist() == [0.4, 0.6, 0.5, 0.3, 0.0]
+
+
+def test_sum_many_no_residual_tail():
+    rng = np.random.default_rng(0)
+    starts = rng.integers(0, 1000, 500)
+    arr = sc.StairsArray(
+        [
+            sc.Stairs().layer(start, start + length, value)
+            for start, length, value in zip(
+                starts, rng.integers(1, 100, 500), rng.integers(-30, 30, 500) / 10
+            )
+        ]
+    )
+    result = arr.sum()
+    assert result.step_values.iloc[-1] == 0
+
+
+@pytest.mark.parametrize("func_str", ["max", "min", "median"])
+def test_reductions_constant_stairs(func_str):
+    result = getattr(sc, func_str)(
+        [sc.Stairs(initial_value=2), sc.Stairs(initial_value=4)]
+    )
+    expected = {"max": 4, "min": 2, "median": 3}[func_str]
+    assert result.identical(sc.Stairs(initial_value=expected))
+
+
+@pytest.mark.parametrize(
+    "func_str", ["max", "min", "median", "logical_or", "logical_and"]
+)
+@pytest.mark.parametrize("size", [3, 60])
+def test_reductions_match_frame(func_str, size):
+    # many step functions with few step points are reduced with a segment tree
+    rng = np.random.default_rng(0)
+    starts = rng.integers(-20, 20, size)
+    arr = sc.StairsArray(
+        [
+            sc.Stairs(initial_value=i % 2).layer(start, start + 3, i % 3 - 1)
+            for i, start in enumerate(starts)
+        ]
+    )
+    result = getattr(arr, func_str)()
+    expected = getattr(arr.to_frame(), func_str)()
+    assert result.identical(expected)
+
+
+_element_stats = {
+    "integrals": lambda s: s.integral(),
+    "means": lambda s: s.mean(),
+    "maxes": lambda s: s.max(),
+    "mins": lambda s: s.min(),
+    "step_counts": lambda s: s.number_of_steps,
+    "percentiles": lambda s: s.percentile([0, 25, 50, 75, 100]),
+}
+
+
+@pytest.mark.parametrize("method", _element_stats)
+def test_StairsArray_element_stats(IS1, IS2, method):
+    data = [IS1, IS2, Stairs().layer(1, 2), IS1 - IS2, IS1.clip(-2, 5)]
+    args = ([0, 25, 50, 75, 100],) if method == "percentiles" else ()
+    result = getattr(sc.StairsArray(data), method)(*args)
+    expected = [_element_stats[method](s) for s in data]
+    np.testing.assert_allclose(result, np.array(expected, dtype="float64"))
+
+
+@pytest.mark.parametrize("method", ["integrals", "means", "percentiles"])
+def test_StairsArray_element_stats_constant(method):
+    # statistics which are undefined for step functions without at least two step points
+    data = [Stairs(initial_value=2), Stairs().layer(1, None)]
+    args = (50,) if method == "percentiles" else ()
+    result = getattr(sc.StairsArray(data), method)(*args)
+    assert np.isnan(result).all()
+
+
+def test_accessor_element_stats(IS1, IS2):
+    series = pd.Series([IS1, None, IS2], index=["a", "b", "c"], dtype="Stairs")
+    pd.testing.assert_series_equal(
+        series.sc.means(),
+        pd.Series([IS1.mean(), np.nan, IS2.mean()], index=series.index),
+    )
+    pd.testing.assert_series_equal(
+        series.sc.step_counts(),
+        pd.Series(
+            [IS1.number_of_steps, np.nan, IS2.number_of_steps],
+            index=series.index,
+        ),
+    )
+    pd.testing.assert_frame_equal(
+        series.sc.percentiles([10, 90]),
+        pd.DataFrame(
+            [IS1.percentile([10, 90]), [np.nan, np.nan], IS2.percentile([10, 90])],
+            index=series.index,
+            columns=[10, 90],
+        ),
+    )
+
+
+@pytest.mark.parametrize("func_str", ["corr", "cov"])
+@pytest.mark.parametrize("where", [(-4, 10), (0, 12), (2.5, 3)])
+def test_corr_cov_matches_stairs(IS1, IS2, func_str, where):
+    data = [IS1, IS2, IS1 + IS2, IS1.clip(0, 6), sc.Stairs(initial_value=1)]
+    result = getattr(sc.StairsArray(data), func_str)(where)
+    expected = np.array(
+        [
+            [
+                (
+                    1
+                    if func_str == "corr" and i == j
+                    else getattr(Stairs, func_str)(x, y, where=where)
+                )
+                for j, y in enumerate(data)
+            ]
+            for i, x in enumerate(data)
+        ]
+    )
+    np.testing.assert_allclose(result, expected)
+
+
+@pytest.mark.parametrize("func_str", ["corr", "cov"])
+@pytest.mark.parametrize("where", [(-sc.inf, sc.inf), (None, 6), (2, None)])
+def test_corr_cov_default_domain(IS1, IS2, func_str, where):
+    # an unbounded side of the domain of each pair extends to the step points of either step function
+    data = [
+        IS1,
+        IS2,
+        sc.Stairs().layer(1, 3, 2).layer(2, 6, 1),
+        sc.Stairs().layer(4, 9, 3).layer(0, 2, -1),
+        sc.Stairs().layer(20, 30),
+        sc.Stairs(initial_value=1),
+    ]
+    result = getattr(sc.StairsArray(data), func_str)(where)
+    expected = np.array(
+        [
+            [
+                (
+                    1
+                    if func_str == "corr" and i == j
+                    else getattr(Stairs, func_str)(x, y, where=where)
+                )
+                for j, y in enumerate(data)
+            ]
+            for i, x in enumerate(data)
+        ]
+    )
+    np.testing.assert_allclose(result, expected, atol=1e-12)
+
+
+def test_cov_diagonal_matches_var(IS1, IS2):
+    data = [IS1, IS2, IS1.clip(0, 6), sc.Stairs().layer(20, 30)]
+    np.testing.assert_allclose(
+        np.diag(sc.StairsArray(data).cov()), [x.var() for x in data], atol=1e-12
+    )
+
+
+@pytest.mark.parametrize("func_str", ["corr", "cov"])
+@pytest.mark.parametrize("where", [(-sc.inf, sc.inf), (0, 12)])
+def test_corr_cov_parallel(IS1, IS2, func_str, where):
+    data = [IS1, IS2, IS1 + IS2, IS1.clip(0, 6), sc.Stairs(initial_value=1), IS2 * 3]
+    arr = sc.StairsArray(data)
+    expected = getattr(arr, func_str)(where)
+    with ThreadPoolExecutor(2) as executor:
+        result = getattr(arr, func_str)(where, executor=executor)
+    np.testing.assert_allclose(result, expected)
+    result = getattr(sc, func_str)(data, where, n_jobs=2)
+    np.testing.assert_allclose(result.values, expected)
+
+
+@pytest.mark.parametrize("n_jobs", [0, -2, 1.5])
+def test_corr_cov_invalid_n_jobs(IS1, IS2, n_jobs):
+    with pytest.raises(ValueError, match="n_jobs"):
+        sc.corr([IS1, IS2], n_jobs=n_jobs)
+    with pytest.raises(ValueError, match="n_jobs"):
+        sc.StairsArray([IS1, IS2, None]).cov(n_jobs=n_jobs)
@@ -4,7 +4,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from staircase import Stairs
+from staircase import Stairs, StairsBuilder, StreamingStairs
 
 
 def _expand_interval_definition(start, end=None, value=1):
@@ -440,3 +440,135 @@ def test_layering_series_with_different_index():
         check_dtype=False,
     )
     assert result.initial_value == 0
+
+
+def test_layering_cancelling_interval():
+    result = Stairs().layer(1, 2).layer(1, 2, -1)
+    assert result.identical(Stairs())
+    assert result._data is None
+
+
+def test_layering_float_onto_integer_values():
+    result = Stairs().layer([1, 2], [5, 6], -1).layer(16, None, 2.5)
+    expected = Stairs().layer([1, 2], [5, 6], -1.0).layer(16, None, 2.5)
+    assert result.identical(expected)
+    assert result.step_changes.iloc[-1] == 2.5
+    result = Stairs().layer([1, 2], [5, 6]).layer(3, 4, 0.5)
+    assert result.step_changes.tolist() == [1, 1, 0.5, -0.5, -1, -1]
+
+
+def test_step_changes_are_copies(s1_fix):
+    step_values = s1_fix.step_values
+    step_changes = s1_fix.step_changes
+    step_values.iloc[0] = 100
+    step_changes.iloc[0] = 100
+    assert s1_fix.identical(s1())
+
+
+def test_batch(s1_fix):
+    sf = Stairs()
+    with sf.batch() as batch:
+        batch.layer(1, 10, 2)
+        batch.layer([-4, 3], [5, 5], [-1.75, 2.5])
+        batch.layer(6, 7, -2.5)
+        batch.layer(7, 10, -2.5)
+        assert len(batch) == 5
+        assert sf.identical(Stairs())
+    assert sf.identical(s1_fix)
+
+
+def test_builder_matches_layer():
+    rng = np.random.default_rng(0)
+    starts = rng.integers(0, 100, 200).astype(float)
+    starts[::20] = np.nan
+    ends = starts + rng.integers(0, 10, 200)
+    values = rng.integers(1, 5, 200)
+    builder = StairsBuilder(Stairs(initial_value=2).layer(20, 60))
+    for start, end, value in zip(starts, ends, values):
+        builder.layer(start, end, value)
+    expected = Stairs(initial_value=2).layer(20, 60).layer(starts, ends, values)
+    assert builder.build().identical(expected)
+
+
+def test_builder_discarded_on_exception(s1_fix):
+    sf = s1()
+    with pytest.raises(ZeroDivisionError):
+        with sf.batch() as batch:
+            batch.layer(0, 1)
+            1 / 0
+    assert sf.identical(s1_fix)
+
+
+def test_streaming_matches_layer():
+    rng = np.random.default_rng(0)
+    starts = np.sort(rng.integers(0, 100, 200)).astype(float)
+    ends = starts + rng.integers(0, 10, 200)
+    ends[::15] = np.nan
+    values = rng.integers(-2, 5, 200)
+    sf = StreamingStairs(initial_value=2)
+    for start, end, value in zip(starts, ends, values):
+        sf.append(start, None if np.isnan(end) else end, value)
+    expected = Stairs(initial_value=2).layer(starts, ends, values)
+    assert sf.identical(expected)
+    assert sf.to_stairs().identical(expected)
+    assert sf.mean() == expected.mean()
+    assert sf.clip(20, 60).identical(expected.clip(20, 60))
+
+
+def test_streaming_to_stairs_unchanged_by_append():
+    sf = StreamingStairs().append(1, value=2).append(3, value=-2)
+    stairs = sf.to_stairs()
+    sf.append(3, 4, 5).append(6)
+    assert stairs.identical(Stairs().layer(1, 3, 2))
+    assert sf.identical(Stairs().layer(1, 3, 2).layer(3, 4, 5).layer(6, None))
+
+
+def test_streaming_out_of_order():
+    sf = StreamingStairs().append(2, 3)
+    with pytest.raises(ValueError):
+        sf.append(1, 4)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"max_steps": 0}, {"max_steps": 3}, {"max_age": 0}, {"max_age": 5.5}],
+)
+def test_streaming_retention(kwargs):
+    rng = np.random.default_rng(0)
+    starts = np.sort(rng.integers(0, 100, 200)).astype(float)
+    ends = starts + rng.integers(0, 10, 200)
+    values = rng.integers(-2, 5, 200)
+    sf = StreamingStairs(initial_value=2, **kwargs)
+    for start, end, value in zip(starts, ends, values):
+        sf.append(start, end, value)
+    expected = Stairs(initial_value=2).layer(starts, ends, values)
+    first = sf.step_points[0]
+    assert sf.initial_value == expected.limit(first, side="left")
+    assert sf.clip(first, None).identical(expected.clip(first, None))
+    if "max_age" in kwargs:
+        assert first >= starts[-1] - kwargs["max_age"]
+    else:
+        assert sf.number_of_steps <= kwargs["max_steps"] + len(ends[ends > starts[-1]])
+
+
+def test_streaming_append_only():
+    with pytest.raises(TypeError):
+        StreamingStairs().append(1, 2).layer(3, 4)
+
+
+@pytest.mark.parametrize("size", [1000, 100000])
+def test_layer_sums_match_groupby(size):
+    # step changes at shared step points must be summed exactly as pandas would
+    rng = np.random.default_rng(0)
+    starts = rng.integers(0, size // 10, size).astype(float)
+    ends = starts + rng.integers(1, 5, size)
+    values = rng.normal(size=size) * 10.0 ** rng.integers(-5, 5, size)
+    deltas = pd.concat(
+        [pd.Series(values, index=starts), pd.Series(-values, index=ends)]
+    )
+    expected = deltas.groupby(level=0).sum()
+    expected = expected[expected != 0]
+    result = Stairs().layer(starts, ends, values).step_changes
+    pd.testing.assert_series_equal(
+        result, expected, check_names=False, check_index_type=False, check_exact=True
+    )
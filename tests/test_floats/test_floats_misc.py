@@ -1,3 +1,5 @@
+import pickle
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -85,6 +87,71 @@ def test_deepcopy(init_value):
     assert not int_seq_copy.identical(int_seq)
 
 
+def test_copy_shares_data_until_layered(s1_fix):
+    expected = s1().step_values
+    sf_copy = s1_fix.copy()
+    assert sf_copy._data is s1_fix._data
+    sf_copy.layer(2, 8, 3)
+    sf_copy.layer([None, 1], [4, 6], [1, -2])
+    pd.testing.assert_series_equal(s1_fix.step_values, expected)
+
+
+class _PickledState:
+    # pickles as an instance of cls with the given state, as pickled by earlier versions
+    def __init__(self, cls, state):
+        self.cls, self.state = cls, state
+
+    def __reduce__(self):
+        return object.__new__, (self.cls,), self.state
+
+
+def test_unpickle_dataframe_state(s1_fix):
+    # step changes and values were held in a dataframe, with stale columns flagged as invalid
+    frame = pd.DataFrame(
+        {"delta": s1_fix.step_changes.values * 0, "value": s1_fix.step_values.values},
+        index=s1_fix.step_points,
+    )
+    state = {
+        "_data": frame,
+        "_valid_deltas": False,
+        "_valid_values": True,
+        "_masked": False,
+        "_closed": "left",
+        "initial_value": 0.0,
+        "_integral_and_mean": (0.0, 0.0),
+    }
+    result = pickle.loads(pickle.dumps(_PickledState(Stairs, state)))
+    assert result.identical(s1_fix)
+    assert result.integral() == s1_fix.integral()
+    assert pickle.loads(pickle.dumps(result)).identical(s1_fix)
+
+
+def test_binary_operation_leaves_operands_unchanged(s1_fix, s2_fix):
+    deltas_1, deltas_2 = s1_fix._data.delta, s2_fix._data.delta
+    s1_fix + s2_fix
+    s1_fix * s2_fix
+    s1_fix < s2_fix
+    # derived values may be cached, but the step changes are neither copied nor modified
+    assert s1_fix._data.delta is deltas_1
+    assert s2_fix._data.delta is deltas_2
+    assert s1_fix.identical(s1())
+    assert s2_fix.identical(s2())
+
+
+@pytest.mark.parametrize("vector", [True, False])
+def test_layer_from_values_with_infinite_start(vector):
+    # deltas must be derived from values before the initial value is changed
+    sf = Stairs.from_values(0, pd.Series([1, 0], index=[1, 2]))
+    sf_copy = sf.copy()
+    if vector:
+        sf.layer([None], [3], [5])
+    else:
+        sf.layer(None, 3, 5)
+    assert sf.initial_value == 5
+    assert list(sf.step_values) == [6, 5, 0]
+    assert list(sf_copy.step_values) == [1, 0]
+
+
 @pytest.mark.parametrize(
     "closed",
     ["left", "right"],
@@ -124,6 +191,69 @@ def test_s1_rolling_mean(s1_fix, kwargs, expected_index, expected_vals):
     assert list(rm.index) == expected_index
 
 
+def test_rolling_mean_masked():
+    sf = Stairs().layer(1, 3, 2).layer(2, 5, 1).mask((2, 2.5))
+    rm = sf.rolling_mean(window=(-1, 1))
+    assert list(rm.index) == [0, 1, 1.5, 2, 3, 3.5, 4, 6]
+    np.testing.assert_allclose(
+        rm.values, [0, 1, 4 / 3, 7 / 3, 5 / 3, 1.5, 1, 0], rtol=1e-12
+    )
+
+
+def test_s1_rolling_integral(s1_fix):
+    ri = s1_fix.rolling_integral(window=(-1, 1))
+    assert list(ri.index) == [-5, -3, 0, 2, 4, 5, 6, 7, 9, 11]
+    np.testing.assert_allclose(
+        ri.values, [0, -3.5, -3.5, 0.5, 5.5, 4.75, 1.5, -1, -1, 0], rtol=1e-12
+    )
+
+
+def test_s1_rolling_std(s1_fix):
+    rs = s1_fix.rolling_std(window=(-1, 1), where=(0, 8))
+    assert list(rs.index) == [1, 2, 4, 5, 6, 7]
+    np.testing.assert_allclose(rs.values, [1, 0, 0, 0.375, 1.25, 0], atol=1e-12)
+
+
+def test_rolling_std_large_offset():
+    values = pd.Series(np.random.default_rng(0).random(100) / 2, index=range(100))
+    sf = Stairs.from_values(initial_value=0, values=values)
+    expected = sf.rolling_std(window=(-1, 1), where=(1, 98))
+    result = (sf + 1e7).rolling_std(window=(-1, 1), where=(1, 98))
+    np.testing.assert_allclose(result.values, expected.values, atol=1e-8)
+
+
+def test_s1_rolling_max(s1_fix):
+    rm = s1_fix.rolling_max(window=(-1, 1))
+    assert rm.initial_value == 0
+    assert rm.step_values.to_dict() == {
+        -3: -1.75,
+        0: 0.25,
+        2: 2.75,
+        6: 2.0,
+        7: -0.5,
+        9: 0.0,
+    }
+
+
+def test_s1_rolling_min(s1_fix):
+    rm = s1_fix.rolling_min(window=(-2, 0), where=(0, 8))
+    assert np.isnan(rm.initial_value)
+    assert rm.step_values.iloc[:-1].to_dict() == {2: -1.75, 3: 0.25, 5: 2.0, 6: -0.5}
+    assert rm.step_values.index[-1] == 8 and np.isnan(rm.step_values.iloc[-1])
+
+
+def test_rolling_max_matches_clip():
+    sf = Stairs().layer(0, 2, 0.5).layer(1, 3, -1).layer(2.5, 4, 2)
+    rm = sf.rolling_max(window=(-0.5, 1))
+    for x in np.arange(-1.05, 4.5, 0.25):
+        assert rm(x) == sf.clip(x - 0.5, x + 1).max()
+
+
+def test_rolling_extremes_invalid_window(s1_fix):
+    with pytest.raises(ValueError):
+        s1_fix.rolling_max(window=(1, -1))
+
+
 @pytest.mark.parametrize(
     "kwargs",
     [
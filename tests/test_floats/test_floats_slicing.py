@@ -308,3 +308,32 @@ def test_slicing_resample_mean(s1_fix):
         check_names=False,
         check_index_type=False,
     )
+
+
+@pytest.mark.parametrize("closed", ["left", "neither"])
+def test_slicing_min_max_many_steps(closed):
+    rng = np.random.default_rng(0)
+    stairs = Stairs.from_values(
+        initial_value=0,
+        values=pd.Series(rng.random(1000), index=np.arange(1000)),
+    )
+    stairs = stairs.mask((200, 300))
+    slicer = stairs.slice(pd.interval_range(-50, 1050, freq=25, closed=closed))
+    pd.testing.assert_series_equal(slicer.max(), slicer.apply(Stairs.max))
+    pd.testing.assert_series_equal(slicer.min(), slicer.apply(Stairs.min))
+
+
+@pytest.mark.parametrize("func", ["mean", "integral"])
+def test_slicing_masked(func):
+    stairs = s1().mask((2, 4)).mask((6.5, 7))
+    slicer = stairs.slice(pd.interval_range(-5, 11, freq=1.5))
+    pd.testing.assert_series_equal(
+        getattr(slicer, func)(),
+        slicer.apply(getattr(Stairs, func)),
+    )
+
+
+def test_slicing_agg_without_slices(s1_fix):
+    slicer = s1_fix.slice(range(-4, 11, 2))
+    slicer.agg(["min", "max", "mean", "integral"])
+    assert slicer._slices is None
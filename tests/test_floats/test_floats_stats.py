@@ -1,4 +1,5 @@
 import numpy as np
+import pandas as pd
 import pytest
 
 from staircase import Stairs
@@ -152,6 +153,27 @@ def test_s2_var(bounds, expected):
     assert np.isclose(s2().agg("var", *bounds), expected, atol=0.0001)
 
 
+def test_var_nan():
+    assert Stairs(initial_value=0).layer(None, 0).var() is np.nan
+
+
+def test_var_masked():
+    sf = Stairs().layer(1, 3, 2).layer(2, 5, 1).mask((2, 2.5))
+    assert np.isclose(sf.var(), 1.3 / 2.45)
+
+
+def test_var_after_layer():
+    sf = Stairs().layer(1, 3, 2)
+    assert sf.var() == 0
+    sf.layer(2, 5, 1)
+    assert sf.var() == 0.6875
+
+
+def test_var_large_offset():
+    sf = Stairs().layer(0, 2, 1e9).layer(1, 2, 1)
+    assert sf.var() == 0.25
+
+
 # np.std(st1(np.linspace(-4,10, 10000000))) = 1.5816428940780978
 # np.std(st1(np.linspace(-5,10, 10000000))) = 1.528797568034358
 # np.std(st1(np.linspace(1,12, 10000000))) = 1.242331869829206
@@ -288,6 +310,18 @@ def test_crosscorr(kwargs, expected):
     assert np.isclose(s1().corr(s2(), **kwargs), expected, atol=0.00001)
 
 
+def test_corr_cov_default_domain():
+    # the domain of both step functions, and their product, is bounded by the step points of either
+    a = Stairs().layer(1, 3, 2).layer(2, 6, 1)
+    b = Stairs().layer(4, 9, 3).layer(0, 2, -1)
+    assert a.corr(b) == pytest.approx(a.corr(b, where=(0, 9)))
+    assert a.cov(b) == pytest.approx(a.cov(b, where=(0, 9)))
+    assert -1 <= a.corr(b) <= 1
+    assert a.cov(a) == pytest.approx(a.var())
+    assert a.cov(Stairs(initial_value=2)) == pytest.approx(0)
+    assert np.isnan(a.cov(b, where=(20, None)))
+
+
 @pytest.mark.parametrize(
     "closed, kwargs, expected_val",
     [
@@ -382,3 +416,102 @@ def test_s1_max(closed, kwargs, expected_val):
 )
 def test_s1_values_in_range(closed, kwargs, expected_val):
     assert np.array_equal(s1(closed=closed).values_in_range(**kwargs), expected_val)
+
+
+@pytest.mark.parametrize(
+    "name",
+    ["integral", "mean", "max", ["integral", "mean"]],
+)
+def test_s1_window_agg(name):
+    lower = [-5, 0, 2.5, None, 3, None, 12]
+    upper = [11, 4, 3, 4, None, None, 15]
+    expected = [
+        s1().agg(name, (lower_bound, upper_bound))
+        for lower_bound, upper_bound in zip(lower, upper)
+    ]
+    result = s1().window_agg(name, lower, upper)
+    if isinstance(name, list):
+        expected = pd.DataFrame(expected).reset_index(drop=True)
+        pd.testing.assert_frame_equal(result, expected)
+    else:
+        np.testing.assert_allclose(result, expected)
+
+
+def test_window_agg_with_mask():
+    stairs = s1().mask((2, 4))
+    np.testing.assert_allclose(
+        stairs.window_agg("integral", [0, 3, 4.5], [5, 6, 8]),
+        [1.25, 4.75, 2.375],
+    )
+
+
+def test_window_agg_after_layer(s1_fix):
+    assert s1_fix.agg("integral", (0, 4)) == 1.5
+    s1_fix.layer(1, 2, 2)
+    assert s1_fix.agg("integral", (0, 4)) == 3.5
+
+
+@pytest.mark.parametrize("closed", ["left", "right", "both", "neither"])
+def test_min_max_many_steps(closed):
+    # enough step points for ranges to span the blocks of the range index
+    rng = np.random.default_rng(0)
+    stairs = Stairs.from_values(
+        initial_value=0,
+        values=pd.Series(rng.integers(-100, 100, 2000), index=np.arange(2000)),
+    )
+    for lower, upper in [(-1, 10), (5, 1500), (64, 128), (130, 2100), (None, 700)]:
+        values = stairs.values_in_range((lower, upper), closed)
+        assert stairs.agg("min", (lower, upper), closed) == values.min()
+        assert stairs.agg("max", (lower, upper), closed) == values.max()
+
+
+def test_min_max_undefined_range(s1_fix):
+    stairs = s1_fix.mask((2, 4))
+    assert np.isnan(stairs.agg("min", (2.5, 3.5)))
+    assert np.isnan(stairs.agg("max", (2.5, 3.5)))
+
+
+@pytest.mark.parametrize(
+    "start, end, value",
+    [
+        (0, 1, 3),
+        (-2, 4, -1),
+        (-4, 10, 1.5),  # spans the domain
+        (-4, 1, 1.75),  # cancels the first step change
+        (2.5, 3.5, -0.25),
+    ],
+)
+def test_stats_after_layer(start, end, value):
+    sf = s1()
+    sf.mean(), sf.min(), sf.max(), sf.percentile(50)
+    sf.layer(start, end, value)
+    fresh = sf.copy()
+    assert np.isclose(sf.integral(), fresh.integral())
+    assert np.isclose(sf.mean(), fresh.mean())
+    assert sf.min() == fresh.min()
+    assert sf.max() == fresh.max()
+    assert sf.percentile(50) == fresh.percentile(50)
+
+
+def test_integral_after_many_layers():
+    rng = np.random.default_rng(0)
+    sf = Stairs()
+    for _ in range(200):
+        start = rng.uniform(0, 100)
+        sf.layer(start, start + rng.uniform(0, 10), rng.normal())
+        integral, mean = sf.integral(), sf.mean()
+    sf._clear_cache()
+    assert sf.integral() == integral
+    assert sf.mean() == mean
+
+
+@pytest.mark.parametrize("value", [2, 1.5])
+def test_stats_after_layer_integer_domain(value):
+    sf = Stairs().layer([0, 2, 5], [4, 6, 9], [1, 2, -1])
+    sf.integral(), sf.min(), sf.max(), sf.percentile(50)
+    sf.layer(3, 7, value)
+    assert sf._min_and_max is not None
+    fresh = sf.copy()
+    assert sf.integral() == fresh.integral()
+    assert (sf.min(), sf.max()) == (fresh.min(), fresh.max())
+    assert sf.percentile.identical(fresh.percentile)
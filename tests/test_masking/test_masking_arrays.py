@@ -200,3 +200,66 @@ def test_sample():
         check_names=False,
         check_index_type=False,
     )
+
+
+@pytest.mark.parametrize("func_str", ["corr", "cov"])
+def test_StairsFrame_corr_cov_masked(func_str):
+    s1mask = s1().mask((2, 4))
+    s2mask = s2().mask((7, 9))
+    arr = sc.StairsArray([s1mask, s2mask, s1mask + s2mask, s2()])
+    np.testing.assert_allclose(
+        getattr(arr.to_frame(), func_str)((-5, 10)).values,
+        getattr(arr, func_str)((-5, 10)),
+    )
+
+
+@pytest.mark.parametrize("func_str", ["sum", "mean"])
+def test_sum_mean_matches_agg_masked(func_str):
+    s1mask = s1().mask((2, 4))
+    s2mask = s2().mask((3, 9))
+    arr = sc.StairsArray([s1mask, s2mask, s1(), s2().mask((None, -1))])
+    result = getattr(arr, func_str)()
+    expected = arr.agg(getattr(np, func_str))
+    assert result.identical(expected)
+
+
+@pytest.mark.parametrize(
+    "func_str", ["max", "min", "median", "logical_or", "logical_and"]
+)
+def test_reductions_match_frame_masked(func_str):
+    arr = sc.StairsArray(
+        [s1().mask((2, 4)), s2().mask((7, 9)), s1()]
+        + [sc.Stairs().layer(i, i + 2).mask((i + 1, i + 3)) for i in range(-5, 15)]
+    )
+    result = getattr(arr, func_str)()
+    expected = getattr(arr.to_frame(), func_str)()
+    assert result.identical(expected)
+
+
+def test_StairsArray_element_stats_masked():
+    data = [s1().mask((2, 4)), s2().mask((7, 9)), s1().mask((None, 3)), None]
+    arr = sc.StairsArray(data)
+    for method, func in [
+        ("integrals", Stairs.integral),
+        ("means", Stairs.mean),
+        ("maxes", Stairs.max),
+        ("mins", Stairs.min),
+    ]:
+        np.testing.assert_allclose(
+            getattr(arr, method)(), [func(s) for s in data[:-1]] + [np.nan]
+        )
+    np.testing.assert_allclose(
+        arr.percentiles([20, 60]),
+        [s.percentile([20, 60]) for s in data[:-1]] + [[np.nan, np.nan]],
+    )
+
+
+@pytest.mark.parametrize("func_str", ["corr", "cov"])
+def test_corr_cov_masked(func_str):
+    data = [s1().mask((2, 4)), s2().mask((7, 9)), s1().mask((-5, 3)), s2()]
+    result = getattr(sc.StairsArray(data), func_str)((-5, 12))
+    for i, x in enumerate(data):
+        for j, y in enumerate(data):
+            if func_str == "cov" or i != j:
+                expected = getattr(Stairs, func_str)(x, y, where=(-5, 12))
+                assert result[i, j] == pytest.approx(expected, nan_ok=True)
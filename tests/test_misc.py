@@ -1,3 +1,7 @@
+import os
+import subprocess
+import sys
+
 import pandas as pd
 import pytest
 
@@ -55,3 +59,47 @@ def test_accessor_non_Stairs_dtype():
 def test_accessor_inspection():
     # GH158
     dir(pd.Series([1]))
+
+
+def _run_in_new_interpreter(code, *options):
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.path.dirname(os.path.dirname(os.path.abspath(sc.__file__))),
+    }
+    subprocess.run([sys.executable, *options, "-c", code], env=env, check=True)
+
+
+def test_import_does_not_load_matplotlib():
+    # matplotlib is imported when plotting, keeping "import staircase" cheap
+    _run_in_new_interpreter(
+        "import sys, staircase; assert 'matplotlib' not in sys.modules"
+    )
+
+
+def test_docstrings_skipped_when_optimized():
+    _run_in_new_interpreter(
+        "import staircase; assert staircase.Stairs.layer.__doc__ is None", "-OO"
+    )
+    _run_in_new_interpreter(
+        "from staircase.util._decorators import Appender; "
+        "assert Appender('addendum', indents=1).addendum is None",
+        "-OO",
+    )
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "    a\n      b\n\n    c",
+        "a\n    b",
+        "  \n    a\n   \n    b\n",
+        "\ta\n\t  b",
+    ],
+)
+def test_dedent(text):
+    from textwrap import dedent
+
+    from staircase.util._decorators import _dedent
+
+    assert _dedent(text) == dedent(text)